@@ -0,0 +1,99 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark fetching query results as Arrow tables, with an in-memory DuckDB database.
+
+Compares building a `SupersetResultSet` from the DB-API rows returned by
+`fetch_data` with loading the Arrow table returned by `fetch_arrow`, on a wide
+result mixing integers, floats, strings and timestamps, and checks that both
+produce the same values:
+
+    python scripts/benchmark_arrow_fetch.py --rows 1000000 --columns 20
+"""
+
+import time
+from typing import Any, Callable
+
+import click
+import pandas as pd
+from sqlalchemy import create_engine
+
+from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+from superset.result_set import SupersetResultSet
+
+
+def make_query(rows: int, columns: int) -> str:
+    expressions = [
+        "range",
+        "random()",
+        "'value_' || (range % 1000)",
+        "TIMESTAMP '2020-01-01' + to_seconds(range)",
+    ]
+    select = [
+        f"{expressions[col % len(expressions)]} AS col_{col}" for col in range(columns)
+    ]
+    return f"SELECT {', '.join(select)} FROM range({rows})"  # noqa: S608
+
+
+def timed(func: Callable[[], Any]) -> tuple[Any, float]:
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def fetch(query: str, arrow: bool) -> SupersetResultSet:
+    engine = create_engine("duckdb:///:memory:")
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        # random() is seeded so that both runs return the same values
+        cursor.execute("SELECT setseed(0.42)")
+        cursor.execute(query)
+        if arrow:
+            table = DuckDBEngineSpec.fetch_arrow(cursor)
+            return SupersetResultSet.from_arrow(
+                table,
+                cursor.description,
+                DuckDBEngineSpec,
+            )
+        data = DuckDBEngineSpec.fetch_data(cursor)
+        return SupersetResultSet(data, cursor.description, DuckDBEngineSpec)
+    finally:
+        connection.close()
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows of the result.")
+@click.option("--columns", default=20, help="Number of columns of the result.")
+def main(rows: int, columns: int) -> None:
+    query = make_query(rows, columns)
+
+    reference, reference_time = timed(lambda: fetch(query, arrow=False))
+    result_set, result_set_time = timed(lambda: fetch(query, arrow=True))
+
+    pd.testing.assert_frame_equal(
+        result_set.to_pandas_df(),
+        reference.to_pandas_df(),
+        check_dtype=False,
+    )
+
+    print(f"DB-API rows: {reference_time:.3f}s")
+    print(f"Arrow:       {result_set_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
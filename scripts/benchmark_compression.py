@@ -0,0 +1,127 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the compression codecs of the results backend and the chart data cache.
+
+Measures the compression and decompression throughput, and the compression ratio, of
+each codec on the payloads stored for a result set mixing integers, floats, strings
+and timestamps: the SQL Lab payload serialized with MessagePack and Arrow, the one
+serialized as JSON, and the Arrow IPC stream of the chart data cache:
+
+    python scripts/benchmark_compression.py --rows 1000000
+"""
+
+import time
+from functools import partial
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pyarrow as pa
+
+from superset.app import create_app
+from superset.common.utils.cache_serialization import dumps_df
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.result_set import SupersetResultSet
+from superset.utils.compression import compress, decompress
+
+CODECS: list[tuple[str, dict[str, Any]]] = [
+    ("zlib", {}),
+    ("zlib", {"level": 1}),
+    ("zstd", {"level": 1}),
+    ("zstd", {"level": 3}),
+    ("zstd", {"level": 3, "threads": -1}),
+    ("zstd", {"level": 9, "threads": -1}),
+    ("lz4", {}),
+]
+
+
+def make_result_set(rows: int) -> SupersetResultSet:
+    rng = np.random.default_rng(42)
+    values = np.arange(rows)
+    table = pa.table(
+        {
+            "id": values,
+            "amount": rng.normal(100, 20, rows).round(2),
+            "country": pa.array(rng.choice(["US", "FR", "BR", "IN", "JP"], rows)),
+            "name": pa.array(values % 10_000).cast(pa.string()),
+            "ts": pa.array(values * 1_000_000, pa.timestamp("us")),
+        }
+    )
+    # the columns are described from the table when the cursor doesn't
+    return SupersetResultSet.from_arrow(table, [], BaseEngineSpec)
+
+
+def make_payloads(result_set: SupersetResultSet) -> dict[str, bytes]:
+    # pylint: disable=import-outside-toplevel
+    from superset.sql_lab import _serialize_and_expand_data, _serialize_payload
+
+    payloads: dict[str, bytes] = {}
+    for name, use_msgpack in (("sqllab msgpack", True), ("sqllab json", False)):
+        data, selected_columns, columns, _ = _serialize_and_expand_data(
+            result_set, BaseEngineSpec, use_msgpack
+        )
+        payload = _serialize_payload(
+            {"data": data, "columns": columns, "selected_columns": selected_columns},
+            use_msgpack,
+        )
+        payloads[name] = (
+            payload.encode("utf-8") if isinstance(payload, str) else payload
+        )
+    payloads["chart cache arrow"] = dumps_df(result_set.to_pandas_df())
+    return payloads
+
+
+def timed(func: Callable[[], Any], repeat: int) -> tuple[Any, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows of the result set.")
+@click.option("--repeat", default=3, help="Number of runs, the best one is kept.")
+def main(rows: int, repeat: int) -> None:
+    with create_app().app_context():
+        payloads = make_payloads(make_result_set(rows))
+
+    for name, payload in payloads.items():
+        size = len(payload) / 1024 / 1024
+        print(f"\n{name} ({size:.1f} MB)")
+        print(f"{'codec':<36} {'compress':>12} {'decompress':>12} {'ratio':>7}")
+        for codec, options in CODECS:
+            blob, compress_time = timed(
+                partial(compress, payload, codec, **options), repeat
+            )
+            data, decompress_time = timed(
+                partial(decompress, blob, decode=False), repeat
+            )
+            assert data == payload
+            label = f"{codec} {options}" if options else codec
+            print(
+                f"{label:<36} "
+                f"{size / compress_time:>8.0f}MB/s "
+                f"{size / decompress_time:>8.0f}MB/s "
+                f"{len(payload) / len(blob):>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
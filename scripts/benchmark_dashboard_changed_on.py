@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark computing the changed_on fingerprints of dashboards, used as their ETags.
+
+Seeds dashboards with many charts and datasets in the metadata database, in a
+transaction rolled back at the end, and measures the time it takes to compute when
+a dashboard and its charts, or its datasets, last changed: by walking the charts and
+datasets of the dashboard, the way it used to be done, and with the aggregate queries
+of `DashboardDAO`. The session is expired before each run, like in a new request:
+
+    python scripts/benchmark_dashboard_changed_on.py --charts 80 --datasets 30
+"""
+
+import statistics
+import time
+from datetime import datetime
+from typing import Callable
+
+import click
+
+from superset.app import create_app
+
+
+@click.command()
+@click.option("--dashboards", default=10, help="Number of dashboards seeded.")
+@click.option("--charts", default=80, help="Number of charts per dashboard.")
+@click.option("--datasets", default=30, help="Number of datasets per dashboard.")
+@click.option("--repeat", default=5, help="Number of times each fingerprint is run.")
+def main(dashboards: int, charts: int, datasets: int, repeat: int) -> None:
+    with create_app().app_context():
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.connectors.sqla.models import SqlaTable
+        from superset.daos.dashboard import DashboardDAO
+        from superset.models.core import Database
+        from superset.models.dashboard import Dashboard
+        from superset.models.slice import Slice
+
+        def walk_slices(dashboard: Dashboard) -> datetime:
+            return max(
+                [dashboard.changed_on] + [slc.changed_on for slc in dashboard.slices]
+            ).replace(microsecond=0)
+
+        def walk_datasets(dashboard: Dashboard) -> datetime:
+            return max(
+                [dashboard.changed_on]
+                + [datasource.changed_on for datasource in dashboard.datasources]
+            ).replace(microsecond=0)
+
+        def measure(
+            fingerprint: Callable[[Dashboard], datetime],
+            seeded: list[Dashboard],
+        ) -> float:
+            timings = []
+            for _ in range(repeat):
+                for dashboard in seeded:
+                    db.session.expire_all()
+                    start = time.perf_counter()
+                    fingerprint(dashboard)
+                    timings.append(time.perf_counter() - start)
+            return statistics.median(timings)
+
+        try:
+            database = Database(
+                database_name="benchmark_dashboard_changed_on",
+                sqlalchemy_uri="sqlite://",
+            )
+            seeded = []
+            for i in range(dashboards):
+                tables = [
+                    SqlaTable(
+                        table_name=f"benchmark_{i}_{j}",
+                        database=database,
+                    )
+                    for j in range(datasets)
+                ]
+                db.session.add_all(tables)
+                db.session.flush()
+                slices = [
+                    Slice(
+                        slice_name=f"benchmark_{i}_{j}",
+                        datasource_type="table",
+                        datasource_id=tables[j % datasets].id,
+                        viz_type="table",
+                        params="{}",
+                    )
+                    for j in range(charts)
+                ]
+                dashboard = Dashboard(
+                    dashboard_title=f"benchmark_{i}",
+                    slices=slices,
+                )
+                db.session.add(dashboard)
+                seeded.append(dashboard)
+            db.session.flush()
+
+            print(f"{'fingerprint':<11} {'walking the ORM':>16} {'aggregate':>12}")
+            for name, walk, aggregate in (
+                (
+                    "charts",
+                    walk_slices,
+                    DashboardDAO.get_dashboard_and_slices_changed_on,
+                ),
+                (
+                    "datasets",
+                    walk_datasets,
+                    DashboardDAO.get_dashboard_and_datasets_changed_on,
+                ),
+            ):
+                for dashboard in seeded:
+                    assert walk(dashboard) == aggregate(dashboard)
+                print(
+                    f"{name:<11} "
+                    f"{measure(walk, seeded) * 1000:>14.2f}ms "
+                    f"{measure(aggregate, seeded) * 1000:>10.2f}ms"
+                )
+        finally:
+            db.session.rollback()
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,119 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compare the formats of the chart data cache.
+
+Measures the size, encode time and decode time of a cache value holding a wide and
+a long DataFrame, when pickled (the default format) and when stored as an Arrow IPC
+stream with and without compression:
+
+    python scripts/benchmark_data_cache_serialization.py --rows 1000000
+"""
+
+import pickle
+import time
+from functools import partial
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.common.utils.cache_serialization import dumps_df, loads_df
+
+
+def make_long_df(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "__timestamp": pd.date_range("2020-01-01", periods=rows, freq="min"),
+            "country": rng.choice(["US", "FR", "BR", "IN", "JP"], rows),
+            "city": [f"city_{i % 5000}" for i in range(rows)],
+            "count": rng.integers(0, 1000, rows),
+            "sum__revenue": rng.random(rows) * 1000,
+        }
+    )
+
+
+def make_wide_df(rows: int, columns: int = 200) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    data: dict[str, Any] = {
+        "__timestamp": pd.date_range("2020-01-01", periods=rows, freq="h")
+    }
+    for i in range(columns):
+        if i % 4 == 0:
+            data[f"dim_{i}"] = rng.choice(
+                np.array(["a", "b", "c", None], dtype=object), rows
+            )
+        else:
+            data[f"metric_{i}"] = rng.random(rows)
+    return pd.DataFrame(data)
+
+
+def measure(
+    encode: Callable[[], bytes],
+    decode: Callable[[bytes], Any],
+    repeat: int,
+) -> tuple[int, float, float]:
+    encode_time = decode_time = float("inf")
+    payload = b""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        payload = encode()
+        encode_time = min(encode_time, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        decode(payload)
+        decode_time = min(decode_time, time.perf_counter() - start)
+
+    return len(payload), encode_time, decode_time
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows of the long frame.")
+@click.option("--repeat", default=3, help="Number of runs, the best one is kept.")
+def main(rows: int, repeat: int) -> None:
+    frames = {
+        "long": make_long_df(rows),
+        "wide": make_wide_df(max(rows // 100, 1)),
+    }
+    formats: dict[str, tuple[Callable[..., bytes], Callable[[bytes], Any]]] = {
+        "pickle": (
+            lambda df: pickle.dumps({"df": df}, protocol=pickle.HIGHEST_PROTOCOL),
+            pickle.loads,
+        ),
+        "arrow": (lambda df: dumps_df(df), loads_df),
+        "arrow+lz4": (lambda df: dumps_df(df, "lz4"), loads_df),
+        "arrow+zstd": (lambda df: dumps_df(df, "zstd"), loads_df),
+    }
+
+    print(f"{'frame':<6} {'format':<11} {'size (MB)':>10} {'encode':>9} {'decode':>9}")
+    for frame_name, df in frames.items():
+        for format_name, (encode, decode) in formats.items():
+            size, encode_time, decode_time = measure(
+                partial(encode, df),
+                decode,
+                repeat,
+            )
+            print(
+                f"{frame_name:<6} {format_name:<11} {size / 1024**2:>10.1f} "
+                f"{encode_time:>8.3f}s {decode_time:>8.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark loading the first page of stored SQL Lab results.
+
+Stores results of growing sizes in an in-memory results backend, both as a single
+payload embedding the whole Arrow table and with the data split in row groups
+(`SQLLAB_RESULTS_COLUMNAR_STORAGE`), and measures the time it takes to load their
+first page, the way the results endpoint does:
+
+    python scripts/benchmark_sqllab_results.py --sizes 10000,100000,1000000
+"""
+
+import statistics
+import time
+from typing import Any
+
+import click
+import numpy as np
+import pyarrow as pa
+from flask_caching.backends import SimpleCache
+
+from superset.app import create_app
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.extensions import results_backend_manager
+from superset.result_set import SupersetResultSet
+from superset.utils.core import zlib_compress, zlib_decompress
+
+
+def make_result_set(rows: int) -> SupersetResultSet:
+    values = np.arange(rows)
+    table = pa.table(
+        {
+            "id": values,
+            "value": np.random.default_rng(42).random(rows),
+            "name": pa.array(values % 1000).cast(pa.string()),
+            "ts": pa.array(values * 1_000_000, pa.timestamp("us")),
+        }
+    )
+    # the columns are described from the table when the cursor doesn't
+    return SupersetResultSet.from_arrow(table, [], BaseEngineSpec)
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    default="10000,100000,1000000",
+    help="Comma separated numbers of rows of the results.",
+)
+@click.option("--page-size", default=100, help="Number of rows of the first page.")
+@click.option("--row-group-size", default=10000, help="Number of rows per row group.")
+@click.option("--repeat", default=5, help="Number of times each page is loaded.")
+def main(sizes: str, page_size: int, row_group_size: int, repeat: int) -> None:
+    app = create_app()
+    results_backend = SimpleCache(threshold=100_000)  # type: ignore[no-untyped-call]
+    app.config["RESULTS_BACKEND"] = results_backend
+    app.config["RESULTS_BACKEND_USE_MSGPACK"] = True
+    results_backend_manager.init_app(app)
+
+    with app.app_context():
+        # pylint: disable=import-outside-toplevel
+        from superset.models.core import Database
+        from superset.models.sql_lab import Query
+        from superset.sql_lab import _serialize_and_expand_data, _serialize_payload
+        from superset.sqllab.result_storage import write_result_table
+        from superset.views.utils import _deserialize_results_payload
+
+        query = Query(
+            database=Database(database_name="benchmark", sqlalchemy_uri="sqlite://")
+        )
+
+        def store(key: str, result_set: SupersetResultSet, columnar: bool) -> None:
+            payload: dict[str, Any] = {
+                "status": "success",
+                "columns": result_set.columns,
+                "selected_columns": result_set.columns,
+                "expanded_columns": [],
+            }
+            if columnar:
+                payload["data"] = None
+                payload["storage"] = write_result_table(
+                    key, result_set.pa_table, row_group_size
+                )
+            else:
+                payload["data"] = _serialize_and_expand_data(
+                    result_set, BaseEngineSpec, use_msgpack=True
+                )[0]
+            results_backend.set(key, zlib_compress(_serialize_payload(payload, True)))
+
+        def first_page(key: str) -> float:
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                payload = zlib_decompress(results_backend.get(key), decode=False)
+                results = _deserialize_results_payload(
+                    payload, query, True, limit=page_size
+                )
+                timings.append(time.perf_counter() - start)
+                assert len(results["data"]) == min(page_size, size)
+            return statistics.median(timings)
+
+        print(f"{'rows':>10} {'single payload':>16} {'row groups':>12}")
+        for size in (int(size) for size in sizes.split(",")):
+            result_set = make_result_set(size)
+            store(f"single-{size}", result_set, columnar=False)
+            store(f"columnar-{size}", result_set, columnar=True)
+            print(
+                f"{size:>10} "
+                f"{first_page(f'single-{size}') * 1000:>14.1f}ms "
+                f"{first_page(f'columnar-{size}') * 1000:>10.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
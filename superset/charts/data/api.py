@@ -17,10 +17,19 @@
 from __future__ import annotations
 
 import contextlib
+import itertools
 import logging
+from collections.abc import Iterator
 from typing import Any, TYPE_CHECKING
 
-from flask import current_app as app, g, make_response, request, Response
+from flask import (
+    current_app as app,
+    g,
+    make_response,
+    request,
+    Response,
+    stream_with_context,
+)
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
 from marshmallow import ValidationError
@@ -39,16 +48,25 @@ from superset.commands.chart.exceptions import (
     ChartDataCacheLoadError,
     ChartDataQueryFailedError,
 )
-from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.chart_data import (
+    ChartDataJsonOrient,
+    ChartDataResultFormat,
+    ChartDataResultType,
+)
 from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.exceptions import DatasourceNotFound
-from superset.exceptions import QueryObjectValidationError
+from superset.exceptions import (
+    QueryObjectValidationError,
+    SupersetErrorException,
+    SupersetErrorsException,
+)
 from superset.extensions import event_logger
 from superset.models.sql_lab import Query
-from superset.utils import json
+from superset.utils import csv, json
 from superset.utils.core import (
     create_zip,
     DatasourceType,
+    error_msg_from_exception,
     get_user_id,
 )
 from superset.utils.decorators import logs_context
@@ -102,6 +120,14 @@ class ChartDataRestApi(ChartRestApi):
             description: Should the queries be forced to load from the source
             schema:
                 type: boolean
+          - in: query
+            name: orient
+            description: >-
+              The orientation of the JSON data, either a list of records (default) or
+              a list of values per column
+            schema:
+              type: string
+              enum: [records, columns]
           responses:
             200:
               description: Query result
@@ -410,6 +436,50 @@ class ChartDataRestApi(ChartRestApi):
 
         return self.response_400(message=f"Unsupported result_format: {result_format}")
 
+    def _send_streaming_csv_response(self, command: ChartDataCommand) -> Response:
+        """
+        Stream the CSV export of a chart while the rows are fetched from the database,
+        optionally compressed with gzip.
+        """
+        if not security_manager.can_access("can_csv", "Superset"):
+            return self.response_403()
+
+        chunks = command.stream()
+        try:
+            # run the query before sending the headers, so that a failing query still
+            # gets a regular error response
+            first_chunk = next(chunks)
+        except QueryObjectValidationError as ex:
+            return self.response_400(message=ex.message)
+        except (SupersetErrorException, SupersetErrorsException):
+            raise
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Streaming CSV export failed", exc_info=True)
+            return self.response_400(
+                message=_("Error: %(error)s", error=error_msg_from_exception(ex))
+            )
+
+        headers = generate_download_headers("csv")
+        compress = (
+            app.config["CSV_STREAMING_GZIP"] and "gzip" in request.accept_encodings
+        )
+        if compress:
+            headers["Content-Encoding"] = "gzip"
+
+        data = csv.encode_csv_chunks(
+            itertools.chain([first_chunk], chunks),
+            encoding=app.config["CSV_EXPORT"].get("encoding", "utf-8"),
+            compress=compress,
+        )
+
+        def stream() -> Iterator[bytes]:
+            # closing the response, e.g. when the client disconnects, closes the
+            # cursor the rows are fetched from
+            with contextlib.closing(chunks):
+                yield from data
+
+        return CsvResponse(stream_with_context(stream()), headers=headers)
+
     @event_logger.log_this
     def _get_data_response(
         self,
@@ -418,6 +488,9 @@ class ChartDataRestApi(ChartRestApi):
         form_data: dict[str, Any] | None = None,
         datasource: BaseDatasource | Query | None = None,
     ) -> Response:
+        if not force_cached and command.can_stream():
+            return self._send_streaming_csv_response(command)
+
         try:
             result = command.run(force_cached=force_cached)
         except ChartDataCacheLoadError as exc:
@@ -459,6 +532,21 @@ class ChartDataRestApi(ChartRestApi):
         """
 
         try:
-            return ChartDataQueryContextSchema().load(form_data)
+            query_context = ChartDataQueryContextSchema().load(form_data)
         except KeyError as ex:
             raise ValidationError("Request is incorrect") from ex
+
+        # post-processed results are transformed in Python, and need the records
+        if (
+            query_context.result_format == ChartDataResultFormat.JSON
+            and query_context.result_type != ChartDataResultType.POST_PROCESSED
+        ):
+            orient = request.args.get("orient", ChartDataJsonOrient.RECORDS)
+            try:
+                query_context.json_orient = ChartDataJsonOrient(orient)
+            except ValueError as ex:
+                raise ValidationError(
+                    {"orient": [f"Unsupported orientation: {orient}"]}
+                ) from ex
+
+        return query_context
@@ -1470,6 +1470,12 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    is_stale = fields.Boolean(
+        metadata={
+            "description": "Is the result served from an expired cache entry, while "
+            "it is being refreshed"
+        },
+    )
     query = fields.String(
         metadata={"description": "The executed query statement"},
         required=True,
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Generator
 from typing import Any
 
 from flask_babel import gettext as _
@@ -63,5 +64,15 @@ class ChartDataCommand(BaseCommand):
 
         return return_value
 
+    def can_stream(self) -> bool:
+        return self._query_context.can_stream_csv()
+
+    def stream(self) -> Generator[str, None, None]:
+        """
+        Yield the CSV export of the query context in chunks, as the rows are fetched
+        from the database.
+        """
+        return self._query_context.get_csv_stream()
+
     def validate(self) -> None:
         self._query_context.raise_for_access()
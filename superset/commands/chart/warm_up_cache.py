@@ -40,10 +40,12 @@ class ChartWarmUpCacheCommand(BaseCommand):
         chart_or_id: Union[int, Slice],
         dashboard_id: Optional[int],
         extra_filters: Optional[str],
+        query_context: Optional[dict[str, Any]] = None,
     ):
         self._chart_or_id = chart_or_id
         self._dashboard_id = dashboard_id
         self._extra_filters = extra_filters
+        self._query_context = query_context
 
     def run(self) -> dict[str, Any]:
         self.validate()
@@ -75,8 +77,13 @@ class ChartWarmUpCacheCommand(BaseCommand):
                 error = payload["errors"] or None
                 status = payload["status"]
             else:
-                # Non-legacy visualizations.
-                query_context = chart.get_query_context()
+                # Non-legacy visualizations, with the query context used by a viewer
+                # of the chart or the one stored when the chart was saved.
+                query_context = (
+                    chart.get_query_context_factory().create(**self._query_context)
+                    if self._query_context
+                    else chart.get_query_context()
+                )
 
                 if not query_context:
                     raise ChartInvalidError("Chart's query context does not exist")
@@ -27,8 +27,9 @@ from superset.commands.base import BaseCommand
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SerializationError, SupersetErrorException
 from superset.models.sql_lab import Query
+from superset.sqllab.result_storage import get_partial_results_key
 from superset.sqllab.utils import apply_display_max_row_configuration_if_require
-from superset.utils import core as utils
+from superset.utils.compression import decompress
 from superset.utils.dates import now_as_float
 from superset.views.utils import _deserialize_results_payload
 
@@ -38,6 +39,10 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _offset: int
+    _limit: int | None
+    _columns: list[str] | None
+    _chunk: int | None
     _blob: Any
     _query: Query
 
@@ -45,9 +50,17 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        columns: list[str] | None = None,
+        chunk: int | None = None,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._offset = offset
+        self._limit = limit
+        self._columns = columns
+        self._chunk = chunk
 
     def validate(self) -> None:
         if not results_backend:
@@ -60,7 +73,12 @@ class SqlExecutionResultsCommand(BaseCommand):
             )
 
         read_from_results_backend_start = now_as_float()
-        self._blob = results_backend.get(self._key)
+        # the chunks of partial results are stored while the query is running
+        self._blob = results_backend.get(
+            self._key
+            if self._chunk is None
+            else get_partial_results_key(self._key, self._chunk)
+        )
         app.config["STATS_LOGGER"].timing(
             "sqllab.query.results_backend_read",
             now_as_float() - read_from_results_backend_start,
@@ -100,12 +118,22 @@ class SqlExecutionResultsCommand(BaseCommand):
     ) -> dict[str, Any]:
         """Runs arbitrary sql and returns data as json"""
         self.validate()
-        payload = utils.zlib_decompress(
-            self._blob, decode=not results_backend_use_msgpack
-        )
+        payload = decompress(self._blob, decode=not results_backend_use_msgpack)
+
+        # rows past the display limit are never returned
+        limit = self._limit
+        if self._rows:
+            remaining = max(self._rows - self._offset, 0)
+            limit = remaining if limit is None else min(limit, remaining)
+
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                offset=self._offset,
+                limit=limit,
+                columns=self._columns,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
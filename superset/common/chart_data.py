@@ -31,6 +31,15 @@ class ChartDataResultFormat(StrEnum):
         return {cls.CSV} | {cls.XLSX}
 
 
+class ChartDataJsonOrient(StrEnum):
+    """
+    Chart data JSON response orientation
+    """
+
+    RECORDS = "records"
+    COLUMNS = "columns"
+
+
 class ChartDataResultType(StrEnum):
     """
     Chart data response type
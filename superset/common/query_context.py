@@ -17,17 +17,23 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Generator
 from typing import Any, ClassVar, TYPE_CHECKING
 
 import pandas as pd
 
-from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.chart_data import (
+    ChartDataJsonOrient,
+    ChartDataResultFormat,
+    ChartDataResultType,
+)
 from superset.common.query_context_processor import (
     CachedTimeOffset,
     QueryContextProcessor,
 )
 from superset.common.query_object import QueryObject
 from superset.models.slice import Slice
+from superset.utils import json
 from superset.utils.core import GenericDataType
 
 if TYPE_CHECKING:
@@ -55,6 +61,7 @@ class QueryContext:
     result_format: ChartDataResultFormat
     force: bool
     custom_cache_timeout: int | None
+    json_orient: ChartDataJsonOrient | None = None
 
     cache_values: dict[str, Any]
 
@@ -90,9 +97,15 @@ class QueryContext:
         self,
         df: pd.DataFrame,
         coltypes: list[GenericDataType],
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | json.RawJSON:
         return self._processor.get_data(df, coltypes)
 
+    def can_stream_csv(self) -> bool:
+        return self._processor.can_stream_csv()
+
+    def get_csv_stream(self) -> Generator[str, None, None]:
+        return self._processor.get_csv_stream()
+
     def get_payload(
         self,
         cache_query_context: bool | None = False,
@@ -112,6 +125,15 @@ class QueryContext:
             return self.datasource.database.cache_timeout
         return None
 
+    def get_stale_cache_timeout(self) -> int | None:
+        if (
+            stale_cache_timeout := getattr(self.datasource, "stale_cache_timeout", None)
+        ) is not None:
+            return stale_cache_timeout
+        if hasattr(self.datasource, "database"):
+            return self.datasource.database.stale_cache_timeout
+        return None
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         return self._processor.query_cache_key(query_obj, **kwargs)
 
@@ -19,20 +19,27 @@ from __future__ import annotations
 import copy
 import logging
 import re
+from collections.abc import Generator
+from contextlib import AbstractContextManager, closing, nullcontext
 from datetime import datetime
+from functools import partial
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
 import pandas as pd
 from flask import current_app
 from flask_babel import gettext as _
+from flask_caching.backends import NullCache
 from pandas import DateOffset
+from sqlalchemy import inspect
+from sqlalchemy.orm import RelationshipProperty
 
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
 from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.common.utils.single_flight import single_flight
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
@@ -50,8 +57,9 @@ from superset.extensions import cache_manager, feature_flag_manager, security_ma
 from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
 from superset.superset_typing import AdhocColumn, AdhocMetric
-from superset.utils import csv, excel
+from superset.utils import csv, excel, json
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import KeyedSemaphore, map_in_app_context
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -63,6 +71,7 @@ from superset.utils.core import (
     get_column_names_from_columns,
     get_column_names_from_metrics,
     get_metric_names,
+    get_user_id,
     get_x_axis_label,
     is_adhoc_column,
     is_adhoc_metric,
@@ -102,6 +111,9 @@ AGGREGATED_JOIN_GRAINS = {
 # Right suffix used for joining offset results
 R_SUFFIX = "__right_suffix"
 
+# Caps the number of chart data queries running in parallel against each database
+database_query_slots = KeyedSemaphore()
+
 
 class CachedTimeOffset(TypedDict):
     df: pd.DataFrame
@@ -109,6 +121,13 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+class TimeOffsetQuery(TypedDict):
+    offset: str
+    original_offset: str
+    query_object: QueryObject
+    cache_key: str | None
+
+
 class QueryContextProcessor:
     """
     The query context contains the query object and additional fields necessary
@@ -145,37 +164,30 @@ class QueryContextProcessor:
         )
 
         if query_obj and cache_key and not cache.is_loaded:
-            try:
-                if invalid_columns := [
-                    col
-                    for col in get_column_names_from_columns(query_obj.columns)
-                    + get_column_names_from_metrics(query_obj.metrics or [])
-                    if (
-                        col not in self._qc_datasource.column_names
-                        and col != DTTM_ALIAS
-                    )
-                ]:
-                    raise QueryObjectValidationError(
-                        _(
-                            "Columns missing in dataset: %(invalid_columns)s",
-                            invalid_columns=invalid_columns,
+            with self._single_flight(cache_key, force_query) as cached:
+                # an identical query may have run while this one was waiting
+                cache = cached or cache
+                if not cache.is_loaded:
+                    try:
+                        self.validate_query_columns(query_obj)
+                        query_result = self.get_query_result(query_obj)
+                        annotation_data = self.get_annotation_data(query_obj)
+                        cache.set_query_result(
+                            key=cache_key,
+                            query_result=query_result,
+                            annotation_data=annotation_data,
+                            force_query=force_query,
+                            timeout=self.get_cache_timeout(),
+                            datasource_uid=self._qc_datasource.uid,
+                            region=CacheRegion.DATA,
+                            stale_timeout=self.get_stale_cache_timeout(),
                         )
-                    )
+                    except QueryObjectValidationError as ex:
+                        cache.error_message = str(ex)
+                        cache.status = QueryStatus.FAILED
 
-                query_result = self.get_query_result(query_obj)
-                annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
-            except QueryObjectValidationError as ex:
-                cache.error_message = str(ex)
-                cache.status = QueryStatus.FAILED
+        if cache_key and cache.is_stale:
+            self._refresh_stale_cache(cache_key)
 
         # the N-dimensional DataFrame has converted into flat DataFrame
         # by `flatten operator`, "comma" in the column is escaped by `escape_separator`
@@ -235,6 +247,7 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": cache.is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -245,6 +258,63 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    def _single_flight(
+        self, cache_key: str, force_query: bool
+    ) -> AbstractContextManager[QueryCacheManager | None]:
+        """
+        Deduplicate the concurrent executions of the query of a cache key.
+
+        The context yields the cached result of the query once an identical query
+        running elsewhere is done, or None when the query has to be executed.
+        """
+        config = current_app.config
+        if (
+            not config["DATA_CACHE_SINGLE_FLIGHT"]
+            or force_query
+            or isinstance(cache_manager.data_cache.cache, NullCache)
+        ):
+            return nullcontext()
+
+        def load() -> QueryCacheManager | None:
+            cache = QueryCacheManager.get(key=cache_key, region=CacheRegion.DATA)
+            return cache if cache.is_loaded else None
+
+        return single_flight(
+            "chart_data",
+            cache_key,
+            load,
+            timeout=config["DATA_CACHE_SINGLE_FLIGHT_TIMEOUT"],
+            poll_interval=config["DATA_CACHE_SINGLE_FLIGHT_POLL_INTERVAL"],
+        )
+
+    def _refresh_stale_cache(self, cache_key: str) -> None:
+        """
+        Queue the refresh of the stale cached results of the query context on Celery.
+
+        The chart warm-up command refreshes all the queries of the context, as the
+        user who requested them. It's queued at most once per cache timeout for a
+        stale cache key, and only for saved charts.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.cache import refresh_chart_data_cache
+
+        query_context = self._query_context
+        if not query_context.slice_ or not cache_manager.data_cache.add(
+            f"refresh-{cache_key}", True, timeout=self.get_cache_timeout()
+        ):
+            return
+
+        logger.info("Refreshing stale chart data for cache key %s", cache_key)
+        refresh_chart_data_cache.delay(
+            query_context.slice_.id,
+            {
+                **query_context.cache_values,
+                "form_data": query_context.form_data,
+                "custom_cache_timeout": query_context.custom_cache_timeout,
+            },
+            get_user_id(),
+        )
+
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -273,11 +343,8 @@ class QueryContextProcessor:
         # support multiple queries from different data sources.
 
         query = ""
-        if isinstance(query_context.datasource, Query):
-            # todo(hugh): add logic to manage all sip68 models here
-            result = query_context.datasource.exc_query(query_object.to_dict())
-        else:
-            result = query_context.datasource.query(query_object.to_dict())
+        result = self.query_datasource(query_object.to_dict())
+        if not isinstance(query_context.datasource, Query):
             query = result.query + ";\n\n"
 
         df = result.df
@@ -309,6 +376,28 @@ class QueryContextProcessor:
         result.to_dttm = query_object.to_dttm
         return result
 
+    def query_datasource(self, query_obj: dict[str, Any]) -> QueryResult:
+        """
+        Runs a query against the datasource of the query context.
+
+        When queries are executed in parallel, the query first waits for a free slot
+        of the database, so that a single chart can't exhaust the engine pool.
+        """
+        database = getattr(self._qc_datasource, "database", None)
+        if self.get_query_parallelism() > 1 and database is not None:
+            with database_query_slots.acquire(
+                database.id,
+                current_app.config["CHART_DATA_MAX_CONCURRENT_QUERIES_PER_DATABASE"],
+            ):
+                return self._query_datasource(query_obj)
+        return self._query_datasource(query_obj)
+
+    def _query_datasource(self, query_obj: dict[str, Any]) -> QueryResult:
+        if isinstance(self._qc_datasource, Query):
+            # todo(hugh): add logic to manage all sip68 models here
+            return self._qc_datasource.exc_query(query_obj)
+        return self._qc_datasource.query(query_obj)
+
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
         # todo: should support "python_date_format" and "get_column" in each datasource
         def _get_timestamp_format(
@@ -404,13 +493,43 @@ class QueryContextProcessor:
         :param time_offset: The time offset used to calculate the new column.
         :param join_column_producer: A function to generate the join column.
         """
+        df[name] = self.get_offset_join_column(
+            df, time_grain, time_offset, join_column_producer
+        )
+
+    def get_offset_join_column(
+        self,
+        df: pd.DataFrame,
+        time_grain: str,
+        time_offset: str | None = None,
+        join_column_producer: Any = None,
+    ) -> pd.Series:
+        """
+        Returns the offset join column of the provided DataFrame.
+
+        The join column is derived from the first column of the DataFrame. It's
+        computed with vectorized operations for datetime columns aggregated by one of
+        the `AGGREGATED_JOIN_GRAINS`, and row by row otherwise.
+
+        :param df: pandas DataFrame for which the join column is computed.
+        :param time_grain: The time grain used to calculate the join column.
+        :param time_offset: The time offset used to calculate the join column.
+        :param join_column_producer: A function to generate the join column.
+        """
         if join_column_producer:
-            df[name] = df.apply(lambda row: join_column_producer(row, 0), axis=1)
-        else:
-            df[name] = df.apply(
-                lambda row: self.generate_join_column(row, 0, time_grain, time_offset),
-                axis=1,
+            return df.apply(lambda row: join_column_producer(row, 0), axis=1)
+
+        if (
+            join_column := self.generate_join_column_vectorized(
+                df.iloc[:, 0], time_grain, time_offset
             )
+        ) is not None:
+            return join_column
+
+        return df.apply(
+            lambda row: self.generate_join_column(row, 0, time_grain, time_offset),
+            axis=1,
+        )
 
     def is_valid_date(self, date_string: str) -> bool:
         try:
@@ -471,6 +590,7 @@ class QueryContextProcessor:
         query_context = self._query_context
         # ensure query_object is immutable
         query_object_clone = copy.copy(query_object)
+        time_offset_queries: list[TimeOffsetQuery] = []
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
@@ -648,7 +768,6 @@ class QueryContextProcessor:
                 )
             ]
 
-            # Continue with the rest of the method (caching, execution, etc.)
             cached_time_offset_key = (
                 offset if offset == original_offset else f"{offset}_{original_offset}"
             )
@@ -658,69 +777,59 @@ class QueryContextProcessor:
                 time_offset=cached_time_offset_key,
                 time_grain=time_grain,
             )
-            cache = QueryCacheManager.get(
-                cache_key, CacheRegion.DATA, query_context.force
+            time_offset_queries.append(
+                TimeOffsetQuery(
+                    offset=offset,
+                    original_offset=original_offset,
+                    # snapshot the clone, as it keeps being mutated by the next offsets
+                    query_object=copy.copy(query_object_clone),
+                    cache_key=cache_key,
+                )
             )
 
+        # look up all the offsets in the cache at once, and only run the missing ones
+        caches = QueryCacheManager.get_many(
+            [
+                time_offset_query["cache_key"]
+                for time_offset_query in time_offset_queries
+            ],
+            CacheRegion.DATA,
+            query_context.force,
+        )
+        missing_queries = [
+            time_offset_query
+            for time_offset_query, cache in zip(
+                time_offset_queries, caches, strict=False
+            )
+            if not cache.is_loaded
+        ]
+        parallelism = self.get_query_parallelism()
+        if parallelism > 1 and len(missing_queries) > 1:
+            self._preload_datasource()
+        results = iter(
+            map_in_app_context(
+                partial(
+                    self._run_time_offset_query,
+                    query_object=query_object,
+                    metric_names=metric_names,
+                    join_keys=join_keys,
+                ),
+                missing_queries,
+                max_workers=parallelism,
+                thread_name_prefix="chart-data-offset",
+            )
+        )
+
+        for time_offset_query, cache in zip(time_offset_queries, caches, strict=False):
             if cache.is_loaded:
-                offset_dfs[offset] = cache.df
+                offset_dfs[time_offset_query["offset"]] = cache.df
                 queries.append(cache.query)
-                cache_keys.append(cache_key)
-                continue
-
-            query_object_clone_dct = query_object_clone.to_dict()
-
-            # rename metrics: SUM(value) => SUM(value) 1 year ago
-            metrics_mapping = {
-                metric: TIME_COMPARISON.join([metric, original_offset])
-                for metric in metric_names
-            }
-
-            # When the original query has limit or offset we wont apply those
-            # to the subquery so we prevent data inconsistency due to missing records
-            # in the dataframes when performing the join
-            if query_object.row_limit or query_object.row_offset:
-                query_object_clone_dct["row_limit"] = current_app.config["ROW_LIMIT"]
-                query_object_clone_dct["row_offset"] = 0
-
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
-
-            queries.append(result.query)
-            cache_keys.append(None)
-
-            offset_metrics_df = result.df
-            if offset_metrics_df.empty:
-                offset_metrics_df = pd.DataFrame(
-                    {
-                        col: [np.NaN]
-                        for col in join_keys + list(metrics_mapping.values())
-                    }
-                )
+                cache_keys.append(time_offset_query["cache_key"])
             else:
-                # 1. normalize df, set dttm column
-                offset_metrics_df = self.normalize_df(
-                    offset_metrics_df, query_object_clone
-                )
-
-                # 2. rename extra query columns
-                offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
-
-            # cache df and query
-            value = {
-                "df": offset_metrics_df,
-                "query": result.query,
-            }
-            cache.set(
-                key=cache_key,
-                value=value,
-                timeout=self.get_cache_timeout(),
-                datasource_uid=query_context.datasource.uid,
-                region=CacheRegion.DATA,
-            )
-            offset_dfs[offset] = offset_metrics_df
+                offset_metrics_df, query = next(results)
+                offset_dfs[time_offset_query["offset"]] = offset_metrics_df
+                queries.append(query)
+                cache_keys.append(None)
 
         if offset_dfs:
             df = self.join_offset_dfs(
@@ -732,6 +841,66 @@ class QueryContextProcessor:
 
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    def _run_time_offset_query(
+        self,
+        time_offset_query: TimeOffsetQuery,
+        query_object: QueryObject,
+        metric_names: list[str],
+        join_keys: list[str],
+    ) -> tuple[pd.DataFrame, str]:
+        """
+        Run the query of a single time offset and cache its result.
+
+        :param time_offset_query: The time offset to run the query for
+        :param query_object: The original query object
+        :param metric_names: The metric names of the original query object
+        :param join_keys: The columns used to join the offset results
+        :returns: The offset DataFrame, with renamed metrics, and its query
+        """
+        query_object_clone = time_offset_query["query_object"]
+        query_object_clone_dct = query_object_clone.to_dict()
+
+        # rename metrics: SUM(value) => SUM(value) 1 year ago
+        metrics_mapping = {
+            metric: TIME_COMPARISON.join([metric, time_offset_query["original_offset"]])
+            for metric in metric_names
+        }
+
+        # When the original query has limit or offset we wont apply those
+        # to the subquery so we prevent data inconsistency due to missing records
+        # in the dataframes when performing the join
+        if query_object.row_limit or query_object.row_offset:
+            query_object_clone_dct["row_limit"] = current_app.config["ROW_LIMIT"]
+            query_object_clone_dct["row_offset"] = 0
+
+        result = self.query_datasource(query_object_clone_dct)
+
+        offset_metrics_df = result.df
+        if offset_metrics_df.empty:
+            offset_metrics_df = pd.DataFrame(
+                {col: [np.NaN] for col in join_keys + list(metrics_mapping.values())}
+            )
+        else:
+            # 1. normalize df, set dttm column
+            offset_metrics_df = self.normalize_df(offset_metrics_df, query_object_clone)
+
+            # 2. rename extra query columns
+            offset_metrics_df = offset_metrics_df.rename(columns=metrics_mapping)
+
+        # cache df and query
+        value = {
+            "df": offset_metrics_df,
+            "query": result.query,
+        }
+        QueryCacheManager.set(
+            key=time_offset_query["cache_key"],
+            value=value,
+            timeout=self.get_cache_timeout(),
+            datasource_uid=self._query_context.datasource.uid,
+            region=CacheRegion.DATA,
+        )
+        return offset_metrics_df, result.query
+
     def _get_temporal_column_for_filter(  # noqa: C901
         self, query_object: QueryObject, x_axis_label: str | None
     ) -> str | None:
@@ -909,12 +1078,25 @@ class QueryContextProcessor:
                 _("Time Grain must be specified when using Time Shift.")
             )
 
-        for offset, offset_df in offset_dfs.items():
-            is_date_range_offset = self.is_valid_date_range(
-                offset
-            ) and feature_flag_manager.is_feature_enabled(
-                "DATE_RANGE_TIMESHIFTS_ENABLED"
+        date_range_offsets = {
+            offset
+            for offset in offset_dfs
+            if self.is_valid_date_range(offset)
+            and feature_flag_manager.is_feature_enabled("DATE_RANGE_TIMESHIFTS_ENABLED")
+        }
+        if (
+            not date_range_offsets
+            and (
+                joined_df := self._join_offset_dfs_at_once(
+                    df, offset_dfs, time_grain, join_keys, join_column_producer
+                )
             )
+            is not None
+        ):
+            return joined_df
+
+        for offset, offset_df in offset_dfs.items():
+            is_date_range_offset = offset in date_range_offsets
 
             offset_df, actual_join_keys = self._determine_join_keys(
                 df,
@@ -933,6 +1115,92 @@ class QueryContextProcessor:
 
         return df
 
+    def _join_offset_dfs_at_once(  # pylint: disable=too-many-arguments
+        self,
+        df: pd.DataFrame,
+        offset_dfs: dict[str, pd.DataFrame],
+        time_grain: str | None,
+        join_keys: list[str],
+        join_column_producer: Any,
+    ) -> pd.DataFrame | None:
+        """
+        Join all the offset DataFrames with the main DataFrame in a single pass.
+
+        Each offset DataFrame is indexed by its join keys and aligned with the rows of
+        the main DataFrame, and the offset metrics are then concatenated at once,
+        instead of left joining every offset with the growing main DataFrame. The
+        result is the same as joining the offsets one at a time.
+
+        Returns None when the offsets can't be aligned that way, e.g. when the join
+        keys have duplicates or nulls.
+        """
+        if (
+            not join_keys
+            or not df.columns.is_unique
+            or df[join_keys].isna().to_numpy().any()
+        ):
+            return None
+
+        seen_columns = set(df.columns)
+        aligned_dfs: list[pd.DataFrame] = []
+        for offset, offset_df in offset_dfs.items():
+            if time_grain:
+                # the temporal key is replaced by a join column that is computed
+                # from the shifted main timestamps and the offset timestamps
+                column_name = OFFSET_JOIN_COLUMN_SUFFIX + offset
+                left_keys = pd.concat(
+                    [
+                        self.get_offset_join_column(
+                            df, time_grain, offset, join_column_producer
+                        ).rename(column_name),
+                        df[join_keys[1:]],
+                    ],
+                    axis=1,
+                )
+                right_df = offset_df.assign(
+                    **{
+                        column_name: self.get_offset_join_column(
+                            offset_df, time_grain, None, join_column_producer
+                        )
+                    }
+                )
+                actual_join_keys = [column_name, *join_keys[1:]]
+            else:
+                left_keys = df[join_keys]
+                right_df = offset_df
+                actual_join_keys = join_keys
+
+            if (
+                not set(actual_join_keys).issubset(right_df.columns)
+                or right_df[actual_join_keys].isna().to_numpy().any()
+            ):
+                return None
+            right_df = right_df.set_index(actual_join_keys)
+            if not right_df.index.is_unique:
+                return None
+
+            # columns clashing with existing ones would be suffixed and dropped
+            value_columns = [col for col in right_df.columns if col not in seen_columns]
+            seen_columns.update(value_columns)
+            if len(actual_join_keys) > 1:
+                index = pd.MultiIndex.from_frame(left_keys)
+                # pandas doesn't keep the order of the left rows when joining on a
+                # non unique multi-index, so leave those to the pairwise joins
+                if not index.is_unique:
+                    return None
+            else:
+                index = pd.Index(left_keys.iloc[:, 0])
+            aligned_dfs.append(
+                right_df[value_columns].reindex(index).set_axis(df.index, axis=0)
+            )
+
+        other_columns = [col for col in df.columns if col not in join_keys]
+        result_df = pd.concat(
+            [df[join_keys + other_columns], *aligned_dfs], axis=1
+        ).reset_index(drop=True)
+        suffixes = f"{OFFSET_JOIN_COLUMN_SUFFIX}|{R_SUFFIX}" if time_grain else R_SUFFIX
+        return result_df.drop(columns=list(result_df.filter(regex=suffixes)))
+
     @staticmethod
     def generate_join_column(
         row: pd.Series,
@@ -972,6 +1240,53 @@ class QueryContextProcessor:
 
         return str(value)
 
+    @staticmethod
+    def generate_join_column_vectorized(
+        series: pd.Series,
+        time_grain: str,
+        time_offset: str | None = None,
+    ) -> pd.Series | None:
+        """
+        Vectorized version of `generate_join_column` for a whole datetime column.
+
+        Returns None when the column can't be processed at once (not a datetime
+        column, null values, or a time grain that isn't aggregated), in which case
+        the join column has to be generated row by row.
+        """
+        if (
+            time_grain not in AGGREGATED_JOIN_GRAINS
+            or series.empty
+            or not pd.api.types.is_datetime64_any_dtype(series)
+            or series.isna().any()
+        ):
+            return None
+
+        if time_offset and not QueryContextProcessor.is_valid_date_range_static(
+            time_offset
+        ):
+            series = series + DateOffset(**normalize_time_delta(time_offset))
+
+        if time_grain in (
+            TimeGrain.WEEK_STARTING_SUNDAY,
+            TimeGrain.WEEK_ENDING_SATURDAY,
+        ):
+            return series.dt.strftime("%Y-W%U")
+
+        if time_grain in (
+            TimeGrain.WEEK,
+            TimeGrain.WEEK_STARTING_MONDAY,
+            TimeGrain.WEEK_ENDING_SUNDAY,
+        ):
+            return series.dt.strftime("%Y-W%W")
+
+        if time_grain == TimeGrain.MONTH:
+            return series.dt.strftime("%Y-%m")
+
+        if time_grain == TimeGrain.QUARTER:
+            return series.dt.strftime("%Y-Q") + series.dt.quarter.astype(str)
+
+        return series.dt.strftime("%Y")
+
     @staticmethod
     def is_valid_date_range_static(date_range: str) -> bool:
         """Static version of is_valid_date_range for use in static methods"""
@@ -989,7 +1304,7 @@ class QueryContextProcessor:
 
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | list[dict[str, Any]] | json.RawJSON:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -1007,8 +1322,106 @@ class QueryContextProcessor:
                 result = excel.df_to_excel(df, **current_app.config["EXCEL_EXPORT"])
             return result or ""
 
+        if orient := self._query_context.json_orient:
+            # the response is encoded straight from the columns of the DataFrame
+            return json.RawJSON(json.dumps_dataframe(df, orient))
+
         return df.to_dict(orient="records")
 
+    def can_stream_csv(self) -> bool:
+        """
+        Whether the CSV export of the query context can be streamed from the database.
+
+        Streaming is only possible for the full results of a single query that doesn't
+        need the whole DataFrame, i.e. without post-processing or time comparison.
+        """
+        query_context = self._query_context
+        if not (
+            current_app.config["CSV_STREAMING_EXPORT"]
+            and query_context.result_format == ChartDataResultFormat.CSV
+            and query_context.result_type == ChartDataResultType.FULL
+            and len(query_context.queries) == 1
+            and hasattr(self._qc_datasource, "get_query_str_extended")
+        ):
+            return False
+
+        query_object = query_context.queries[0]
+        return not query_object.post_processing and not query_object.time_offsets
+
+    def validate_query_columns(self, query_obj: QueryObject) -> None:
+        """
+        Check that the columns and metrics of a query exist in the datasource.
+
+        :raises QueryObjectValidationError: If columns are missing in the datasource
+        """
+        if invalid_columns := [
+            col
+            for col in get_column_names_from_columns(query_obj.columns)
+            + get_column_names_from_metrics(query_obj.metrics or [])
+            if col not in self._qc_datasource.column_names and col != DTTM_ALIAS
+        ]:
+            raise QueryObjectValidationError(
+                _(
+                    "Columns missing in dataset: %(invalid_columns)s",
+                    invalid_columns=invalid_columns,
+                )
+            )
+
+    def get_csv_stream(self) -> Generator[str, None, None]:
+        """
+        Yield the CSV export of the query context in chunks.
+
+        The rows are fetched from the database in batches of `CSV_STREAMING_CHUNK_SIZE`
+        rows, which are normalized and escaped like a regular export, so only one batch
+        is held in memory at a time. The results are neither read from nor written to
+        the cache. Closing the generator closes the cursor.
+        """
+        config = current_app.config
+        query_object = self._query_context.queries[0]
+        query_object.validate()
+        self.validate_query_columns(query_object)
+
+        max_rows = config["CSV_STREAMING_ROW_LIMIT"]
+        query_object.row_limit = min(query_object.row_limit or max_rows, max_rows)
+
+        datasource = self._qc_datasource
+        query_str_ext = datasource.get_query_str_extended(query_object.to_dict())
+        labels_expected = query_str_ext.labels_expected
+        verbose_map = datasource.data.get("verbose_map", {})
+
+        def assign_column_label(df: pd.DataFrame) -> pd.DataFrame:
+            if df.empty:
+                return pd.DataFrame(columns=labels_expected)
+            if len(df.columns) < len(labels_expected):
+                raise QueryObjectValidationError(
+                    _("Db engine did not return all queried columns")
+                )
+            df = df.iloc[:, 0 : len(labels_expected)]
+            df.columns = labels_expected
+            return df
+
+        chunks = datasource.database.iter_df(
+            query_str_ext.sql,
+            datasource.catalog,
+            datasource.schema or None,
+            mutator=assign_column_label,
+            chunk_size=config["CSV_STREAMING_CHUNK_SIZE"],
+        )
+        with closing(chunks):
+            for idx, df in enumerate(chunks):
+                if not df.empty:
+                    df = self.normalize_df(df, query_object)
+                if verbose_map:
+                    df.columns = [
+                        verbose_map.get(column, column) for column in df.columns
+                    ]
+                yield csv.df_to_escaped_csv(
+                    df,
+                    index=False,
+                    header=idx == 0,
+                    **config["CSV_EXPORT"],
+                )
+
     def ensure_totals_available(self) -> None:
         queries_needing_totals = []
         totals_queries = []
@@ -1057,17 +1470,24 @@ class QueryContextProcessor:
     ) -> dict[str, Any]:
         """Returns the query results with both metadata and data"""
 
+        # totals need to be computed before any of the queries relying on them run
         self.ensure_totals_available()
 
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
+        queries = self._query_context.queries
+        parallelism = self.get_query_parallelism()
+        if parallelism > 1 and len(queries) > 1:
+            self._preload_datasource()
+            query_results = map_in_app_context(
+                partial(self._get_query_results, force_cached=force_cached),
+                queries,
+                max_workers=parallelism,
+                thread_name_prefix="chart-data",
             )
-            for query_obj in self._query_context.queries
-        ]
+        else:
+            query_results = [
+                self._get_query_results(query_obj, force_cached)
+                for query_obj in queries
+            ]
 
         return_value = {"queries": query_results}
 
@@ -1091,6 +1511,48 @@ class QueryContextProcessor:
 
         return return_value
 
+    def _get_query_results(
+        self, query_obj: QueryObject, force_cached: bool
+    ) -> dict[str, Any]:
+        return get_query_results(
+            query_obj.result_type or self._query_context.result_type,
+            self._query_context,
+            query_obj,
+            force_cached,
+        )
+
+    def _preload_datasource(self) -> None:
+        """
+        Load the datasource in the current thread, before its queries are dispatched
+        to worker threads.
+
+        The datasource is bound to the SQLAlchemy session of the request thread, which
+        can't be used concurrently, while the workers have sessions of their own. So
+        that the workers only read attributes already loaded, the relationships the
+        queries read are loaded beforehand, along with the expired or deferred
+        attributes and the many-to-one relationships of the datasource, its
+        database, its columns and its metrics.
+        """
+        instances: list[Any] = [self._qc_datasource]
+        for attr in ("database", "columns", "metrics"):
+            value = getattr(self._qc_datasource, attr, None)
+            instances.extend(value if isinstance(value, list) else [value])
+
+        for instance in instances:
+            if (state := inspect(instance, raiseerr=False)) is None:
+                continue
+            for key in state.unloaded:
+                prop = state.mapper.attrs[key]
+                if not isinstance(prop, RelationshipProperty) or not prop.uselist:
+                    getattr(instance, key)
+
+    def get_query_parallelism(self) -> int:
+        """
+        Returns the maximum number of queries of the query context that can be
+        executed concurrently.
+        """
+        return max(int(current_app.config["CHART_DATA_QUERY_PARALLELISM"] or 1), 1)
+
     def get_cache_timeout(self) -> int:
         if cache_timeout_rv := self._query_context.get_cache_timeout():
             return cache_timeout_rv
@@ -1102,6 +1564,13 @@ class QueryContextProcessor:
             return data_cache_timeout
         return current_app.config["CACHE_DEFAULT_TIMEOUT"]
 
+    def get_stale_cache_timeout(self) -> int:
+        if (
+            stale_cache_timeout := self._query_context.get_stale_cache_timeout()
+        ) is not None:
+            return stale_cache_timeout
+        return current_app.config["DATA_CACHE_STALE_TIMEOUT"]
+
     def cache_key(self, **extra: Any) -> str:
         """
         The QueryContext cache key is made out of the key/values from
@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Serialization of the DataFrames stored in the chart data cache.
+
+By default the cache values are stored as-is, and the cache backend pickles the
+pandas objects. With ``DATA_CACHE_SERIALIZATION = "arrow"`` the DataFrame of a cache
+value is stored as an Arrow IPC stream instead, which is smaller, faster to load and
+doesn't depend on the pandas version that wrote it. The IPC stream can be further
+compressed as a whole with one of the codecs of `superset.utils.compression`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+from flask import current_app
+
+from superset.utils.compression import compress, decompress
+
+logger = logging.getLogger(__name__)
+
+ARROW_FORMAT = "arrow"
+
+# key of the cache value holding the serialization format of the DataFrame
+DF_FORMAT_KEY = "df_format"
+
+# key of the cache value holding the codec compressing the IPC stream, if any
+DF_COMPRESSION_KEY = "df_compression"
+
+
+def dumps_df(df: pd.DataFrame, compression: str | None = None) -> bytes:
+    """
+    Serialize a DataFrame as an Arrow IPC stream.
+
+    :param df: The DataFrame to serialize
+    :param compression: The IPC buffer compression, either None, "lz4" or "zstd"
+    :returns: The IPC stream
+    """
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def loads_df(payload: bytes) -> pd.DataFrame:
+    """
+    Deserialize an Arrow IPC stream written by `dumps_df`.
+
+    The stream is read in place from the payload, and the Arrow buffers are released
+    while converted to pandas, to keep the peak memory usage close to the size of
+    the DataFrame. Integer columns with nulls are converted to objects, like in
+    `SupersetResultSet.convert_table_to_df`, rather than to lossy floats.
+
+    :param payload: The IPC stream
+    :returns: The DataFrame
+    """
+    table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+    return table.to_pandas(
+        integer_object_nulls=True,
+        split_blocks=True,
+        self_destruct=True,
+    )
+
+
+def serialize_cache_value(value: dict[str, Any]) -> dict[str, Any]:
+    """
+    Prepare a cache value for the data cache.
+
+    When the Arrow serialization is enabled the DataFrame of the value is replaced by
+    its IPC stream. DataFrames that can't be represented in Arrow (e.g. columns with
+    mixed types) are stored as-is.
+    """
+    df = value.get("df")
+    if current_app.config["DATA_CACHE_SERIALIZATION"] != ARROW_FORMAT or not isinstance(
+        df, pd.DataFrame
+    ):
+        return value
+
+    try:
+        payload = dumps_df(df, current_app.config["DATA_CACHE_ARROW_COMPRESSION"])
+    except (pa.ArrowException, TypeError, ValueError) as ex:
+        logger.debug("Unable to serialize DataFrame with Arrow: %s", ex)
+        return value
+
+    value = {**value, "df": payload, DF_FORMAT_KEY: ARROW_FORMAT}
+    if codec := current_app.config["DATA_CACHE_COMPRESSION"]:
+        value["df"] = compress(
+            payload,
+            codec,
+            **current_app.config["DATA_CACHE_COMPRESSION_OPTIONS"],
+        )
+        value[DF_COMPRESSION_KEY] = codec
+    return value
+
+
+def deserialize_cache_value(value: dict[str, Any]) -> dict[str, Any]:
+    """
+    Restore a cache value read from the data cache, regardless of the serialization
+    format it was written with.
+    """
+    if value.get(DF_FORMAT_KEY) != ARROW_FORMAT:
+        return value
+
+    payload = value["df"]
+    if value.get(DF_COMPRESSION_KEY):
+        payload = decompress(payload, decode=False)
+
+    value = {
+        key: val
+        for key, val in value.items()
+        if key not in (DF_FORMAT_KEY, DF_COMPRESSION_KEY)
+    }
+    value["df"] = loads_df(payload)
+    return value
@@ -17,13 +17,19 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime, timedelta
 from typing import Any
 
+import pyarrow as pa
 from flask import current_app
 from flask_caching import Cache
 from pandas import DataFrame
 
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.cache_serialization import (
+    deserialize_cache_value,
+    serialize_cache_value,
+)
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -31,6 +37,7 @@ from superset.models.helpers import QueryResult
 from superset.stats_logger import BaseStatsLogger
 from superset.superset_typing import Column
 from superset.utils.cache import set_and_log_cache
+from superset.utils.compression import DECOMPRESSION_ERRORS
 from superset.utils.core import error_msg_from_exception, get_stacktrace
 
 logger = logging.getLogger(__name__)
@@ -67,6 +74,7 @@ class QueryCacheManager:
         cache_dttm: str | None = None,
         cache_value: dict[str, Any] | None = None,
         sql_rowcount: int | None = None,
+        is_stale: bool = False,
     ) -> None:
         self.df = df
         self.query = query
@@ -83,6 +91,7 @@ class QueryCacheManager:
         self.cache_dttm = cache_dttm
         self.cache_value = cache_value
         self.sql_rowcount = sql_rowcount
+        self.is_stale = is_stale
 
     # pylint: disable=too-many-arguments
     def set_query_result(
@@ -94,9 +103,13 @@ class QueryCacheManager:
         timeout: int | None = None,
         datasource_uid: str | None = None,
         region: CacheRegion = CacheRegion.DEFAULT,
+        stale_timeout: int | None = None,
     ) -> None:
         """
         Set dataframe of query-result to specific cache region
+
+        With a `stale_timeout` the value is kept in the cache for that many seconds
+        after its expiration, during which it is loaded as stale.
         """
         try:
             self.status = query_result.status
@@ -126,6 +139,11 @@ class QueryCacheManager:
                 "annotation_data": self.annotation_data,
                 "sql_rowcount": self.sql_rowcount,
             }
+            if stale_timeout and timeout and timeout > 0:
+                value["stale_after"] = (
+                    datetime.utcnow() + timedelta(seconds=timeout)
+                ).isoformat()
+                timeout += stale_timeout
             if self.is_loaded and key and self.status != QueryStatus.FAILED:
                 self.set(
                     key=key,
@@ -157,38 +175,7 @@ class QueryCacheManager:
             return query_cache
 
         if cache_value := _cache[region].get(key):
-            logger.debug("Cache key: %s", key)
-            current_app.config["STATS_LOGGER"].incr("loading_from_cache")
-            try:
-                query_cache.df = cache_value["df"]
-                query_cache.query = cache_value["query"]
-                query_cache.annotation_data = cache_value.get("annotation_data", {})
-                query_cache.applied_template_filters = cache_value.get(
-                    "applied_template_filters", []
-                )
-                query_cache.applied_filter_columns = cache_value.get(
-                    "applied_filter_columns", []
-                )
-                query_cache.rejected_filter_columns = cache_value.get(
-                    "rejected_filter_columns", []
-                )
-                query_cache.status = QueryStatus.SUCCESS
-                query_cache.is_loaded = True
-                query_cache.is_cached = cache_value is not None
-                query_cache.sql_rowcount = cache_value.get("sql_rowcount", None)
-                query_cache.cache_dttm = (
-                    cache_value["dttm"] if cache_value is not None else None
-                )
-                query_cache.cache_value = cache_value
-                current_app.config["STATS_LOGGER"].incr("loaded_from_cache")
-            except KeyError as ex:
-                logger.exception(ex)
-                logger.error(
-                    "Error reading cache: %s",
-                    error_msg_from_exception(ex),
-                    exc_info=True,
-                )
-            logger.debug("Serving from cache")
+            query_cache.load_cache_value(key, cache_value)
 
         if force_cached and not query_cache.is_loaded:
             logger.warning(
@@ -197,6 +184,69 @@ class QueryCacheManager:
             raise CacheLoadError("Error loading data from cache")
         return query_cache
 
+    @classmethod
+    def get_many(
+        cls,
+        keys: list[str | None],
+        region: CacheRegion = CacheRegion.DEFAULT,
+        force_query: bool | None = False,
+    ) -> list[QueryCacheManager]:
+        """
+        Initialize a QueryCacheManager for each query-cache key, fetching all the
+        keys from the cache backend in a single round trip
+        """
+        query_caches = [cls() for _ in keys]
+        present_keys = [key for key in keys if key]
+        if not present_keys or not _cache[region] or force_query:
+            return query_caches
+
+        cache_values = dict(
+            zip(present_keys, _cache[region].get_many(*present_keys), strict=False)
+        )
+        for key, query_cache in zip(keys, query_caches, strict=False):
+            if key and (cache_value := cache_values.get(key)):
+                query_cache.load_cache_value(key, cache_value)
+        return query_caches
+
+    def load_cache_value(self, key: str, cache_value: dict[str, Any]) -> None:
+        """
+        Populate the QueryCacheManager from a value read from the cache
+        """
+        logger.debug("Cache key: %s", key)
+        current_app.config["STATS_LOGGER"].incr("loading_from_cache")
+        try:
+            cache_value = deserialize_cache_value(cache_value)
+            self.df = cache_value["df"]
+            self.query = cache_value["query"]
+            self.annotation_data = cache_value.get("annotation_data", {})
+            self.applied_template_filters = cache_value.get(
+                "applied_template_filters", []
+            )
+            self.applied_filter_columns = cache_value.get("applied_filter_columns", [])
+            self.rejected_filter_columns = cache_value.get(
+                "rejected_filter_columns", []
+            )
+            self.status = QueryStatus.SUCCESS
+            self.is_loaded = True
+            self.is_cached = cache_value is not None
+            self.sql_rowcount = cache_value.get("sql_rowcount", None)
+            self.cache_dttm = cache_value["dttm"] if cache_value is not None else None
+            self.cache_value = cache_value
+            if stale_after := cache_value.get("stale_after"):
+                self.is_stale = datetime.fromisoformat(stale_after) <= datetime.utcnow()
+            current_app.config["STATS_LOGGER"].incr("loaded_from_cache")
+            if self.is_stale:
+                current_app.config["STATS_LOGGER"].incr("loaded_from_cache_stale")
+        except (KeyError, pa.ArrowException, *DECOMPRESSION_ERRORS) as ex:
+            # the value is served as a cache miss
+            logger.exception(ex)
+            logger.error(
+                "Error reading cache: %s",
+                error_msg_from_exception(ex),
+                exc_info=True,
+            )
+        logger.debug("Serving from cache")
+
     @staticmethod
     def set(
         key: str | None,
@@ -209,6 +259,8 @@ class QueryCacheManager:
         set value to specify cache region, proxy for `set_and_log_cache`
         """
         if key:
+            if region == CacheRegion.DATA:
+                value = serialize_cache_value(value)
             set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
 
     @staticmethod
@@ -0,0 +1,89 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Deduplication of identical computations running at the same time.
+
+Only one of the processes (across workers and hosts) computing a value for a given
+key does it, while the others wait for the value to show up in the cache.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, ExitStack
+from typing import Callable, TypeVar
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from superset.distributed_lock import KeyValueDistributedLock
+from superset.exceptions import CreateKeyValueDistributedLockFailedException
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@contextmanager
+def single_flight(
+    namespace: str,
+    key: str,
+    load: Callable[[], T | None],
+    timeout: float,
+    poll_interval: float,
+) -> Iterator[T | None]:
+    """
+    Wait for the computation of a value by another process, or compute it.
+
+    The context yields the value loaded with `load` once the process holding the
+    lock for the key is done, or None when the caller has to compute the value
+    itself: when it holds the lock, or when the value wasn't available within
+    `timeout` seconds, so that nobody waits forever.
+
+    :param namespace: The namespace of the lock
+    :param key: The key of the computed value, e.g. its cache key
+    :param load: Loads the value from the cache, returning None when missing
+    :param timeout: The maximum number of seconds to wait for the value
+    :param poll_interval: The number of seconds between two attempts to load the value
+    :yields: The loaded value, or None if it has to be computed
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        with ExitStack() as stack:
+            try:
+                stack.enter_context(KeyValueDistributedLock(namespace, key=key))
+            except CreateKeyValueDistributedLockFailedException:
+                logger.debug("Waiting for %s to be computed", key)
+            except SQLAlchemyError:
+                logger.warning("Unable to lock %s", key, exc_info=True)
+                deadline = 0
+            else:
+                # the previous holder may have stored the value after our cache miss
+                yield load()
+                return
+
+        if (value := load()) is not None:
+            yield value
+            return
+
+        if time.monotonic() >= deadline:
+            logger.warning("Not waiting for %s anymore, computing it", key)
+            yield None
+            return
+
+        time.sleep(poll_interval)
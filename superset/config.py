@@ -168,6 +168,16 @@ NATIVE_FILTER_DEFAULT_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
 
+# Maximum number of queries of a single chart data request that are executed
+# concurrently. Charts like mixed timeseries, big number with trendline or tables
+# with totals send several independent queries; with a value above 1 they run in
+# parallel threads, so the latency is that of the slowest query instead of the sum.
+CHART_DATA_QUERY_PARALLELISM = 1
+# Maximum number of chart data queries a web worker process runs concurrently
+# against the same database when CHART_DATA_QUERY_PARALLELISM is enabled. This is
+# shared across requests, so keep it below the size of the engine connection pool.
+CHART_DATA_MAX_CONCURRENT_QUERIES_PER_DATABASE = 4
+
 # SupersetClient HTTP retry configuration
 # Controls retry behavior for all HTTP requests made through SupersetClient
 # This helps handle transient server errors (like 502 Bad Gateway) automatically
@@ -272,6 +282,12 @@ SQLALCHEMY_ENCRYPTED_FIELD_TYPE_ADAPTER = (  # pylint: disable=invalid-name
 # Extends the default SQLGlot dialects with additional dialects
 SQLGLOT_DIALECTS_EXTENSIONS: DialectExtensions | Callable[[], DialectExtensions] = {}
 
+# Maximum total length, in characters, of the SQL scripts whose parsed statements are
+# cached by each process, so that a query is parsed once while it's validated, secured
+# and run. The hits and misses are reported to the STATS_LOGGER as the
+# "sql_parse_cache.hit" and "sql_parse_cache.miss" counters. 0 disables the cache.
+SQL_PARSE_CACHE_MAX_SIZE = 2_000_000
+
 # The limit of queries fetched for query search
 QUERY_SEARCH_LIMIT = 1000
 
@@ -923,9 +939,84 @@ CACHE_DEFAULT_TIMEOUT = int(timedelta(days=1).total_seconds())
 # Default cache for Superset objects
 CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Duration the row level security filters resolved for a set of roles and a dataset
+# are cached in the CACHE_CONFIG cache. They are invalidated when the RLS rules, the
+# roles or the datasets change, and resolved once per request otherwise. 0 disables it.
+RLS_FILTERS_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
+# Duration the permissions granted to a set of roles are cached in the CACHE_CONFIG
+# cache, and in each process, as an index used by the access checks. They are
+# invalidated when the permissions or the roles change. 0 disables it.
+PERMISSIONS_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
+# Duration the payloads of the dashboard, its charts and its datasets, fetched when
+# a dashboard is opened, are cached in the CACHE_CONFIG cache. They are cached under a
+# version made of the time the dashboard, its charts and its datasets last changed and
+# of the permissions of the user, which is also their ETag. 0 disables caching them.
+# The ETag is always set though: whatever the timeout, the conditional requests of a
+# browser holding the current version are answered with a 304 Not Modified, without
+# serializing the payload.
+DASHBOARD_PAYLOAD_CACHE_TIMEOUT = 0
+
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# How the DataFrames of chart query results are stored in the data cache:
+# - "pickle": the DataFrame is stored as-is, and pickled by the cache backend
+# - "arrow": the DataFrame is stored as an Arrow IPC stream, which is smaller, faster
+#   to load and doesn't break when pandas is upgraded
+# Entries written with either format can be read regardless of this setting.
+DATA_CACHE_SERIALIZATION: Literal["pickle", "arrow"] = "pickle"
+# Compression of the Arrow IPC buffers when DATA_CACHE_SERIALIZATION is "arrow":
+# None, "lz4" or "zstd"
+DATA_CACHE_ARROW_COMPRESSION: Literal["lz4", "zstd"] | None = None
+# Compression of the whole Arrow IPC stream when DATA_CACHE_SERIALIZATION is "arrow",
+# with one of the codecs of RESULTS_BACKEND_COMPRESSION and its options
+DATA_CACHE_COMPRESSION: Literal["zlib", "zstd", "lz4"] | None = None
+DATA_CACHE_COMPRESSION_OPTIONS: dict[str, Any] = {}
+
+# Deduplicate the identical chart queries running at the same time, e.g. when a
+# popular dashboard is loaded right after the data cache was flushed. The first
+# request missing the data cache takes a distributed lock on the cache key and runs
+# the query, while the other requests wait for its result to be cached, for at most
+# DATA_CACHE_SINGLE_FLIGHT_TIMEOUT seconds before running the query themselves.
+# The lock is stored in the key-value table of the metastore, and requires a shared
+# data cache (e.g. Redis) to be effective.
+DATA_CACHE_SINGLE_FLIGHT = False
+DATA_CACHE_SINGLE_FLIGHT_TIMEOUT = 30
+# Seconds between two checks of the data cache while waiting for a result
+DATA_CACHE_SINGLE_FLIGHT_POLL_INTERVAL = 0.5
+
+# Grace period in seconds during which expired chart data is still served from the
+# data cache (stale-while-revalidate). Stale results are flagged with `is_stale` in
+# the chart data payload, and a Celery task refreshes them with the chart warm-up
+# command, so that the next viewers get fresh data without waiting for the query.
+# It can be overridden per database and per dataset with the `stale_cache_timeout`
+# key of their extra. 0 disables serving stale data.
+DATA_CACHE_STALE_TIMEOUT = 0
+
+# Keep the values of CACHE_CONFIG and DATA_CACHE_CONFIG in the memory of each worker
+# too (L1), so that the values served again by a worker aren't fetched from the
+# cache backend (L2). Each cache keeps up to CACHE_L1_MAX_BYTES of pickled values,
+# for at most CACHE_L1_TIMEOUT seconds, evicting the least recently used values
+# first. As chart data cache keys include the `changed_on` of their dataset, the
+# edited datasets are never served from L1. With a Redis backend, the keys set or
+# deleted by a worker can also be dropped from the L1 of the other workers right
+# away by publishing them on the CACHE_L1_INVALIDATION_CHANNEL pub/sub channel.
+# The hits and misses of each tier are counted with the STATS_LOGGER, e.g.
+# `cache_data_l1_hit` or `cache_default_l2_miss`.
+# Without the invalidation channel, a worker may serve a value changed by another
+# worker for up to CACHE_L1_TIMEOUT seconds. The values read from the backend are
+# kept for no longer than they are left to live in it, which is only known for the
+# Redis and simple backends: with other backends, a worker only keeps the values it
+# writes. The keys of CACHE_L1_EXCLUDED_KEYS, such as the versions bumped when the
+# row level security filters or the permissions change, are never kept in memory.
+CACHE_L1_ENABLED = False
+CACHE_L1_MAX_BYTES = 256 * 1024 * 1024
+CACHE_L1_TIMEOUT = 60
+CACHE_L1_INVALIDATION_CHANNEL: str | None = None
+CACHE_L1_EXCLUDED_KEYS: list[str] = ["rls_filters_version", "permissions_version"]
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -1009,6 +1100,22 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8-sig"}
 
+# Stream chart data CSV exports to the client while the rows are fetched from the
+# database, instead of building the whole file in memory. Only exports of a single
+# query without post-processing or time comparison are streamed, the other exports are
+# built in memory as usual.
+CSV_STREAMING_EXPORT = False
+
+# Number of rows fetched from the database and written at a time in a streamed export
+CSV_STREAMING_CHUNK_SIZE = 10000
+
+# Maximum number of rows of a streamed CSV export, applied on top of the row limit of
+# the query
+CSV_STREAMING_ROW_LIMIT = 1000000
+
+# Compress streamed CSV exports with gzip, when supported by the client
+CSV_STREAMING_GZIP = False
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -1247,6 +1354,11 @@ SQLLAB_QUERY_COST_ESTIMATE_TIMEOUT = int(timedelta(seconds=10).total_seconds())
 # 0 means no timeout.
 SQLLAB_QUERY_RESULT_TIMEOUT = 0
 
+# Duration the statuses of the queries of a user are cached in the cache configured by
+# CACHE_CONFIG, when SQL Lab polls them through /api/v1/query/status. The polls of all
+# the tabs of a user then share one metadata database query per period. 0 disables it.
+SQLLAB_QUERY_STATUS_CACHE_TIMEOUT = int(timedelta(seconds=1).total_seconds())
+
 # The cost returned by the databases is a relative value; in order to map the cost to
 # a tangible value you need to define a custom formatter that takes into consideration
 # your specific infrastructure. For example, you could analyze queries a posteriori by
@@ -1312,6 +1424,26 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# Codec compressing the payloads stored in the results backend: "zlib", "zstd" or
+# "lz4", with its options, e.g. {"level": 3, "threads": -1} to compress with zstd
+# using one thread per CPU. Stored results are read regardless of the codec they were
+# written with.
+RESULTS_BACKEND_COMPRESSION: Literal["zlib", "zstd", "lz4"] = "zlib"
+RESULTS_BACKEND_COMPRESSION_OPTIONS: dict[str, Any] = {}
+
+# Store the data of SQL Lab results apart from their metadata, split in row groups of
+# SQLLAB_RESULTS_ROW_GROUP_SIZE rows, each stored in the results backend under its own
+# key as a compressed Arrow IPC stream. Fetching the results with a `rows` limit then
+# only reads and decompresses the row groups needed, instead of the whole result.
+SQLLAB_RESULTS_COLUMNAR_STORAGE = False
+SQLLAB_RESULTS_ROW_GROUP_SIZE = 10000
+
+# Stream the first rows of async SQL Lab queries while they are being fetched. Each
+# batch of rows is stored in the results backend as soon as it's fetched, up to
+# DISPLAY_MAX_ROW rows, and a "running" event with the URL of the batch is published
+# to the event stream of the GLOBAL_ASYNC_QUERIES feature, which must be enabled.
+SQLLAB_PARTIAL_RESULTS = False
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1500,6 +1632,32 @@ ENGINE_CONTEXT_MANAGER = engine_context_manager
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# By default a new engine, without connection pool, is created for every query run on
+# an analytics database, which pays for the connection handshakes every time. When
+# DB_ENGINE_REGISTRY is enabled, the engines are kept per process and reused by the
+# queries with the same database, catalog, schema, effective user, OAuth2 token and
+# source, along with their connection pools. At most DB_ENGINE_REGISTRY_MAX_ENGINES
+# engines are kept, and those unused for DB_ENGINE_REGISTRY_IDLE_TIMEOUT seconds are
+# disposed, as well as the engines of a database when it's updated or deleted.
+# DB_ENGINE_REGISTRY_POOL_OPTIONS are the default options of the pooled engines,
+# overridden by the `engine_params` of the database. The pool checkouts, new
+# connections and wait times are reported to the STATS_LOGGER.
+# Engines using an SSH tunnel are never reused, as the tunnel is closed after the query.
+DB_ENGINE_REGISTRY = False
+DB_ENGINE_REGISTRY_MAX_ENGINES = 100
+DB_ENGINE_REGISTRY_IDLE_TIMEOUT = 600
+DB_ENGINE_REGISTRY_POOL_OPTIONS: dict[str, Any] = {
+    "pool_pre_ping": True,
+    "pool_recycle": 3600,
+}
+
+# Some drivers (e.g. DuckDB, Snowflake, BigQuery and Databricks) can return the results
+# of a query as an Arrow table directly. When DB_ARROW_FETCH is enabled, SQL Lab and
+# `Database.get_df` load such tables as they are, instead of building a Python tuple
+# per row and converting them back to Arrow. The types of the columns are then the
+# ones picked by the driver, which may differ from the ones inferred from the rows.
+DB_ARROW_FETCH = False
+
 
 # A callable that is invoked for every invocation of DB Engine Specs
 # which allows for custom validation of the engine URI.
@@ -59,6 +59,7 @@ from sqlalchemy.orm import (
     reconstructor,
     relationship,
     RelationshipProperty,
+    Session,
 )
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy.schema import UniqueConstraint
@@ -69,7 +70,6 @@ from sqlalchemy.sql.selectable import Alias, TableClause
 from sqlalchemy.types import JSON
 
 from superset import db, is_feature_enabled, security_manager
-from superset.commands.dataset.exceptions import DatasetNotFoundError
 from superset.common.db_query_status import QueryStatus
 from superset.connectors.sqla.utils import (
     get_columns_description,
@@ -364,6 +364,17 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
     @property
     def data(self) -> dict[str, Any]:
         """Data representation of the datasource sent to the frontend"""
+        return self.get_data(self.columns, self.metrics)
+
+    def get_data(self, columns: list[Any], metrics: list[Any]) -> dict[str, Any]:
+        """
+        Data representation of the datasource sent to the frontend, restricted to
+        some of its columns and metrics.
+
+        :param columns: The columns of the datasource to represent
+        :param metrics: The metrics of the datasource to represent
+        :returns: The data representation
+        """
         return {
             # simple fields
             "id": self.id,
@@ -388,8 +399,8 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             # sqla-specific
             "sql": self.sql,
             # one to many
-            "columns": [o.data for o in self.columns],
-            "metrics": [o.data for o in self.metrics],
+            "columns": [o.data for o in columns],
+            "metrics": [o.data for o in metrics],
             "folders": self.folders,
             # TODO deprecate, move logic to JS
             "order_by_choices": self.order_by_choices,
@@ -407,7 +418,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
 
         Used to reduce the payload when loading a dashboard.
         """
-        data = self.data
+        verbose_map = self.verbose_map
         metric_names = set()
         column_names = set()
         for slc in slices:
@@ -415,7 +426,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             # pull out all required metrics from the form_data
             for metric_param in METRIC_FORM_DATA_PARAMS:
                 for metric in utils.as_list(form_data.get(metric_param) or []):
-                    metric_names.add(utils.get_metric_name(metric, self.verbose_map))
+                    metric_names.add(utils.get_metric_name(metric, verbose_map))
                     if utils.is_adhoc_metric(metric):
                         column_ = metric.get("column") or {}
                         if column_name := column_.get("column_name"):
@@ -435,22 +446,10 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
                 if "column" in filter_config
             )
 
-            # for legacy dashboard imports which have the wrong query_context in them
-            try:
-                query_context = slc.get_query_context()
-            except DatasetNotFoundError:
-                query_context = None
-
             # legacy charts don't have query_context charts
-            if query_context:
-                column_names.update(
-                    [
-                        utils.get_column_name(column_)
-                        for query in query_context.queries
-                        for column_ in query.columns
-                    ]
-                    or []
-                )
+            query_context_column_names = self._get_query_context_column_names(slc)
+            if query_context_column_names is not None:
+                column_names.update(query_context_column_names)
             else:
                 _columns = [
                     (
@@ -465,34 +464,33 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
 
         filtered_metrics = [
             metric
-            for metric in data["metrics"]
-            if metric["metric_name"] in metric_names
-            or metric["verbose_name"] in metric_names
+            for metric in self.metrics
+            if metric.metric_name in metric_names or metric.verbose_name in metric_names
         ]
 
-        filtered_columns: list[Column] = []
+        filtered_columns: list[TableColumn] = []
         column_types: set[utils.GenericDataType] = set()
-        for column_ in data["columns"]:
-            generic_type = column_.get("type_generic")
+        for table_column in self.columns:
+            generic_type = getattr(table_column, "type_generic", None)
             if generic_type is not None:
                 column_types.add(generic_type)
-            if column_["column_name"] in column_names:
-                filtered_columns.append(column_)
+            if table_column.column_name in column_names:
+                filtered_columns.append(table_column)
 
+        # only the columns and metrics used by the slices are represented
+        data = self.get_data(filtered_columns, filtered_metrics)
         data["column_types"] = list(column_types)
         del data["description"]
-        data.update({"metrics": filtered_metrics})
-        data.update({"columns": filtered_columns})
 
         all_columns = {
             column_["column_name"]: column_["verbose_name"] or column_["column_name"]
-            for column_ in filtered_columns
+            for column_ in data["columns"]
         }
         verbose_map = {"__timestamp": "Time"}
         verbose_map.update(
             {
                 metric["metric_name"]: metric["verbose_name"] or metric["metric_name"]
-                for metric in filtered_metrics
+                for metric in data["metrics"]
             }
         )
         verbose_map.update(all_columns)
@@ -501,6 +499,75 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
 
         return data
 
+    def _get_query_context_column_names(  # noqa: C901
+        self, slc: Slice
+    ) -> set[str] | None:
+        """
+        The names of the columns queried by the query context of a slice.
+
+        The query context is read as is rather than built, which would load its
+        datasource and process its queries. The columns are the ones the query
+        context factory would query: the columns of each query, the temporal x-axis
+        being replaced with the granularity, and the tooltip columns.
+
+        :param slc: The slice
+        :returns: The column names, or None if the slice has no query context of
+            this datasource
+        """
+        if not slc.query_context:
+            return None
+        try:
+            query_context = json.loads(slc.query_context)
+        except json.JSONDecodeError as ex:
+            logger.error("Malformed json in slice's query context", exc_info=True)
+            logger.exception(ex)
+            return None
+
+        # legacy dashboard imports may have the wrong query_context in them
+        datasource = query_context.get("datasource") or {}
+        if str(datasource.get("id")) not in {
+            str(self.id),
+            str(getattr(self, "uuid", None)),
+        }:
+            return None
+
+        form_data = query_context.get("form_data") or {}
+        x_axis = form_data.get("x_axis")
+        if isinstance(x_axis, dict):
+            x_axis = x_axis.get("sqlExpression")
+        temporal_columns = {
+            column_.column_name for column_ in self.columns if column_.is_dttm
+        }
+
+        column_names = set()
+        for query in query_context.get("queries") or []:
+            columns = query.get("groupby") or query.get("columns") or []
+            granularity = query.get("granularity_sqla") or query.get("granularity")
+            for column_ in columns:
+                if (
+                    granularity
+                    and x_axis in temporal_columns
+                    and (
+                        column_ == x_axis
+                        or (
+                            isinstance(column_, dict)
+                            and column_.get("sqlExpression") == x_axis
+                        )
+                    )
+                ):
+                    column_names.add(granularity)
+                else:
+                    column_names.add(utils.get_column_name(column_))
+
+        for item in form_data.get("tooltip_contents") or []:
+            if isinstance(item, str):
+                column_names.add(item)
+            elif isinstance(item, dict) and item.get("item_type") == "column":
+                if column_name := item.get("column_name"):
+                    column_names.add(column_name)
+
+        return column_names
+
     def external_metadata(self) -> list[ResultSetColumnType]:
         """Returns column information from the external system"""
         raise NotImplementedError()
@@ -1350,9 +1417,8 @@ class SqlaTable(
     def time_grain_sqla(self) -> list[tuple[Any, Any]]:
         return [(g.duration, g.name) for g in self.database.grains() or []]
 
-    @property
-    def data(self) -> dict[str, Any]:
-        data_ = super().data
+    def get_data(self, columns: list[Any], metrics: list[Any]) -> dict[str, Any]:
+        data_ = super().get_data(columns, metrics)
         if self.type == "table":
             data_["granularity_sqla"] = self.granularity_sqla
             data_["time_grain_sqla"] = self.time_grain_sqla
@@ -1374,6 +1440,10 @@ class SqlaTable(
         except (TypeError, json.JSONDecodeError):
             return {}
 
+    @property
+    def stale_cache_timeout(self) -> int | None:
+        return self.extra_dict.get("stale_cache_timeout")
+
     def get_fetch_values_predicate(
         self,
         template_processor: BaseTemplateProcessor | None = None,
@@ -1832,6 +1902,26 @@ class SqlaTable(
             .one()
         )
 
+    @classmethod
+    def get_eager_sqlatable_datasources(
+        cls, datasource_ids: list[int]
+    ) -> list[SqlaTable]:
+        """
+        Returns SqlaTables with their columns, metrics, database and owners, loaded
+        in a few queries rather than a few per dataset.
+        """
+        return (
+            db.session.query(cls)
+            .options(
+                sa.orm.subqueryload(cls.columns),
+                sa.orm.subqueryload(cls.metrics),
+                sa.orm.subqueryload(cls.owners),
+                sa.orm.joinedload(cls.database),
+            )
+            .filter(cls.id.in_(datasource_ids))
+            .all()
+        )
+
     @classmethod
     def get_all_datasources(cls) -> list[SqlaTable]:
         qry = db.session.query(cls)
@@ -2016,3 +2106,15 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+
+# invalidate the cached RLS filters, deleted roles and datasets being removed from them
+rls_filters_after_change = security_manager.rls_filters_after_change
+sa.event.listen(RowLevelSecurityFilter, "after_insert", rls_filters_after_change)
+sa.event.listen(RowLevelSecurityFilter, "after_update", rls_filters_after_change)
+sa.event.listen(RowLevelSecurityFilter, "after_delete", rls_filters_after_change)
+sa.event.listen(security_manager.role_model, "after_delete", rls_filters_after_change)
+sa.event.listen(SqlaTable, "after_delete", rls_filters_after_change)
+sa.event.listen(
+    Session, "after_commit", security_manager.invalidate_caches_after_commit
+)
@@ -160,6 +160,7 @@ MODEL_API_RW_METHOD_PERMISSION_MAP = {
     "samples": "read",
     "delete_ssh_tunnel": "write",
     "get_updated_since": "read",
+    "get_statuses": "read",
     "stop_query": "read",
     "get_user_slices": "read",
     "schemas_access_for_file_upload": "read",
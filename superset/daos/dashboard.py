@@ -23,6 +23,7 @@ from typing import Any, Dict, List
 
 from flask import g
 from flask_appbuilder.models.sqla.interface import SQLAInterface
+from sqlalchemy import and_, func
 
 from superset import is_feature_enabled, security_manager
 from superset.commands.dashboard.exceptions import (
@@ -32,11 +33,12 @@ from superset.commands.dashboard.exceptions import (
     DashboardUpdateFailedError,
 )
 from superset.daos.base import BaseDAO
+from superset.daos.datasource import DatasourceDAO
 from superset.dashboards.filters import DashboardAccessFilter, is_uuid
 from superset.exceptions import SupersetSecurityException
 from superset.extensions import db
 from superset.models.core import FavStar, FavStarClassName
-from superset.models.dashboard import Dashboard, id_or_slug_filter
+from superset.models.dashboard import Dashboard, dashboard_slices, id_or_slug_filter
 from superset.models.embedded_dashboard import EmbeddedDashboard
 from superset.models.slice import Slice
 from superset.utils import json
@@ -92,8 +94,14 @@ class DashboardDAO(BaseDAO[Dashboard]):
         return dashboard
 
     @staticmethod
-    def get_datasets_for_dashboard(id_or_slug: str) -> list[Any]:
-        dashboard = DashboardDAO.get_by_id_or_slug(id_or_slug)
+    def get_datasets_for_dashboard(
+        id_or_slug_or_dashboard: str | Dashboard,
+    ) -> list[Any]:
+        dashboard = (
+            DashboardDAO.get_by_id_or_slug(id_or_slug_or_dashboard)
+            if isinstance(id_or_slug_or_dashboard, str)
+            else id_or_slug_or_dashboard
+        )
         return dashboard.datasets_trimmed_for_slices()
 
     @staticmethod
@@ -102,8 +110,15 @@ class DashboardDAO(BaseDAO[Dashboard]):
         return dashboard.tabs
 
     @staticmethod
-    def get_charts_for_dashboard(id_or_slug: str) -> list[Slice]:
-        return DashboardDAO.get_by_id_or_slug(id_or_slug).slices
+    def get_charts_for_dashboard(
+        id_or_slug_or_dashboard: str | Dashboard,
+    ) -> list[Slice]:
+        dashboard = (
+            DashboardDAO.get_by_id_or_slug(id_or_slug_or_dashboard)
+            if isinstance(id_or_slug_or_dashboard, str)
+            else id_or_slug_or_dashboard
+        )
+        return dashboard.slices
 
     @staticmethod
     def get_dashboard_changed_on(id_or_slug_or_dashboard: str | Dashboard) -> datetime:
@@ -130,6 +145,8 @@ class DashboardDAO(BaseDAO[Dashboard]):
         Get latest changed datetime for a dashboard. The change could be a dashboard
         metadata change, or a change to one of its dependent slices.
 
+        The slices are not loaded, their latest change is queried in SQL.
+
         :param id_or_slug_or_dashboard: A dashboard or the ID or slug of the dashboard.
         :returns: The datetime the dashboard was last changed.
         """
@@ -140,11 +157,12 @@ class DashboardDAO(BaseDAO[Dashboard]):
             else id_or_slug_or_dashboard
         )
         dashboard_changed_on = DashboardDAO.get_dashboard_changed_on(dashboard)
-        slices = dashboard.slices
-        slices_changed_on = max(
-            [slc.changed_on for slc in slices]
-            + ([datetime.fromtimestamp(0)] if len(slices) == 0 else [])
-        )
+        slices_changed_on = (
+            db.session.query(func.max(Slice.changed_on))
+            .join(dashboard_slices, dashboard_slices.c.slice_id == Slice.id)
+            .filter(dashboard_slices.c.dashboard_id == dashboard.id)
+            .scalar()
+        ) or datetime.fromtimestamp(0)
         # drop microseconds in datetime to match with last_modified header
         return max(dashboard_changed_on, slices_changed_on).replace(microsecond=0)
 
@@ -156,20 +174,36 @@ class DashboardDAO(BaseDAO[Dashboard]):
         Get latest changed datetime for a dashboard. The change could be a dashboard
         metadata change, a change to one of its dependent datasets.
 
+        The slices and datasets are not loaded, the latest change of the datasets of
+        each type is queried at once in SQL.
+
         :param id_or_slug_or_dashboard: A dashboard or the ID or slug of the dashboard.
         :returns: The datetime the dashboard was last changed.
         """
-
         dashboard = (
             DashboardDAO.get_by_id_or_slug(id_or_slug_or_dashboard)
             if isinstance(id_or_slug_or_dashboard, str)
             else id_or_slug_or_dashboard
         )
         dashboard_changed_on = DashboardDAO.get_dashboard_changed_on(dashboard)
-        datasources = dashboard.datasources
+        models = DatasourceDAO.sources
+        query = (
+            db.session.query(*[func.max(model.changed_on) for model in models.values()])
+            .select_from(dashboard_slices)
+            .join(Slice, dashboard_slices.c.slice_id == Slice.id)
+            .filter(dashboard_slices.c.dashboard_id == dashboard.id)
+        )
+        for datasource_type, model in models.items():
+            query = query.outerjoin(
+                model,
+                and_(
+                    model.id == Slice.datasource_id,
+                    Slice.datasource_type == datasource_type,
+                ),
+            )
         datasources_changed_on = max(
-            [datasource.changed_on for datasource in datasources]
-            + ([datetime.fromtimestamp(0)] if len(datasources) == 0 else [])
+            [changed_on for changed_on in query.one() if changed_on]
+            or [datetime.fromtimestamp(0)]
         )
         # drop microseconds in datetime to match with last_modified header
         return max(dashboard_changed_on, datasources_changed_on).replace(microsecond=0)
@@ -16,18 +16,21 @@
 # under the License.
 import logging
 from datetime import datetime
-from typing import Any, Union
+from typing import Any, Optional, Union
+
+from flask import current_app as app
+from sqlalchemy.orm import load_only
 
 from superset import sql_lab
 from superset.common.db_query_status import QueryStatus
 from superset.daos.base import BaseDAO
 from superset.exceptions import QueryNotFoundException, SupersetCancelQueryException
-from superset.extensions import db
+from superset.extensions import cache_manager, db
 from superset.models.sql_lab import Query, SavedQuery
 from superset.queries.filters import QueryFilter
 from superset.queries.saved_queries.filters import SavedQueryFilter
 from superset.utils.core import get_user_id
-from superset.utils.dates import now_as_float
+from superset.utils.dates import datetime_to_epoch, now_as_float
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +59,63 @@ class QueryDAO(BaseDAO[Query]):
             .all()
         )
 
+    @staticmethod
+    def get_query_statuses(
+        last_updated_ms: Union[float, int],
+        client_ids: Optional[list[str]] = None,
+    ) -> tuple[list[dict[str, Any]], float]:
+        """
+        Return the statuses of the queries of the current user that changed after a
+        watermark, and the watermark of the next poll.
+
+        The statuses are cached for `SQLLAB_QUERY_STATUS_CACHE_TIMEOUT` seconds, and
+        reused by the polls whose watermark they cover, so that the metadata database
+        is queried about once per period for each user, whatever the number of SQL Lab
+        tabs and windows polling it.
+
+        :param last_updated_ms: The watermark, in milliseconds since the epoch
+        :param client_ids: The client IDs of the queries, all the queries if not set
+        :returns: The statuses of the queries, and the watermark of the next poll
+        """
+        cache_key = f"sqllab_query_status_{get_user_id()}"
+        cache_timeout = app.config["SQLLAB_QUERY_STATUS_CACHE_TIMEOUT"]
+        snapshot = cache_manager.cache.get(cache_key) if cache_timeout else None
+        if not snapshot or snapshot["since"] > last_updated_ms:
+            snapshot = QueryDAO._get_query_statuses_snapshot(last_updated_ms)
+            if cache_timeout:
+                cache_manager.cache.set(cache_key, snapshot, timeout=cache_timeout)
+
+        statuses = [
+            status
+            for changed_on, status in snapshot["statuses"]
+            if changed_on >= last_updated_ms
+            and (client_ids is None or status["id"] in client_ids)
+        ]
+        return statuses, snapshot["until"]
+
+    @staticmethod
+    def _get_query_statuses_snapshot(since_ms: Union[float, int]) -> dict[str, Any]:
+        # the watermark is taken before querying, so that the changes committed while
+        # querying are returned by the next poll
+        until_ms = now_as_float()
+        queries = (
+            db.session.query(Query)
+            .options(load_only(*Query.status_columns))
+            .filter(
+                Query.user_id == get_user_id(),
+                Query.changed_on >= datetime.utcfromtimestamp(since_ms / 1000),
+            )
+            .all()
+        )
+        return {
+            "since": since_ms,
+            "until": until_ms,
+            "statuses": [
+                (datetime_to_epoch(query.changed_on), query.to_status_dict())
+                for query in queries
+            ],
+        }
+
     @staticmethod
     def stop_query(client_id: str) -> None:
         query = db.session.query(Query).filter_by(client_id=client_id).one_or_none()
@@ -22,7 +22,16 @@ from io import BytesIO
 from typing import Any, Callable, cast
 from zipfile import is_zipfile, ZipFile
 
-from flask import current_app, g, redirect, request, Response, send_file, url_for
+from flask import (
+    current_app,
+    g,
+    make_response,
+    redirect,
+    request,
+    Response,
+    send_file,
+    url_for,
+)
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -102,7 +111,7 @@ from superset.dashboards.schemas import (
     thumbnail_query_schema,
 )
 from superset.exceptions import ScreenshotImageNotAvailableException
-from superset.extensions import event_logger
+from superset.extensions import cache_manager, event_logger, security_manager
 from superset.models.dashboard import Dashboard
 from superset.models.embedded_dashboard import EmbeddedDashboard
 from superset.security.guest_token import GuestUser
@@ -114,6 +123,7 @@ from superset.tasks.utils import get_current_user
 from superset.utils import json
 from superset.utils.core import parse_boolean_string
 from superset.utils.file import get_filename
+from superset.utils.hashing import md5_sha_from_str
 from superset.utils.pdf import build_pdf_from_screenshots
 from superset.utils.screenshots import (
     DashboardScreenshot,
@@ -148,10 +158,12 @@ def with_dashboard(
     Responds with 403 or 404 without calling the route, if necessary.
     """
 
-    def wraps(self: BaseSupersetModelRestApi, id_or_slug: str) -> Response:
+    def wraps(
+        self: BaseSupersetModelRestApi, id_or_slug: str, **kwargs: Any
+    ) -> Response:
         try:
             dash = DashboardDAO.get_by_id_or_slug(id_or_slug)
-            return f(self, dash)
+            return f(self, dash, **kwargs)
         except DashboardAccessDeniedError:
             return self.response_403()
         except DashboardNotFoundError:
@@ -160,6 +172,79 @@ def with_dashboard(
     return functools.update_wrapper(wraps, f)
 
 
+def with_dashboard_payload_cache(
+    *get_changed_on: Callable[[Dashboard], datetime],
+) -> Callable[
+    [Callable[[BaseSupersetModelRestApi, Dashboard], Response]],
+    Callable[[BaseSupersetModelRestApi, str], Response],
+]:
+    """
+    A decorator that looks up the dashboard like `with_dashboard`, and caches the
+    payload of the api for `DASHBOARD_PAYLOAD_CACHE_TIMEOUT` seconds.
+
+    The payload is cached under a version made of the times the dashboard and what
+    the payload depends on last changed, as returned by `get_changed_on`, and of the
+    permissions of the user. The version is the ETag of the response, so conditional
+    requests are answered with a 304 without calling the api.
+
+    When the api logs its events with `log_this_with_extra_payload`, the logger must
+    be applied on top of this decorator, so that the responses not calling the api
+    are logged too.
+    """
+
+    def decorator(
+        f: Callable[[BaseSupersetModelRestApi, Dashboard], Response],
+    ) -> Callable[[BaseSupersetModelRestApi, str], Response]:
+        def wraps(
+            self: BaseSupersetModelRestApi, dash: Dashboard, **kwargs: Any
+        ) -> Response:
+            if add_extra_log_payload := kwargs.get("add_extra_log_payload"):
+                add_extra_log_payload(
+                    dashboard_id=dash.id,
+                    action=f"{self.__class__.__name__}.{f.__name__}",
+                )
+            version = md5_sha_from_str(
+                json.dumps(
+                    [
+                        f.__name__,
+                        dash.id,
+                        [get(dash).isoformat() for get in get_changed_on],
+                        security_manager.get_permissions_fingerprint(),
+                        current_app.config["VERSION_STRING"],
+                        current_app.config["VERSION_SHA"],
+                    ]
+                )
+            )
+            if request.if_none_match.contains(version):
+                response = make_response("", 304)
+                response.set_etag(version)
+                return response
+
+            timeout = current_app.config["DASHBOARD_PAYLOAD_CACHE_TIMEOUT"]
+            cache_key = f"dashboard_payload_{version}"
+            payload = cache_manager.cache.get(cache_key) if timeout else None
+            if payload is None:
+                response = f(self, dash, **kwargs)
+                if response.status_code != 200:
+                    return response
+                if timeout:
+                    cache_manager.cache.set(
+                        cache_key, response.get_data(), timeout=timeout
+                    )
+            else:
+                response = make_response(payload, 200)
+                response.headers["Content-Type"] = "application/json; charset=utf-8"
+
+            # the browser may store the payload, but must revalidate it
+            response.set_etag(version)
+            response.cache_control.no_cache = True
+            return response
+
+        return with_dashboard(functools.update_wrapper(wraps, f))
+
+    return decorator
+
+
 # pylint: disable=too-many-public-methods
 class DashboardRestApi(BaseSupersetModelRestApi):
     datamodel = SQLAInterface(Dashboard)
@@ -340,8 +425,8 @@ class DashboardRestApi(BaseSupersetModelRestApi):
     @protect()
     @safe
     @statsd_metrics
-    @with_dashboard
     @event_logger.log_this_with_extra_payload
+    @with_dashboard_payload_cache(DashboardDAO.get_dashboard_and_slices_changed_on)
     # pylint: disable=arguments-differ,arguments-renamed
     def get(
         self,
@@ -391,7 +476,11 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.get_datasets",
         log_to_statsd=False,
     )
-    def get_datasets(self, id_or_slug: str) -> Response:
+    @with_dashboard_payload_cache(
+        DashboardDAO.get_dashboard_and_slices_changed_on,
+        DashboardDAO.get_dashboard_and_datasets_changed_on,
+    )
+    def get_datasets(self, dash: Dashboard) -> Response:
         """Get dashboard's datasets.
         ---
         get:
@@ -427,7 +516,7 @@ class DashboardRestApi(BaseSupersetModelRestApi):
               $ref: '#/components/responses/404'
         """
         try:
-            datasets = DashboardDAO.get_datasets_for_dashboard(id_or_slug)
+            datasets = DashboardDAO.get_datasets_for_dashboard(dash)
             result = [
                 self.dashboard_dataset_schema.dump(dataset) for dataset in datasets
             ]
@@ -505,7 +594,8 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.get_charts",
         log_to_statsd=False,
     )
-    def get_charts(self, id_or_slug: str) -> Response:
+    @with_dashboard_payload_cache(DashboardDAO.get_dashboard_and_slices_changed_on)
+    def get_charts(self, dash: Dashboard) -> Response:
         """Get a dashboard's chart definitions.
         ---
         get:
@@ -536,14 +626,9 @@ class DashboardRestApi(BaseSupersetModelRestApi):
             404:
               $ref: '#/components/responses/404'
         """
-        try:
-            charts = DashboardDAO.get_charts_for_dashboard(id_or_slug)
-            result = [self.chart_entity_response_schema.dump(chart) for chart in charts]
-            return self.response(200, result=result)
-        except DashboardAccessDeniedError:
-            return self.response_403()
-        except DashboardNotFoundError:
-            return self.response_404()
+        charts = DashboardDAO.get_charts_for_dashboard(dash)
+        result = [self.chart_entity_response_schema.dump(chart) for chart in charts]
+        return self.response(200, result=result)
 
     @expose("/", methods=("POST",))
     @protect()
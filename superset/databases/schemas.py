@@ -162,7 +162,10 @@ extra_description = markdown(
     "7. The ``disable_drill_to_detail`` field is a boolean specifying whether or not"
     "drill to detail is disabled for the database."
     "8. The ``allow_multi_catalog`` indicates if the database allows changing "
-    "the default catalog when running queries and creating datasets.",
+    "the default catalog when running queries and creating datasets.<br/>"
+    "9. The ``stale_cache_timeout`` is the number of seconds during which the "
+    "expired chart data of this database is still served while it is refreshed. "
+    "If unset, the ``DATA_CACHE_STALE_TIMEOUT`` setting is used.",
     True,
 )
 get_export_ids_schema = {"type": "array", "items": {"type": "integer"}}
@@ -834,6 +837,7 @@ class ImportV1DatabaseExtraSchema(Schema):
     per_user_caching = fields.Boolean(required=False)
     version = fields.String(required=False, allow_none=True)
     schema_options = fields.Dict(keys=fields.Str(), values=fields.Raw())
+    stale_cache_timeout = fields.Integer(required=False, allow_none=True)
 
 
 class ImportV1DatabaseSchema(Schema):
@@ -21,6 +21,7 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterator
 from datetime import datetime
 from inspect import signature
 from re import Match, Pattern
@@ -39,6 +40,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -72,6 +74,7 @@ from superset.sql.parse import (
     Table,
 )
 from superset.superset_typing import (
+    DbapiDescription,
     OAuth2ClientConfig,
     OAuth2State,
     OAuth2TokenResponse,
@@ -386,6 +389,9 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
 
     force_column_alias_quotes = False
     arraysize = 0
+    # The number of rows fetched at a time by `fetch_data_batches`, unless the engine
+    # spec sets an `arraysize`
+    fetch_batch_size = 10000
     max_column_name_length: int | None = None
     try_remove_schema_from_table_name = True  # pylint: disable=invalid-name
     run_multiple_statements_as_one = False
@@ -984,32 +990,129 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
-            return data
+            return cls.mutate_rows(data, cls.get_column_mutators(cursor.description))
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the results of a query in batches of rows, so that they can be processed
+        while the following rows are fetched, without holding all of them at once.
+
+        The first batch is always yielded, even when the query returns no rows. Engine
+        specs overriding `fetch_data` to post-process its rows, without overriding this
+        method as well, get all their rows in a single batch from `fetch_data`.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :param batch_size: The number of rows of each batch, defaults to `arraysize`
+            or `fetch_batch_size`
+        :return: Iterator of batches of rows
+        """
+        if not cls._fetches_data_in_batches():
+            yield cls.fetch_data(cursor, limit)
+            return
+
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        batch_size = batch_size or cls.arraysize or cls.fetch_batch_size
+        try:
+            if cls.limit_method == LimitMethod.FETCH_MANY and limit:
+                yield cursor.fetchmany(limit)
+                return
+
+            column_mutators = cls.get_column_mutators(cursor.description)
+            first = True
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if rows or first:
+                    yield cls.mutate_rows(rows, column_mutators)
+                if len(rows) < batch_size:
+                    return
+                first = False
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_arrow(  # pylint: disable=unused-argument
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+    ) -> pa.Table | None:
+        """
+        Fetch the results of a query as an Arrow table, for drivers that can return
+        them in the Arrow format natively, without building a Python object per value.
+
+        Returns None, without consuming the cursor, when the driver or the result
+        doesn't support it, in which case the rows are fetched with
+        `fetch_data_batches`. Only used when `DB_ARROW_FETCH` is enabled.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: The results as an Arrow table, or None
+        """
+        return None
+
+    @classmethod
+    def _fetches_data_in_batches(cls) -> bool:
+        """
+        Whether `fetch_data_batches` is at least as specialized as `fetch_data`.
+        """
+
+        def owner(name: str) -> type:
+            return next(klass for klass in cls.__mro__ if name in vars(klass))
+
+        return issubclass(owner("fetch_data_batches"), owner("fetch_data"))
+
+    @classmethod
+    def get_column_mutators(
+        cls,
+        description: DbapiDescription | None,
+    ) -> dict[int, Callable[[Any], Any]]:
+        """
+        Return the functions normalizing the values of the columns of a result, from
+        `column_type_mutators`, by column index.
+
+        :param description: The cursor description
+        :return: The mutator of each column having one
+        """
+        # The first two items in the description row are the column name and type.
+        return {
+            idx: func
+            for idx, row in enumerate(description or [])
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
+                )
+            )
+        }
+
+    @staticmethod
+    def mutate_rows(
+        rows: list[tuple[Any, ...]],
+        column_mutators: dict[int, Callable[[Any], Any]],
+    ) -> list[tuple[Any, ...]]:
+        """
+        Apply the column mutators to rows, one column at a time.
+
+        :param rows: The rows returned by the cursor
+        :param column_mutators: The mutator of each column having one
+        :return: The mutated rows
+        """
+        if not column_mutators or not rows:
+            return rows
+
+        columns = list(zip(*rows, strict=False))
+        for idx, func in column_mutators.items():
+            columns[idx] = tuple(map(func, columns[idx]))
+        return list(zip(*columns, strict=False))
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
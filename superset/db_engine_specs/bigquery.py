@@ -25,6 +25,7 @@ from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
 import pandas as pd
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -257,6 +258,22 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
             data = [r.values() for r in data]  # type: ignore
         return data
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        Download the results of the query job in the Arrow format, with the BigQuery
+        Storage API when `google-cloud-bigquery-storage` is installed.
+        """
+        # queries run without a job (e.g. short query optimized mode) aren't supported
+        query_job = getattr(cursor, "_query_job", None)
+        if query_job is None or not hasattr(query_job, "to_arrow"):
+            return None
+
+        try:
+            return query_job.to_arrow(create_bqstorage_client=True)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @staticmethod
     def _mutate_label(label: str) -> str:
         """
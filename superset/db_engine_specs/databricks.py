@@ -19,6 +19,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Callable, TYPE_CHECKING, TypedDict, Union
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -261,6 +262,19 @@ class DatabricksDynamicBaseEngineSpec(BasicParametersMixin, DatabricksBaseEngine
         "port": "port",
     }
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        The Databricks SQL connector fetches the results in the Arrow format.
+        """
+        if not hasattr(cursor, "fetchall_arrow"):
+            return None
+
+        try:
+            return cursor.fetchall_arrow()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @staticmethod
     def get_extra_params(
         database: Database, source: QuerySource | None = None
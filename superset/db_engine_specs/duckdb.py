@@ -22,6 +22,7 @@ from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask import current_app as app
@@ -294,6 +295,24 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
 
         return data
 
+    @classmethod
+    def fetch_arrow(cls, cursor: Any, limit: int | None = None) -> pa.Table | None:
+        """
+        DuckDB produces its results in the Arrow format natively.
+        """
+        if not hasattr(cursor, "fetch_arrow_table"):
+            return None
+
+        # like `fetch_data`, keep the description cleared by duckdb-engine
+        description = cursor.description
+        try:
+            table = cursor.fetch_arrow_table()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+        cursor.description = description
+
+        return table
+
     @classmethod
     def get_table_names(
         cls, database: Database, inspector: Inspector, schema: str | None
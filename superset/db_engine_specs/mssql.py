@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from re import Pattern
 from typing import Any, Optional
@@ -154,6 +155,19 @@ class MssqlEngineSpec(BaseEngineSpec):
         # Lists of `pyodbc.Row` need to be unpacked further
         return cls.pyodbc_rows_to_tuples(data)
 
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        if not cursor.description:
+            yield []
+            return
+        for data in super().fetch_data_batches(cursor, limit, batch_size):
+            yield cls.pyodbc_rows_to_tuples(data)
+
     @classmethod
     def extract_error_message(cls, ex: Exception) -> str:
         if str(ex).startswith("(8155,"):
@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Optional
 
@@ -79,3 +80,15 @@ class OracleEngineSpec(BaseEngineSpec):
         if not cursor.description:
             return []
         return super().fetch_data(cursor, limit)
+
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        if not cursor.description:
+            yield []
+            return
+        yield from super().fetch_data_batches(cursor, limit, batch_size)
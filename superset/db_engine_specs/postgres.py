@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING
@@ -182,6 +183,18 @@ class PostgresBaseEngineSpec(BaseEngineSpec):
             return []
         return super().fetch_data(cursor, limit)
 
+    @classmethod
+    def fetch_data_batches(
+        cls,
+        cursor: Any,
+        limit: int | None = None,
+        batch_size: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        if not cursor.description:
+            yield []
+            return
+        yield from super().fetch_data_batches(cursor, limit, batch_size)
+
     @classmethod
     def epoch_to_dttm(cls) -> str:
         return "(timestamp 'epoch' + {col} * interval '1 second')"
@@ -23,6 +23,7 @@ from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING, TypedDict
 from urllib import parse
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from cryptography.hazmat.backends import default_backend
@@ -254,6 +255,27 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
         extra["engine_params"] = engine_params
         database.extra = json.dumps(extra)
 
+    @classmethod
+    def fetch_arrow(
+        cls,
+        cursor: Any,
+        limit: Optional[int] = None,
+    ) -> Optional[pa.Table]:
+        """
+        The Snowflake connector downloads the results in the Arrow format.
+        """
+        if not hasattr(cursor, "fetch_arrow_all"):
+            return None
+
+        try:
+            # None when the query returns no rows
+            return cursor.fetch_arrow_all()
+        except Exception as ex:
+            # e.g. the results are in the JSON format, or pyarrow isn't installed
+            if type(ex).__name__ == "NotSupportedError":
+                return None
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @classmethod
     def get_cancel_query_id(cls, cursor: Any, query: Query) -> Optional[str]:
         """
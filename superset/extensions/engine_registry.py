@@ -0,0 +1,174 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Registry of the SQLAlchemy engines of the analytics databases.
+
+Creating an engine for every query means opening a new connection, with its network,
+TLS and authentication handshakes, every time. The registry keeps the engines, and
+their connection pools, for reuse by the following queries of the same process.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any, Callable, cast
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    Queue pool reporting the time spent waiting for a connection.
+    """
+
+    stats_logger: Any = None
+
+    def recreate(self) -> InstrumentedQueuePool:
+        pool = cast(InstrumentedQueuePool, super().recreate())
+        pool.stats_logger = self.stats_logger
+        return pool
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.stats_logger:
+                self.stats_logger.timing(
+                    "db_engine_pool_wait", (time.perf_counter() - start) * 1000
+                )
+
+
+@dataclass
+class _RegisteredEngine:
+    engine: Engine
+    database_id: int
+    last_used: float
+
+
+class EngineRegistry:
+    """
+    Process-wide registry of engines, keyed on everything that the connections of an
+    engine depend on: the database, its catalog and schema, the effective user, etc.
+
+    The registry is bounded: the least recently used engines are disposed when it's
+    full, and the engines that haven't been used for a while are disposed too.
+    """
+
+    def __init__(self) -> None:
+        self._engines: OrderedDict[Hashable, _RegisteredEngine] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def get(
+        self,
+        key: tuple[Any, ...],
+        create: Callable[[], Engine],
+        max_engines: int,
+        idle_timeout: float,
+    ) -> Engine:
+        """
+        Get the engine registered for a key, creating it when missing.
+
+        :param key: The key of the engine, starting with the database ID
+        :param create: Creates the engine
+        :param max_engines: The maximum number of engines of the registry
+        :param idle_timeout: The number of seconds after which unused engines are
+            disposed
+        :returns: The engine
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._check_pid()
+            disposed = self._evict_idle(now - idle_timeout)
+            if registered := self._engines.get(key):
+                registered.last_used = now
+                self._engines.move_to_end(key)
+                engine = registered.engine
+            else:
+                engine = create()
+                self._engines[key] = _RegisteredEngine(engine, key[0], now)
+                while len(self._engines) > max_engines:
+                    disposed.append(self._engines.popitem(last=False)[1].engine)
+
+        for old_engine in disposed:
+            old_engine.dispose()
+        return engine
+
+    def dispose(self, database_id: int | None = None) -> None:
+        """
+        Dispose the engines of a database, or all of them.
+
+        :param database_id: The ID of the database
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, registered in self._engines.items()
+                if database_id is None or registered.database_id == database_id
+            ]
+            disposed = [self._engines.pop(key).engine for key in keys]
+
+        for engine in disposed:
+            engine.dispose()
+
+    def _evict_idle(self, threshold: float) -> list[Engine]:
+        disposed = []
+        while self._engines:
+            key, registered = next(iter(self._engines.items()))
+            if registered.last_used > threshold:
+                break
+            del self._engines[key]
+            disposed.append(registered.engine)
+        return disposed
+
+    def _check_pid(self) -> None:
+        """
+        Forget the engines of the parent process after a fork, without closing their
+        connections, which are still used by the parent.
+        """
+        if self._pid != os.getpid():
+            for registered in self._engines.values():
+                registered.engine.dispose(close=False)
+            self._engines.clear()
+            self._pid = os.getpid()
+
+
+def instrument_engine(engine: Engine, stats_logger: Any) -> Engine:
+    """
+    Count the connections opened and checked out from the pool of an engine, and time
+    the checkouts of an `InstrumentedQueuePool`.
+    """
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.stats_logger = stats_logger
+
+    @event.listens_for(engine, "connect")
+    def on_connect(*args: Any) -> None:
+        stats_logger.incr("db_engine_pool_connect")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(*args: Any) -> None:
+        stats_logger.incr("db_engine_pool_checkout")
+
+    return engine
@@ -0,0 +1,343 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+In-process cache tier in front of a shared cache backend.
+
+The values read from or written to the shared backend (L2, e.g. Redis) are also kept
+in the memory of the process (L1), pickled, so that a worker serving the same key
+again doesn't need to fetch it over the network. The L1 tier is bounded in bytes,
+evicts the least recently used values first, and keeps values for a short time, as
+it can't see the changes made by other processes. Those changes can be propagated
+with a Redis pub/sub channel, on which the keys set or deleted by a process are
+published so that the other processes drop them.
+
+The values read from L2 are kept in L1 for no longer than they are left to live in
+L2, which is only known for the Redis and simple backends: the values read from the
+other backends are only kept in L1 when written by the process.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Collection, Optional
+
+from flask_caching import BaseCache
+
+from superset.utils import json
+
+logger = logging.getLogger(__name__)
+
+
+class TwoTierCache(BaseCache):
+    # pylint: disable=too-many-instance-attributes
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        backend: BaseCache,
+        name: str,
+        max_bytes: int,
+        timeout: int,
+        invalidation_channel: Optional[str] = None,
+        incr: Optional[Callable[[str], None]] = None,
+        excluded_keys: Collection[str] = (),
+    ) -> None:
+        """
+        :param backend: The shared cache backend (L2)
+        :param name: The name of the cache, used in the stats and the channel
+        :param max_bytes: The maximum size of the pickled values kept in memory
+        :param timeout: The maximum number of seconds a value is kept in memory
+        :param invalidation_channel: The Redis pub/sub channel of the invalidations
+        :param incr: Increments a stats counter, e.g. `STATS_LOGGER.incr`
+        :param excluded_keys: The keys never kept in memory
+        """
+        super().__init__(default_timeout=backend.default_timeout)
+        self.backend = backend
+        self.name = name
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.channel = (
+            f"{invalidation_channel}:{name}" if invalidation_channel else None
+        )
+        self.incr = incr or (lambda key: None)
+        self.excluded_keys = frozenset(excluded_keys)
+
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._instance = uuid.uuid4().hex
+        self._subscriber_pid: Optional[int] = None
+
+    # L1 tier
+
+    def _get_local(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, payload = entry
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                return False, None
+            self._entries.move_to_end(key)
+        return True, pickle.loads(payload)  # noqa: S301
+
+    def _set_local(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        if key in self.excluded_keys:
+            return
+        if timeout is None:
+            timeout = self.default_timeout
+        ttl = min(self.timeout, timeout) if timeout else self.timeout
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            logger.debug("Unable to keep %s in memory", key, exc_info=True)
+            self._drop_local(key)
+            return
+
+        with self._lock:
+            self._drop(key)
+            if len(payload) > self.max_bytes:
+                return
+            self._entries[key] = (time.monotonic() + ttl, payload)
+            self._size += len(payload)
+            while self._size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+
+    def _get_remaining_timeouts(self, keys: list[str]) -> list[Optional[float]]:
+        """
+        Return the number of seconds the keys are left to live in the backend, 0 for
+        the keys that don't expire, and None for the keys that are missing or whose
+        remaining time isn't known.
+        """
+        if isinstance(entries := getattr(self.backend, "_cache", None), dict):
+            # `SimpleCache` keeps the expiration time next to the values
+            now = time.time()
+            timeouts: list[Optional[float]] = []
+            for key in keys:
+                expires = entries.get(key, (None,))[0]
+                if expires is None or 0 < expires <= now:
+                    timeouts.append(None)
+                else:
+                    timeouts.append(expires - now if expires else 0)
+            return timeouts
+
+        client = getattr(self.backend, "_read_client", None)
+        if client is None or not hasattr(self.backend, "_get_prefix"):
+            return [None] * len(keys)
+        try:
+            prefix = self.backend._get_prefix()
+            pipe = client.pipeline(transaction=False)
+            for key in keys:
+                pipe.pttl(f"{prefix}{key}")
+            ttls = pipe.execute()
+        except Exception:  # pylint: disable=broad-except
+            logger.debug("Unable to read the TTL of the cached values", exc_info=True)
+            return [None] * len(keys)
+        # PTTL is -1 for the keys that don't expire, and -2 for the missing keys
+        return [0 if ttl == -1 else ttl / 1000 if ttl > 0 else None for ttl in ttls]
+
+    def _fill_local(self, items: dict[str, Any]) -> None:
+        """
+        Keep the values read from the backend in memory, for no longer than they are
+        left to live in the backend.
+        """
+        keys = [key for key in items if key not in self.excluded_keys]
+        if not keys:
+            return
+        for key, timeout in zip(keys, self._get_remaining_timeouts(keys), strict=True):
+            if timeout is not None:
+                self._set_local(key, items[key], timeout)
+
+    def _drop(self, key: str) -> None:
+        if entry := self._entries.pop(key, None):
+            self._size -= len(entry[1])
+
+    def _drop_local(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._drop(key)
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    # invalidation of the other processes
+
+    @property
+    def _origin(self) -> str:
+        # forked processes share the instance, but not the pid
+        return f"{self._instance}:{os.getpid()}"
+
+    def _publish(self, keys: Optional[list[str]]) -> None:
+        """
+        Publish the keys changed by this process, or None when the cache is cleared.
+        """
+        client = getattr(self.backend, "_write_client", None)
+        if not self.channel or client is None:
+            return
+        try:
+            client.publish(
+                self.channel, json.dumps({"origin": self._origin, "keys": keys})
+            )
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to publish cache invalidations", exc_info=True)
+
+    def _on_message(self, message: dict[str, Any]) -> None:
+        try:
+            payload = json.loads(message["data"])
+        except (TypeError, json.JSONDecodeError):
+            return
+        if payload.get("origin") == self._origin:
+            return
+        if payload.get("keys") is None:
+            self.clear_local()
+        else:
+            self._drop_local(*payload["keys"])
+
+    def _subscribe(self) -> None:
+        """
+        Listen to the invalidations in a thread of the current process, as the
+        threads of a parent process (e.g. a pre-forking server) aren't inherited.
+        """
+        client = getattr(self.backend, "_read_client", None)
+        if not self.channel or client is None or self._subscriber_pid == os.getpid():
+            return
+        with self._lock:
+            if self._subscriber_pid == os.getpid():
+                return
+            self._subscriber_pid = os.getpid()
+            # values cached before the fork may have been invalidated since
+            self._entries.clear()
+            self._size = 0
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: self._on_message})
+            pubsub.run_in_thread(sleep_time=1, daemon=True)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Unable to listen to cache invalidations", exc_info=True)
+
+    # BaseCache
+
+    def get(self, key: str) -> Any:
+        self._subscribe()
+        found, value = self._get_local(key)
+        if found:
+            self.incr(f"cache_{self.name}_l1_hit")
+            return value
+
+        self.incr(f"cache_{self.name}_l1_miss")
+        value = self.backend.get(key)
+        if value is None:
+            self.incr(f"cache_{self.name}_l2_miss")
+        else:
+            self.incr(f"cache_{self.name}_l2_hit")
+            self._fill_local({key: value})
+        return value
+
+    def get_many(self, *keys: str) -> list[Any]:
+        self._subscribe()
+        values: dict[str, Any] = {}
+        missing = []
+        for key in keys:
+            found, value = self._get_local(key)
+            if found:
+                self.incr(f"cache_{self.name}_l1_hit")
+                values[key] = value
+            else:
+                self.incr(f"cache_{self.name}_l1_miss")
+                missing.append(key)
+
+        if missing:
+            found_values = {}
+            for key, value in zip(
+                missing, self.backend.get_many(*missing), strict=True
+            ):
+                values[key] = value
+                if value is None:
+                    self.incr(f"cache_{self.name}_l2_miss")
+                else:
+                    self.incr(f"cache_{self.name}_l2_hit")
+                    found_values[key] = value
+            self._fill_local(found_values)
+
+        return [values[key] for key in keys]
+
+    def has(self, key: str) -> bool:
+        found, _ = self._get_local(key)
+        return found or self.backend.has(key)
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> Any:
+        result = self.backend.set(key, value, timeout)
+        if result:
+            self._set_local(key, value, timeout)
+        else:
+            self._drop_local(key)
+        self._publish([key])
+        return result
+
+    def set_many(
+        self, mapping: dict[str, Any], timeout: Optional[int] = None
+    ) -> list[Any]:
+        result = self.backend.set_many(mapping, timeout)
+        for key, value in mapping.items():
+            if key in result:
+                self._set_local(key, value, timeout)
+            else:
+                self._drop_local(key)
+        self._publish(list(mapping))
+        return result
+
+    def add(self, key: str, value: Any, timeout: Optional[int] = None) -> bool:
+        # only the shared backend knows whether the key exists
+        self._drop_local(key)
+        return self.backend.add(key, value, timeout)
+
+    def delete(self, key: str) -> bool:
+        self._drop_local(key)
+        result = self.backend.delete(key)
+        self._publish([key])
+        return result
+
+    def delete_many(self, *keys: str) -> Any:
+        self._drop_local(*keys)
+        result = self.backend.delete_many(*keys)
+        self._publish(list(keys))
+        return result
+
+    def clear(self) -> bool:
+        self.clear_local()
+        result = self.backend.clear()
+        self._publish(None)
+        return result
+
+    def inc(self, key: str, delta: int = 1) -> Optional[int]:
+        self._drop_local(key)
+        result = self.backend.inc(key, delta)
+        self._publish([key])
+        return result
+
+    def dec(self, key: str, delta: int = 1) -> Optional[int]:
+        self._drop_local(key)
+        result = self.backend.dec(key, delta)
+        self._publish([key])
+        return result
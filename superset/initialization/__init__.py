@@ -64,7 +64,7 @@ from superset.extensions import (
     talisman,
 )
 from superset.security import SupersetSecurityManager
-from superset.sql.parse import SQLGLOT_DIALECTS
+from superset.sql.parse import PARSE_CACHE, SQLGLOT_DIALECTS
 from superset.superset_typing import FlaskResponse
 from superset.utils.core import is_test, pessimistic_connection_handling
 from superset.utils.decorators import transaction
@@ -706,6 +706,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.configure_cache()
         self.set_db_default_isolation()
         self.configure_sqlglot_dialects()
+        self.configure_sql_parse_cache()
 
         with self.superset_app.app_context():
             self.init_app_in_ctx()
@@ -772,6 +773,12 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
 
         SQLGLOT_DIALECTS.update(extensions)
 
+    def configure_sql_parse_cache(self) -> None:
+        PARSE_CACHE.max_size = self.config["SQL_PARSE_CACHE_MAX_SIZE"]
+        PARSE_CACHE.on_lookup = lambda hit: stats_logger_manager.instance.incr(
+            "sql_parse_cache.hit" if hit else "sql_parse_cache.miss"
+        )
+
     @transaction()
     def configure_fab(self) -> None:
         if self.config["SILENCE_FAB"]:
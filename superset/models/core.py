@@ -25,6 +25,7 @@ import builtins
 import logging
 import textwrap
 from ast import literal_eval
+from collections.abc import Generator, Iterator
 from contextlib import closing, contextmanager, nullcontext, suppress
 from copy import deepcopy
 from datetime import datetime
@@ -57,7 +58,7 @@ from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
 
@@ -69,10 +70,15 @@ from superset.db_engine_specs.base import MetricType, TimeGrain
 from superset.extensions import (
     cache_manager,
     encrypted_field_factory,
+    engine_registry,
     event_logger,
     security_manager,
     ssh_manager_factory,
 )
+from superset.extensions.engine_registry import (
+    instrument_engine,
+    InstrumentedQueuePool,
+)
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin, UUIDMixin
 from superset.result_set import SupersetResultSet
 from superset.sql.parse import SQLScript, Table
@@ -84,6 +90,7 @@ from superset.superset_typing import (
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import get_query_source_from_request, get_username
+from superset.utils.hashing import md5_sha_from_str
 from superset.utils.oauth2 import (
     check_for_oauth2,
     get_oauth2_access_token,
@@ -340,6 +347,10 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
     def metadata_cache_timeout(self) -> dict[str, Any]:
         return self.get_extra().get("metadata_cache_timeout", {})
 
+    @property
+    def stale_cache_timeout(self) -> int | None:
+        return self.get_extra().get("stale_cache_timeout")
+
     @property
     def catalog_cache_enabled(self) -> bool:
         return "catalog_cache_timeout" in self.metadata_cache_timeout
@@ -475,6 +486,11 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                         nullpool=nullpool,
                         source=source,
                         sqlalchemy_uri=sqlalchemy_uri,
+                        # the tunnel is closed once the engine is no longer used
+                        reuse_engine=nullpool
+                        and not ssh_context
+                        and self.id is not None
+                        and app.config["DB_ENGINE_REGISTRY"],
                     )
 
     def _get_sqla_engine(  # pylint: disable=too-many-locals  # noqa: C901
@@ -484,7 +500,14 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        reuse_engine: bool = False,
     ) -> Engine:
+        """
+        Create the engine of the database.
+
+        :param reuse_engine: Get a pooled engine from the engine registry instead of
+            creating an engine without pool, see `DB_ENGINE_REGISTRY`
+        """
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
         )
@@ -492,7 +515,12 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         extra = self.get_extra(source)
         engine_kwargs = extra.get("engine_params", {})
-        if nullpool:
+        if reuse_engine:
+            engine_kwargs = {
+                **app.config["DB_ENGINE_REGISTRY_POOL_OPTIONS"],
+                **engine_kwargs,
+            }
+        elif nullpool:
             engine_kwargs["poolclass"] = NullPool
         connect_args = engine_kwargs.setdefault("connect_args", {})
 
@@ -545,10 +573,49 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 security_manager,
                 source,
             )
+
+        if not reuse_engine:
+            try:
+                return create_engine(sqlalchemy_url, **engine_kwargs)
+            except Exception as ex:
+                raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+
+        key = (
+            self.id,
+            catalog,
+            schema,
+            effective_username,
+            md5_sha_from_str(access_token) if access_token else None,
+            source,
+            # the URL and options may have been changed by the mutator
+            md5_sha_from_str(
+                sqlalchemy_url.render_as_string(hide_password=False)
+                + json.dumps(engine_kwargs, sort_keys=True, default=repr)
+            ),
+        )
+        return engine_registry.get(
+            key,
+            lambda: self._create_pooled_engine(sqlalchemy_url, engine_kwargs),
+            max_engines=app.config["DB_ENGINE_REGISTRY_MAX_ENGINES"],
+            idle_timeout=app.config["DB_ENGINE_REGISTRY_IDLE_TIMEOUT"],
+        )
+
+    def _create_pooled_engine(self, url: URL, engine_kwargs: dict[str, Any]) -> Engine:
+        """
+        Create an engine for the registry, reporting the activity of its pool.
+        """
+        stats_logger = app.config["STATS_LOGGER"]
+        if (
+            "poolclass" not in engine_kwargs
+            and "pool" not in engine_kwargs
+            and url.get_dialect().get_pool_class(url) is QueuePool
+        ):
+            engine_kwargs = {**engine_kwargs, "poolclass": InstrumentedQueuePool}
         try:
-            return create_engine(sqlalchemy_url, **engine_kwargs)
+            engine = create_engine(url, **engine_kwargs)
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
+        return instrument_engine(engine, stats_logger)
 
     def add_database_to_signature(
         self,
@@ -669,22 +736,24 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             )
         return sql_
 
-    def _execute_sql_with_mutation_and_logging(
+    @contextmanager
+    def _execute_script(
         self,
         sql: str,
         catalog: str | None = None,
         schema: str | None = None,
-        fetch_last_result: bool = False,
-    ) -> tuple[Any, list[tuple[Any, ...]] | None, DbapiDescription | None]:
+    ) -> Iterator[Any]:
         """
-        Internal method to execute SQL with mutation and logging.
+        Execute the statements of a SQL script with mutation and logging.
 
-        :param sql: SQL query to execute
+        The results of all the statements but the last one are consumed, and the
+        cursor is yielded right after executing the last statement, with its results
+        still pending.
+
+        :param sql: SQL script to execute
         :param catalog: Optional catalog name
         :param schema: Optional schema name
-        :param fetch_last_result: Whether to fetch results from last statement
-        :return: Tuple of (cursor, rows, description) where rows and description
-        are None if not fetching.
+        :return: The cursor of the last statement
         """
         script = SQLScript(sql, self.db_engine_spec.engine)
 
@@ -705,8 +774,6 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         with self.get_raw_connection(catalog=catalog, schema=schema) as conn:
             cursor = conn.cursor()
-            rows = None
-            description = None
 
             for i, statement in enumerate(script.statements):
                 sql_ = self.mutate_sql_based_on_config(
@@ -722,16 +789,39 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 ):
                     self.db_engine_spec.execute(cursor, sql_, self)
 
-                # Fetch results from last statement if requested
-                if fetch_last_result and i == len(script.statements) - 1:
-                    # Capture cursor.description while it's still valid
-                    description = cursor.description
-                    rows = self.db_engine_spec.fetch_data(cursor)
-                else:
+                if i < len(script.statements) - 1:
                     # Consume results without storing
                     cursor.fetchall()
 
-            return cursor, rows, description
+            yield cursor
+
+    def _execute_sql_with_mutation_and_logging(
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+        fetch_last_result: bool = False,
+    ) -> tuple[Any, SupersetResultSet | None]:
+        """
+        Internal method to execute SQL with mutation and logging.
+
+        :param sql: SQL query to execute
+        :param catalog: Optional catalog name
+        :param schema: Optional schema name
+        :param fetch_last_result: Whether to fetch results from last statement
+        :return: Tuple of (cursor, result_set) where result_set is None if not
+        fetching.
+        """
+        result_set = None
+
+        with self._execute_script(sql, catalog, schema) as cursor:
+            if fetch_last_result:
+                result_set = SupersetResultSet.from_cursor(cursor, self.db_engine_spec)
+            else:
+                # Consume results without storing
+                cursor.fetchall()
+
+        return cursor, result_set
 
     def execute_sql_statements(
         self,
@@ -767,19 +857,57 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         schema: str | None = None,
         mutator: Callable[[pd.DataFrame], None] | None = None,
     ) -> pd.DataFrame:
-        cursor, rows, description = self._execute_sql_with_mutation_and_logging(
+        _, result_set = self._execute_sql_with_mutation_and_logging(
             sql, catalog, schema, fetch_last_result=True
         )
 
         df = None
-        if rows is not None:
-            df = self.load_into_dataframe(description, rows)
+        if result_set is not None:
+            # logged like `load_into_dataframe`, which the rows used to go through
+            with event_logger.log_context(
+                action="load_into_dataframe",
+                object_ref="Database.load_into_dataframe",
+            ):
+                df = result_set.to_pandas_df()
 
         if mutator:
             df = mutator(df)
 
         return self.post_process_df(df)
 
+    def iter_df(
+        self,
+        sql: str,
+        catalog: str | None = None,
+        schema: str | None = None,
+        mutator: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+        chunk_size: int = 10000,
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Run a query and yield its results in DataFrames of at most `chunk_size` rows.
+
+        Unlike `get_df`, a DataFrame is yielded for every batch of rows fetched from
+        the cursor with `fetch_data_batches`, so the memory needed doesn't grow with
+        the size of the result. The first DataFrame is always yielded, even when the
+        query doesn't return any rows.
+
+        :param sql: SQL query to execute
+        :param catalog: Optional catalog name
+        :param schema: Optional schema name
+        :param mutator: Optional function applied to every DataFrame
+        :param chunk_size: The number of rows fetched at a time
+        """
+        with self._execute_script(sql, catalog, schema) as cursor:
+            description = cursor.description
+            for rows in self.db_engine_spec.fetch_data_batches(
+                cursor,
+                batch_size=chunk_size,
+            ):
+                df = self.load_into_dataframe(description, rows)
+                if mutator:
+                    df = mutator(df)
+                yield self.post_process_df(df)
+
     @event_logger.log_this
     def fetch_rows(self, cursor: Any, last: bool) -> list[tuple[Any, ...]] | None:
         if not last:
@@ -1304,6 +1432,31 @@ sqla.event.listen(Database, "after_insert", security_manager.database_after_inse
 sqla.event.listen(Database, "after_update", security_manager.database_after_update)
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
 
+# invalidate the cached permission indexes
+for model in (
+    security_manager.permission_model,
+    security_manager.viewmenu_model,
+    security_manager.permissionview_model,
+    security_manager.role_model,
+):
+    for event in ("after_insert", "after_update", "after_delete"):
+        sqla.event.listen(model, event, security_manager.permissions_after_change)
+
+
+def dispose_database_engines(
+    mapper: Any,  # pylint: disable=unused-argument
+    connection: Connection,  # pylint: disable=unused-argument
+    target: Database,
+) -> None:
+    """
+    Dispose the registered engines of a database updated or deleted.
+    """
+    engine_registry.dispose(target.id)
+
+
+sqla.event.listen(Database, "after_update", dispose_database_engines)
+sqla.event.listen(Database, "after_delete", dispose_database_engines)
+
 
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
     """
@@ -197,6 +197,41 @@ class Query(
             "extra": self.extra,
         }
 
+    # the columns of the status of a query, loaded when polling the running queries
+    status_columns = (
+        "client_id",
+        "id",
+        "status",
+        "progress",
+        "rows",
+        "limiting_factor",
+        "results_key",
+        "error_message",
+        "tracking_url_raw",
+        "end_time",
+        "extra_json",
+        "changed_on",
+    )
+
+    def to_status_dict(self) -> dict[str, Any]:
+        """
+        Return the status of the query, with the keys of `to_dict`.
+        """
+        return {
+            "changed_on": self.changed_on.isoformat(),
+            "endDttm": self.end_time,
+            "errorMessage": self.error_message,
+            "id": self.client_id,
+            "queryId": self.id,
+            "limitingFactor": self.limiting_factor,
+            "progress": self.progress,
+            "rows": self.rows,
+            "state": self.status.lower(),
+            "resultsKey": self.results_key,
+            "trackingUrl": self.tracking_url,
+            "extra": self.extra,
+        }
+
     @property
     def name(self) -> str:
         """Name property"""
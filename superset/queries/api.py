@@ -30,6 +30,7 @@ from superset.models.sql_lab import Query
 from superset.queries.filters import QueryFilter
 from superset.queries.schemas import (
     openapi_spec_methods_override,
+    queries_get_statuses_schema,
     queries_get_updated_since_schema,
     QuerySchema,
     StopQuerySchema,
@@ -62,10 +63,12 @@ class QueryRestApi(BaseSupersetModelRestApi):
         RouteMethod.DISTINCT,
         "stop_query",
         "get_updated_since",
+        "get_statuses",
     }
 
     apispec_parameter_schemas = {
         "queries_get_updated_since_schema": queries_get_updated_since_schema,
+        "queries_get_statuses_schema": queries_get_statuses_schema,
     }
 
     list_columns = [
@@ -222,6 +225,64 @@ class QueryRestApi(BaseSupersetModelRestApi):
         except SupersetException as ex:
             return self.response(ex.status, message=ex.message)
 
+    @expose("/status")
+    @protect()
+    @safe
+    @rison(queries_get_statuses_schema)
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}"
+        f".get_statuses",
+        log_to_statsd=False,
+    )
+    def get_statuses(self, **kwargs: Any) -> FlaskResponse:
+        """Get the statuses of the queries that changed after last_updated_ms.
+        ---
+        get:
+          summary: Get the statuses of the queries that changed after last_updated_ms
+          description: >-
+            Polls the statuses of many queries at once. The statuses are cached
+            for a short time, and the watermark returned is to be passed as
+            last_updated_ms by the next poll.
+          parameters:
+          - in: query
+            name: q
+            content:
+              application/json:
+                schema:
+                  $ref: '#/components/schemas/queries_get_statuses_schema'
+          responses:
+            200:
+              description: Query statuses
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        description: >-
+                          The statuses of the queries that changed after
+                          last_updated_ms
+                        type: array
+                        items:
+                          type: object
+                      last_updated_ms:
+                        description: The last_updated_ms of the next poll
+                        type: number
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        params = kwargs["rison"]
+        statuses, last_updated_ms = QueryDAO.get_query_statuses(
+            params["last_updated_ms"],
+            params.get("client_ids"),
+        )
+        return self.response(200, result=statuses, last_updated_ms=last_updated_ms)
+
     @expose("/stop", methods=("POST",))
     @protect()
     @safe
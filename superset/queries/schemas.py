@@ -41,6 +41,15 @@ queries_get_updated_since_schema = {
     "required": ["last_updated_ms"],
 }
 
+queries_get_statuses_schema = {
+    "type": "object",
+    "properties": {
+        "last_updated_ms": {"type": "number"},
+        "client_ids": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["last_updated_ms"],
+}
+
 
 class DatabaseSchema(Schema):
     database_name = fields.String()
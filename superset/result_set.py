@@ -18,11 +18,16 @@
 
 import datetime
 import logging
-from typing import Any, Optional
+import math
+from collections.abc import Callable, Iterable, Sequence
+from decimal import Decimal
+from itertools import chain
+from typing import Any, cast, Optional
 
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+from flask import current_app as app
 from numpy.typing import NDArray
 
 from superset.db_engine_specs import BaseEngineSpec
@@ -63,12 +68,25 @@ def stringify(obj: Any) -> str:
     return json.dumps(obj, default=json.json_iso_dttm_ser)
 
 
+# types whose values are stringified with `str`, which is what the numpy conversion
+# below does for them, without the overhead of going through numpy for every value
+SIMPLE_TYPES = (str, int, bool, datetime.datetime, datetime.date, datetime.time)
+
+
 def stringify_values(array: NDArray[Any]) -> NDArray[Any]:
     result = np.copy(array)
 
     with np.nditer(result, flags=["refs_ok"], op_flags=[["readwrite"]]) as it:
-        for obj in it:
-            if na_obj := pd.isna(obj):
+        # each element is a 0-dimensional view of the array
+        for obj in cast(Iterable[NDArray[Any]], it):
+            value = obj.item()
+            if type(value) in SIMPLE_TYPES:
+                obj[...] = str(value)
+            elif type(value) is float:
+                obj[...] = None if math.isnan(value) else str(value)
+            elif type(value) is Decimal and not value.is_nan():
+                obj[...] = str(value)
+            elif na_obj := pd.isna(obj):
                 # pandas <NA> type cannot be converted to string
                 obj[na_obj] = None
             else:
@@ -99,20 +117,109 @@ def convert_to_string(value: Any) -> str:
     return str(value)
 
 
+def to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+    """
+    Builds a 1-dimensional object array from a sequence of values, without unpacking
+    the values that are themselves sequences.
+    """
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def transpose_rows(data: DbapiResult, num_columns: int) -> list[Sequence[Any]]:
+    """
+    Transposes DB-API rows into a sequence of values per column, in a single pass.
+
+    :param data: The rows returned by the cursor
+    :param num_columns: The number of columns of the cursor description
+    :raises ValueError: If the rows don't have as many values as there are columns
+    """
+    if not data:
+        return [() for _ in range(num_columns)]
+
+    columns: list[Sequence[Any]] = list(zip(*data, strict=True))
+    if len(columns) != num_columns:
+        raise ValueError(
+            f"Expected rows of {num_columns} values, got rows of {len(columns)} values"
+        )
+    return columns
+
+
+def get_decimal_type(description: Sequence[Any]) -> Optional[pa.DataType]:
+    """
+    Returns the Arrow decimal type matching the precision and scale reported for a
+    column in the cursor description, if any.
+    """
+    precision, scale = (list(description[4:6]) + [None, None])[:2]
+    if (
+        isinstance(precision, int)
+        and isinstance(scale, int)
+        and 0 < precision <= 38
+        and 0 <= scale <= precision
+    ):
+        return pa.decimal128(precision, scale)
+    return None
+
+
+def values_to_arrow(values: Sequence[Any], description: Sequence[Any]) -> pa.Array:
+    """
+    Converts the values of a column to an Arrow array.
+
+    Inferring the precision and scale of decimal values is expensive, so they are taken
+    from the cursor description when the driver reports them.
+    """
+    if (decimal_type := get_decimal_type(description)) and isinstance(
+        next((value for value in values if value is not None), None), Decimal
+    ):
+        try:
+            return pa.array(values, type=decimal_type)
+        except (pa.lib.ArrowInvalid, pa.lib.ArrowTypeError):
+            # the values don't fit the reported type
+            pass
+
+    return pa.array(values)
+
+
+def concat_tables(tables: list[pa.Table]) -> pa.Table:
+    """
+    Concatenates the tables built from the batches of a result.
+
+    The type of a column can differ between batches, e.g. a column of nulls in one
+    batch and of integers in the next. Such types are promoted to a common type when
+    possible, and the columns are stringified otherwise.
+    """
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except (
+        pa.lib.ArrowInvalid,
+        pa.lib.ArrowTypeError,
+        pa.lib.ArrowNotImplementedError,
+    ):
+        pass
+
+    for i, name in enumerate(tables[0].column_names):
+        types = {
+            table.schema.field(i).type
+            for table in tables
+            if not pa.types.is_null(table.schema.field(i).type)
+        }
+        if len(types) > 1:
+            tables = [
+                table.set_column(i, name, table.column(i).cast(pa.string()))
+                for table in tables
+            ]
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals  # noqa: C901
+    def __init__(
         self,
         data: DbapiResult,
         cursor_description: DbapiDescription,
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
 
         if cursor_description:
             # get deduped list of column names
@@ -128,17 +235,165 @@ class SupersetResultSet:
                 )
             ]
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
+        self._column_names = column_names
+        self._deduped_cursor_desc = deduped_cursor_desc
+        self.table = self.rows_to_table(data or [], column_names, deduped_cursor_desc)
+        self._type_dict: dict[str, Any] = {}
+        try:
+            # The driver may not be passing a cursor.description
+            self._type_dict = {
+                col: db_engine_spec.get_datatype(deduped_cursor_desc[i][1])
+                for i, col in enumerate(column_names)
+                if deduped_cursor_desc
+            }
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.exception(ex)
+
+    @classmethod
+    def from_batches(
+        cls,
+        batches: Iterable[DbapiResult],
+        cursor_description: DbapiDescription,
+        db_engine_spec: type[BaseEngineSpec],
+        on_table: Optional[Callable[[pa.Table], None]] = None,
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from batches of rows, e.g. from `fetch_data_batches`.
+
+        Each batch is converted to Arrow as soon as it's fetched, so that only one
+        batch of Python rows is held at a time. The batches are then combined, and the
+        columns whose Arrow type differs between batches are promoted to a common type,
+        or stringified.
+
+        :param batches: The batches of rows returned by the cursor
+        :param cursor_description: The cursor description
+        :param db_engine_spec: The engine spec of the database
+        :param on_table: A function called with each batch, once converted to Arrow
+        :returns: The result set
+        """
+        result_set = cls([], cursor_description, db_engine_spec)
+        tables = []
+        for rows in batches:
+            if not rows:
+                continue
+            table = result_set.rows_to_table(
+                rows,
+                result_set._column_names,
+                result_set._deduped_cursor_desc,
+            )
+            if on_table:
+                on_table(table)
+            tables.append(table)
+        if tables:
+            result_set.table = concat_tables(tables)
+        return result_set
+
+    @classmethod
+    def from_arrow(
+        cls,
+        table: pa.Table,
+        cursor_description: DbapiDescription,
+        db_engine_spec: type[BaseEngineSpec],
+    ) -> "SupersetResultSet":
+        """
+        Build a result set from the Arrow table returned by a driver.
+
+        The columns are normalized like the ones converted from rows: dictionary
+        encoded columns are decoded and nested columns are stringified.
+
+        :param table: The results of the query
+        :param cursor_description: The cursor description
+        :param db_engine_spec: The engine spec of the database
+        :returns: The result set
+        """
+        if not cursor_description or len(cursor_description) != table.num_columns:
+            # the description of cursors not reporting column types, e.g. SQLite's
+            cursor_description = cast(
+                DbapiDescription,
+                [
+                    (name, None, None, None, None, None, None)
+                    for name in table.column_names
+                ],
+            )
+        result_set = cls([], cursor_description, db_engine_spec)
+
+        arrays = []
+        for array in table.columns:
+            if pa.types.is_dictionary(array.type):
+                array = array.cast(array.type.value_type)
+            if pa.types.is_large_string(array.type):
+                array = array.cast(pa.string())
+            elif pa.types.is_nested(array.type):
+                stringified_arr = stringify_values(to_object_array(array.to_pylist()))
+                array = pa.array(stringified_arr.tolist(), type=pa.string())
+            arrays.append(array)
+
+        if arrays:
+            result_set.table = pa.Table.from_arrays(
+                arrays,
+                names=result_set._column_names,
+            )
+        return result_set
 
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
+    @classmethod
+    def from_cursor(
+        cls,
+        cursor: Any,
+        db_engine_spec: type[BaseEngineSpec],
+        limit: Optional[int] = None,
+        on_table: Optional[Callable[[pa.Table], None]] = None,
+    ) -> "SupersetResultSet":
+        """
+        Fetch the results of a query into a result set.
+
+        When `DB_ARROW_FETCH` is enabled, the results are fetched in the Arrow format
+        from the drivers supporting it (see `BaseEngineSpec.fetch_arrow`). They are
+        fetched as batches of rows otherwise.
+
+        :param cursor: The cursor of the query
+        :param db_engine_spec: The engine spec of the database
+        :param limit: Maximum number of rows to be returned by the cursor
+        :param on_table: A function called with the rows fetched, as Arrow tables,
+            before the whole results are fetched
+        :returns: The result set
+        """
+        if (
+            app.config["DB_ARROW_FETCH"]
+            and (table := db_engine_spec.fetch_arrow(cursor, limit)) is not None
+        ):
+            if limit is not None:
+                table = table.slice(0, limit)
+            result_set = cls.from_arrow(table, cursor.description, db_engine_spec)
+            if on_table:
+                on_table(result_set.table)
+            return result_set
+
+        batches = db_engine_spec.fetch_data_batches(cursor, limit)
+        # some drivers only set the cursor description once rows are fetched
+        first_batch = next(batches, [])
+        return cls.from_batches(
+            chain([first_batch], batches),
+            cursor.description,
+            db_engine_spec,
+            on_table,
+        )
+
+    def rows_to_table(  # noqa: C901
+        self,
+        data: DbapiResult,
+        column_names: list[str],
+        deduped_cursor_desc: list[tuple[Any, ...]],
+    ) -> pa.Table:
+        pa_data: list[pa.Array] = []
+        stringified_arr: NDArray[Any]
+
+        # the values of each column are converted to Arrow straight from the rows, and
+        # only the columns that Arrow can't convert natively are stringified
+        columns = transpose_rows(data, len(column_names))
 
-        for column in column_names:
+        for values, description in zip(columns, deduped_cursor_desc, strict=False):
             try:
-                pa_data.append(pa.array(array[column].tolist()))
+                pa_data.append(values_to_arrow(values, description))
             except (
                 pa.lib.ArrowInvalid,
                 pa.lib.ArrowTypeError,
@@ -148,28 +403,28 @@ class SupersetResultSet:
                 # https://issues.apache.org/jira/browse/ARROW-7855
             ):
                 # attempt serialization of values as strings
-                stringified_arr = stringify_values(array[column])
+                stringified_arr = stringify_values(to_object_array(values))
                 pa_data.append(pa.array(stringified_arr.tolist()))
 
         if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
+            for i, values in enumerate(columns):
                 if pa.types.is_nested(pa_data[i].type):
                     # TODO: revisit nested column serialization once nested types
                     #  are added as a natively supported column type in Superset
                     #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
+                    stringified_arr = stringify_values(to_object_array(values))
                     pa_data[i] = pa.array(stringified_arr.tolist())
 
                 elif pa.types.is_temporal(pa_data[i].type):
                     # workaround for bug converting
                     # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
                     # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
+                    sample = self.first_nonempty(values)
                     if sample and isinstance(sample, datetime.datetime):
                         try:
                             if sample.tzinfo:
                                 tz = sample.tzinfo
-                                series = pd.Series(array[column])
+                                series = pd.Series(to_object_array(values))
                                 series = pd.to_datetime(series)
                                 pa_data[i] = pa.Array.from_pandas(
                                     series,
@@ -181,17 +436,7 @@ class SupersetResultSet:
         if not pa_data:
             column_names = []
 
-        self.table = pa.Table.from_arrays(pa_data, names=column_names)
-        self._type_dict: dict[str, Any] = {}
-        try:
-            # The driver may not be passing a cursor.description
-            self._type_dict = {
-                col: db_engine_spec.get_datatype(deduped_cursor_desc[i][1])
-                for i, col in enumerate(column_names)
-                if deduped_cursor_desc
-            }
-        except Exception as ex:  # pylint: disable=broad-except
-            logger.exception(ex)
+        return pa.Table.from_arrays(pa_data, names=column_names)
 
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
@@ -215,7 +460,7 @@ class SupersetResultSet:
             return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Sequence[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
@@ -20,18 +20,16 @@
 import logging
 import re
 import time
+import uuid
 from collections import defaultdict
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.apis import RoleApi, UserApi
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
-    assoc_group_role,
     assoc_permissionview_role,
-    assoc_user_group,
-    assoc_user_role,
     Permission,
     PermissionView,
     Role,
@@ -49,10 +47,8 @@ from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
 from sqlalchemy import and_, inspect, or_
 from sqlalchemy.engine.base import Connection
-from sqlalchemy.orm import eagerload
+from sqlalchemy.orm import eagerload, object_session, Session
 from sqlalchemy.orm.mapper import Mapper
-from sqlalchemy.orm.query import Query as SqlaQuery
-from sqlalchemy.sql import exists
 
 from superset.constants import RouteMethod
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -78,13 +74,13 @@ from superset.utils.core import (
     RowLevelSecurityFilterType,
 )
 from superset.utils.filters import get_dataset_access_filters
+from superset.utils.hashing import md5_sha_from_str
 from superset.utils.urls import get_url_host
 
 if TYPE_CHECKING:
     from superset.common.query_context import QueryContext
     from superset.connectors.sqla.models import (
         BaseDatasource,
-        RowLevelSecurityFilter,
         SqlaTable,
     )
     from superset.models.core import Database
@@ -109,6 +105,25 @@ class DatabaseCatalogSchema(NamedTuple):
     schema: str
 
 
+class RLSFilter(NamedTuple):
+    """
+    A row level security filter applying to a user and a table.
+    """
+
+    id: int
+    group_key: Optional[str]
+    clause: str
+
+
+# the keys of the versions of the RLS filters and the permission indexes cached, which
+# are changed to invalidate them, and are thus in the default `CACHE_L1_EXCLUDED_KEYS`
+RLS_FILTERS_VERSION_KEY = "rls_filters_version"
+PERMISSIONS_VERSION_KEY = "permissions_version"
+
+# the view menus of each permission granted to a set of roles
+PermissionIndex = dict[str, frozenset[str]]
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -252,6 +267,10 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
     role_api = SupersetRoleApi
     user_api = SupersetUserApi
 
+    # the permission indexes cached in the process, for a version of the permissions
+    _permission_indexes: dict[tuple[int, ...], PermissionIndex] = {}
+    _permission_indexes_version: Optional[str] = None
+
     USER_MODEL_VIEWS = {
         "RegisterUserModelView",
         "UserDBModelView",
@@ -839,46 +858,183 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
 
         return True
 
+    @staticmethod
+    def _get_cache_version(key: str) -> Optional[str]:
+        """
+        Return the version of entries cached in the cache configured by
+        `CACHE_CONFIG`, or None if the cache doesn't hold it.
+
+        :param key: The key of the version
+        :returns: The version
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        version = cache_manager.cache.get(key)
+        if version is None:
+            # a new version, since the entries cached may be stale if the version was
+            # evicted from the cache
+            cache_manager.cache.add(key, uuid.uuid4().hex, timeout=0)
+            version = cache_manager.cache.get(key)
+        return version
+
+    @staticmethod
+    def _bump_cache_version(key: str) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache_manager.cache.set(key, uuid.uuid4().hex, timeout=0)
+
+    def get_permission_index(self, role_ids: tuple[int, ...]) -> PermissionIndex:
+        """
+        Return the view menus of each permission granted to a set of roles.
+
+        The index is built once per request for each set of roles, and cached in the
+        process and in the cache configured by `CACHE_CONFIG` for
+        `PERMISSIONS_CACHE_TIMEOUT` seconds, until the permissions or the roles change
+        (see `permissions_after_change`).
+
+        :param role_ids: The sorted IDs of the roles
+        :returns: The view menu names of each permission name
+        """
+        indexes: dict[tuple[int, ...], PermissionIndex] = g.setdefault(
+            "permission_indexes", {}
+        )
+        if role_ids not in indexes:
+            indexes[role_ids] = self._get_cached_permission_index(role_ids)
+        return indexes[role_ids]
+
+    def _get_cached_permission_index(
+        self,
+        role_ids: tuple[int, ...],
+    ) -> PermissionIndex:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        timeout = get_conf()["PERMISSIONS_CACHE_TIMEOUT"]
+        version = self._get_cache_version(PERMISSIONS_VERSION_KEY) if timeout else None
+        if version is None:
+            return self._query_permission_index(role_ids)
+
+        # the indexes cached in the process are only kept for the current version
+        if version != self._permission_indexes_version:
+            self._permission_indexes = {}
+            self._permission_indexes_version = version
+
+        if (index := self._permission_indexes.get(role_ids)) is None:
+            roles = ",".join(str(role_id) for role_id in role_ids)
+            cache_key = f"permission_index_{version}_{md5_sha_from_str(roles)}"
+            index = cache_manager.cache.get(cache_key)
+            if index is None:
+                index = self._query_permission_index(role_ids)
+                cache_manager.cache.set(cache_key, index, timeout=timeout)
+            self._permission_indexes[role_ids] = index
+        return index
+
+    def _query_permission_index(self, role_ids: tuple[int, ...]) -> PermissionIndex:
+        if not role_ids:
+            return {}
+
+        permissions = (
+            self.session.query(self.permission_model.name, self.viewmenu_model.name)
+            .join(
+                self.permissionview_model,
+                self.permissionview_model.permission_id == self.permission_model.id,
+            )
+            .join(
+                self.viewmenu_model,
+                self.permissionview_model.view_menu_id == self.viewmenu_model.id,
+            )
+            .join(
+                assoc_permissionview_role,
+                assoc_permissionview_role.c.permission_view_id
+                == self.permissionview_model.id,
+            )
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+            .distinct()
+        )
+        index = defaultdict(set)
+        for permission_name, view_menu_name in permissions:
+            index[permission_name].add(view_menu_name)
+        return {name: frozenset(view_menus) for name, view_menus in index.items()}
+
+    def invalidate_permissions(self) -> None:
+        """
+        Invalidate the permission indexes cached by all the processes.
+        """
+        self._bump_cache_version(PERMISSIONS_VERSION_KEY)
+        if has_app_context():
+            g.pop("permission_indexes", None)
+
+    def permissions_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Model,
+    ) -> None:
+        """
+        Invalidate the cached permission indexes when a permission, a view menu, a
+        permission view or a role changes.
+
+        Triggered by SQLAlchemy after_insert, after_update and after_delete events, and
+        by the hooks of the permission views and view menus changed by the security
+        manager itself. The indexes are invalidated again once the change is committed
+        (see `invalidate_caches_after_commit`).
+
+        :param mapper: The SQLA mapper
+        :param connection: The SQLA connection
+        :param target: The changed model
+        """
+        self.invalidate_permissions()
+        if session := object_session(target):
+            session.info["invalidate_permissions"] = True
+
+    def _get_db_role_ids(self, user: Any) -> tuple[int, ...]:
+        return tuple(
+            sorted(
+                role.id
+                for role in self.get_user_roles(user)
+                if role is not None and role.name not in self.builtin_roles
+            )
+        )
+
+    def _has_view_access(
+        self,
+        user: object,
+        permission_name: str,
+        view_name: str,
+    ) -> bool:
+        roles = self.get_user_roles(user)
+
+        # First check against built-in roles (avoiding unnecessary lookups)
+        if any(
+            role.name in self.builtin_roles
+            and self._has_access_builtin_roles(role, permission_name, view_name)
+            for role in roles
+        ):
+            return True
+
+        role_ids = self._get_db_role_ids(user)
+        return view_name in self.get_permission_index(role_ids).get(permission_name, ())
+
     def user_view_menu_names(self, permission_name: str) -> set[str]:
-        base_query = (
-            self.session.query(self.viewmenu_model.name)
-            .join(self.permissionview_model)
-            .join(self.permission_model)
-            .join(assoc_permissionview_role)
-            .join(self.role_model)
-        )
-
-        if not g.user.is_anonymous:
-            user_id = get_user_id()
-
-            user_roles_filter = or_(
-                exists().where(
-                    (assoc_user_role.c.user_id == user_id)
-                    & (assoc_user_role.c.role_id == self.role_model.id)
-                    & (self.permission_model.name == permission_name)
-                ),
-                exists().where(
-                    (assoc_user_group.c.user_id == user_id)
-                    & (assoc_user_group.c.group_id == self.group_model.id)
-                    & (assoc_group_role.c.group_id == self.group_model.id)
-                    & (assoc_group_role.c.role_id == self.role_model.id)
-                    & (self.permission_model.name == permission_name)
-                ),
-            )
-
-            view_menu_names = base_query.filter(user_roles_filter).all()
-            return {s.name for s in view_menu_names}
-
-        # Properly treat anonymous user
-        if public_role := self.get_public_role():
-            # filter by public role
-            view_menu_names = (
-                base_query.filter(self.role_model.id == public_role.id).filter(
-                    self.permission_model.name == permission_name
-                )
-            ).all()
-            return {s.name for s in view_menu_names}
-        return set()
+        role_ids = self._get_db_role_ids(g.user)
+        return set(self.get_permission_index(role_ids).get(permission_name, ()))
+
+    def get_permissions_fingerprint(self) -> str:
+        """
+        Return a fingerprint of the permissions of the current user, which changes
+        when the user's roles or the permissions change.
+
+        Used to version the payloads cached for users sharing the same permissions.
+
+        :returns: The fingerprint
+        """
+        role_ids = sorted(
+            role.id for role in self.get_user_roles(g.user) if role is not None
+        )
+        version = self._get_cache_version(PERMISSIONS_VERSION_KEY)
+        return md5_sha_from_str(json.dumps([role_ids, self.is_guest_user(), version]))
 
     def get_accessible_databases(self) -> list[int]:
         """
@@ -1456,6 +1612,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         self._delete_vm_database_access(
             mapper, connection, target.id, target.database_name
         )
+        self.permissions_after_change(mapper, connection, target)
 
     def database_after_update(
         self,
@@ -1486,6 +1643,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             return
 
         old_database_name = history.deleted[0]
+        self.permissions_after_change(mapper, connection, target)
         # update database access permission
         self._update_vm_database_access(mapper, connection, old_database_name, target)
         # update datasource access
@@ -1768,6 +1926,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         self._delete_pvm_on_sqla_event(
             mapper, connection, "datasource_access", dataset_vm_name
         )
+        self.permissions_after_change(mapper, connection, target)
 
     def dataset_before_update(
         self,
@@ -1956,6 +2115,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             old_permission_name,
             new_permission_name,
         )
+        self.permissions_after_change(mapper, connection, target)
         from superset.connectors.sqla.models import (  # pylint: disable=import-outside-toplevel
             SqlaTable,
         )
@@ -2580,11 +2740,16 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
-    def get_rls_filters(self, table: "BaseDatasource") -> list[SqlaQuery]:
+    def get_rls_filters(self, table: "BaseDatasource") -> list[RLSFilter]:
         """
         Retrieves the appropriate row level security filters for the current user and
         the passed table.
 
+        The filters are resolved once per request for each set of roles and table, and
+        cached in the cache configured by `CACHE_CONFIG` for `RLS_FILTERS_CACHE_TIMEOUT`
+        seconds, until the RLS rules, the roles or the datasets change (see
+        `rls_filters_after_change`).
+
         :param table: The table to check against
         :returns: A list of filters
         """
@@ -2592,6 +2757,43 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        role_ids = tuple(sorted(role.id for role in self.get_user_roles(g.user)))
+        filters: dict[tuple[Any, ...], list[RLSFilter]] = g.setdefault(
+            "rls_filters", {}
+        )
+        if (role_ids, table.id) not in filters:
+            filters[(role_ids, table.id)] = self._get_cached_rls_filters(
+                role_ids, table.id
+            )
+
+        return list(filters[(role_ids, table.id)])
+
+    def _get_cached_rls_filters(
+        self,
+        role_ids: tuple[int, ...],
+        table_id: int,
+    ) -> list[RLSFilter]:
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        timeout = get_conf()["RLS_FILTERS_CACHE_TIMEOUT"]
+        version = self._get_cache_version(RLS_FILTERS_VERSION_KEY) if timeout else None
+        if version is None:
+            return self._query_rls_filters(role_ids, table_id)
+
+        roles = ",".join(str(role_id) for role_id in role_ids)
+        cache_key = f"rls_filters_{version}_{md5_sha_from_str(roles)}_{table_id}"
+        filters = cache_manager.cache.get(cache_key)
+        if filters is None:
+            filters = self._query_rls_filters(role_ids, table_id)
+            cache_manager.cache.set(cache_key, filters, timeout=timeout)
+        return filters
+
+    def _query_rls_filters(
+        self,
+        user_roles: tuple[int, ...],
+        table_id: int,
+    ) -> list[RLSFilter]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2599,7 +2801,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
@@ -2617,7 +2818,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             .filter(RLSFilterRoles.c.role_id.in_(user_roles))
         )
         filter_tables = self.session.query(RLSFilterTables.c.rls_filter_id).filter(
-            RLSFilterTables.c.table_id == table.id
+            RLSFilterTables.c.table_id == table_id
         )
         query = (
             self.session.query(
@@ -2641,9 +2842,53 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
                 )
             )
         )
-        return query.all()
+        return [RLSFilter(*row) for row in query.all()]
+
+    def invalidate_rls_filters(self) -> None:
+        """
+        Invalidate the RLS filters cached by all the processes.
+        """
+        self._bump_cache_version(RLS_FILTERS_VERSION_KEY)
+        if has_app_context():
+            g.pop("rls_filters", None)
+
+    def rls_filters_after_change(
+        self,
+        mapper: Mapper,
+        connection: Connection,
+        target: Model,
+    ) -> None:
+        """
+        Invalidate the cached RLS filters when a RLS rule, a role or a dataset changes.
+
+        Triggered by SQLAlchemy after_insert, after_update and after_delete events. The
+        filters are invalidated again once the change is committed (see
+        `invalidate_caches_after_commit`), so that the filters cached in the meantime
+        by other transactions are discarded too.
+
+        :param mapper: The SQLA mapper
+        :param connection: The SQLA connection
+        :param target: The changed RLS rule, role or dataset
+        """
+        self.invalidate_rls_filters()
+        if session := object_session(target):
+            session.info["invalidate_rls_filters"] = True
+
+    def invalidate_caches_after_commit(self, session: Session) -> None:
+        """
+        Invalidate the cached RLS filters and permission indexes when a change to them
+        is committed.
+
+        Triggered by SQLAlchemy after_commit events.
+
+        :param session: The SQLA session
+        """
+        if session.info.pop("invalidate_rls_filters", False):
+            self.invalidate_rls_filters()
+        if session.info.pop("invalidate_permissions", False):
+            self.invalidate_permissions()
 
-    def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
+    def get_rls_sorted(self, table: "BaseDatasource") -> list[RLSFilter]:
         """
         Retrieves a list RLS filters sorted by ID for
         the current user and the passed table.
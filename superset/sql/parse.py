@@ -21,10 +21,12 @@ import copy
 import enum
 import logging
 import re
+import threading
 import urllib.parse
+from collections import OrderedDict
 from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import Any, Generic, Optional, TYPE_CHECKING, TypeVar
+from typing import Any, Callable, Generic, Optional, TYPE_CHECKING, TypeVar
 
 import sqlglot
 from jinja2 import nodes, Template
@@ -527,6 +529,85 @@ class BaseSQLStatement(Generic[InternalRepresentation]):
         return self.format()
 
 
+class ParseCache:
+    """
+    A LRU cache of the statements parsed from SQL scripts, by script and engine.
+
+    The same script is parsed many times while a query is validated, secured, limited
+    and run, and parsing long scripts is slow. The ASTs of the cached statements are
+    shared with the statements returned by `SQLStatement.split_script`, which copy
+    them before modifying them (see `SQLStatement._mutable_ast`).
+
+    The memory of the cache is bounded by the total length of the scripts it holds,
+    `max_size` characters, a cache of size 0 being disabled. `on_lookup` is called
+    with whether each lookup is a hit, to report the hit rate.
+    """
+
+    def __init__(self, max_size: int = 2_000_000) -> None:
+        self.max_size = max_size
+        self.on_lookup: Callable[[bool], None] | None = None
+        self.hits = 0
+        self.misses = 0
+        self._size = 0
+        self._entries: OrderedDict[tuple[str, str], list[SQLStatement]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, script: str, engine: str) -> list[SQLStatement] | None:
+        if not self.max_size:
+            return None
+
+        key = (script, engine)
+        with self._lock:
+            statements = self._entries.get(key)
+            if statements is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+        if self.on_lookup:
+            self.on_lookup(statements is not None)
+        return statements
+
+    def set(self, script: str, engine: str, statements: list[SQLStatement]) -> None:
+        if len(script) > self.max_size:
+            return
+
+        key = (script, engine)
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = statements
+            self._size += len(script)
+            while self._size > self.max_size:
+                (evicted, _), _ = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = 0
+
+    def info(self) -> dict[str, Any]:
+        """
+        Return the statistics of the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "size": self._size,
+            "max_size": self.max_size,
+        }
+
+
+# the statements parsed by the process, configured by `SQL_PARSE_CACHE_MAX_SIZE`
+PARSE_CACHE = ParseCache()
+
+
 class SQLStatement(BaseSQLStatement[exp.Expression]):
     """
     A SQL statement.
@@ -541,8 +622,30 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         ast: exp.Expression | None = None,
     ):
         self._dialect = SQLGLOT_DIALECTS.get(engine)
+        # an AST parsed from a string is shared with the parse cache
+        self._shared = ast is None
         super().__init__(statement, engine, ast)
 
+    def _mutable_ast(self) -> exp.Expression:
+        """
+        Return the AST of the statement, to be modified inplace.
+
+        An AST shared with the parse cache is copied the first time it's modified.
+        """
+        if self._shared:
+            self._parsed = self._parsed.copy()
+            self._shared = False
+        return self._parsed
+
+    def _share(self) -> SQLStatement:
+        """
+        Return a copy of the statement sharing its AST.
+        """
+        statement = copy.copy(self)
+        statement._shared = True  # pylint: disable=protected-access
+        statement.tables = set(self.tables)
+        return statement
+
     @classmethod
     def _parse(cls, script: str, engine: str) -> list[exp.Expression]:
         """
@@ -589,9 +692,15 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         script: str,
         engine: str,
     ) -> list[SQLStatement]:
-        return [
-            cls(ast=ast, engine=engine) for ast in cls._parse(script, engine) if ast
-        ]
+        statements = PARSE_CACHE.get(script, engine)
+        if statements is None:
+            statements = [
+                cls(ast=ast, engine=engine) for ast in cls._parse(script, engine) if ast
+            ]
+            PARSE_CACHE.set(script, engine, statements)
+
+        # pylint: disable=protected-access
+        return [statement._share() for statement in statements]
 
     @classmethod
     def _parse_statement(
@@ -719,7 +828,7 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         if not self._dialect:
             return SQLStatement(ast=self._parsed.copy(), engine=self.engine)
 
-        optimized = pushdown_predicates(self._parsed, dialect=self._dialect)
+        optimized = pushdown_predicates(self._mutable_ast(), dialect=self._dialect)
 
         return SQLStatement(ast=optimized, engine=self.engine)
 
@@ -762,7 +871,7 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         Modify the `LIMIT` or `TOP` value of the SQL statement inplace.
         """
         if method == LimitMethod.FORCE_LIMIT:
-            self._parsed.args["limit"] = exp.Limit(
+            self._mutable_ast().args["limit"] = exp.Limit(
                 expression=exp.Literal(this=str(limit), is_string=False)
             )
         elif method == LimitMethod.WRAP_SQL:
@@ -795,8 +904,9 @@ class SQLStatement(BaseSQLStatement[exp.Expression]):
         :param alias: The alias to use for the CTE.
         :return: A new SQLStatement with the CTE.
         """
-        existing_ctes = self._parsed.args["with"].expressions if self.has_cte() else []
-        self._parsed.args["with"] = None
+        ast = self._mutable_ast()
+        existing_ctes = ast.args["with"].expressions if self.has_cte() else []
+        ast.args["with"] = None
         new_cte = exp.CTE(
             this=self._parsed.copy(),
             alias=exp.TableAlias(this=exp.Identifier(this=alias)),
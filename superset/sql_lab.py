@@ -21,11 +21,14 @@ import sys
 import uuid
 from contextlib import closing
 from datetime import datetime
+from functools import partial
 from sys import getsizeof
 from typing import Any, cast, Optional, TYPE_CHECKING, TypeVar, Union
 
 import backoff
 import msgpack
+import prison
+import pyarrow as pa
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app as app, has_app_context
 from flask_babel import gettext as __
@@ -37,6 +40,7 @@ from superset import (
     results_backend_use_msgpack,
     security_manager,
 )
+from superset.async_events.async_query_manager import AsyncQueryManager
 from superset.common.db_query_status import QueryStatus
 from superset.constants import QUERY_CANCEL_KEY, QUERY_EARLY_CANCEL_KEY
 from superset.dataframe import df_to_records
@@ -52,18 +56,19 @@ from superset.exceptions import (
     SupersetInvalidCVASException,
     SupersetResultsBackendNotConfigureException,
 )
-from superset.extensions import celery_app, event_logger
+from superset.extensions import async_query_manager, celery_app, event_logger
 from superset.models.sql_lab import Query
 from superset.result_set import SupersetResultSet
 from superset.sql.parse import BaseSQLStatement, CTASMethod, SQLScript, Table
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
-from superset.utils import json
-from superset.utils.core import (
-    override_user,
-    QuerySource,
-    zlib_compress,
+from superset.sqllab.result_storage import (
+    get_partial_results_key,
+    write_result_table,
 )
+from superset.sqllab.utils import check_payload_size, write_ipc_buffer
+from superset.utils import json
+from superset.utils.compression import compress
+from superset.utils.core import override_user, QuerySource
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
 from superset.utils.rls import apply_rls
@@ -72,7 +77,6 @@ if TYPE_CHECKING:
     from superset.models.core import Database
 
 logger = logging.getLogger(__name__)
-BYTES_IN_MB = 1024 * 1024
 
 
 class SqlLabException(Exception):  # noqa: N818
@@ -177,6 +181,7 @@ def get_sql_results(  # pylint: disable=too-many-arguments
     start_time: Optional[float] = None,
     expand_data: bool = False,
     log_params: Optional[dict[str, Any]] = None,
+    job_metadata: Optional[dict[str, Any]] = None,
 ) -> Optional[dict[str, Any]]:
     """Executes the sql query returns the results."""
     with app.test_request_context():
@@ -190,6 +195,7 @@ def get_sql_results(  # pylint: disable=too-many-arguments
                     start_time=start_time,
                     expand_data=expand_data,
                     log_params=log_params,
+                    job_metadata=job_metadata,
                 )
             except Exception as ex:  # pylint: disable=broad-except
                 logger.debug("Query %d: %s", query_id, ex)
@@ -246,10 +252,131 @@ def apply_limit(query: Query, parsed_statement: BaseSQLStatement[Any]) -> None:
         )
 
 
+class PartialResultsPublisher:
+    """
+    Store the first rows of an async query in the results backend while they are
+    being fetched, and notify the client through the async query event stream.
+
+    Each batch of rows is stored as a chunk, under a key derived from the results key
+    of the query, until `DISPLAY_MAX_ROW` rows are stored. The results key is assigned
+    before the query runs, so that the chunks can be loaded from the results endpoint
+    with the same permission checks as the final results.
+    """
+
+    def __init__(
+        self,
+        query: Query,
+        job_metadata: dict[str, Any],
+        cache_timeout: Optional[int],
+    ) -> None:
+        self.query = query
+        self.job_metadata = job_metadata
+        self.cache_timeout = cache_timeout
+        self.key = str(uuid.uuid4())
+        self.max_rows = app.config["DISPLAY_MAX_ROW"]
+        if query.limit is not None:
+            self.max_rows = min(self.max_rows, query.limit)
+        self.chunks = 0
+        self.rows = 0
+
+    def publish(self, table: pa.Table, cursor: Any) -> None:
+        """
+        Store a batch of rows fetched from the cursor and publish it.
+
+        Failing to publish partial results doesn't fail the query, whose results are
+        stored once it finishes: the next batches are simply not published.
+
+        :param table: The batch of rows
+        :param cursor: The cursor the rows were fetched from
+        """
+        if self.rows >= self.max_rows:
+            return
+
+        try:
+            self._publish(table.slice(0, self.max_rows - self.rows), cursor)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Query %d: Unable to publish partial results",
+                self.query.id,
+                exc_info=True,
+            )
+            self.max_rows = 0
+
+    def _publish(self, table: pa.Table, cursor: Any) -> None:
+        db_engine_spec = self.query.database.db_engine_spec
+        use_msgpack = cast(bool, results_backend_use_msgpack)
+        result_set = SupersetResultSet.from_arrow(
+            table, cursor.description, db_engine_spec
+        )
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(result_set, db_engine_spec, use_msgpack)
+        payload = {
+            "query_id": self.query.id,
+            "status": QueryStatus.RUNNING,
+            "data": data,
+            "columns": all_columns,
+            "selected_columns": selected_columns,
+            "expanded_columns": expanded_columns,
+            "query": self.query.to_dict(),
+        }
+
+        chunk = self.chunks
+        results_backend.set(
+            get_partial_results_key(self.key, chunk),
+            compress(
+                _serialize_payload(payload, use_msgpack),
+                app.config["RESULTS_BACKEND_COMPRESSION"],
+                **app.config["RESULTS_BACKEND_COMPRESSION_OPTIONS"],
+            ),
+            self.cache_timeout,
+        )
+        self.chunks += 1
+        self.rows += table.num_rows
+
+        self._update_job(
+            AsyncQueryManager.STATUS_RUNNING,
+            {"key": self.key, "chunk": chunk},
+            chunk=chunk,
+            rows=self.rows,
+        )
+
+    def done(self) -> None:
+        """
+        Publish that the whole results of the query are stored.
+        """
+        try:
+            self._update_job(
+                AsyncQueryManager.STATUS_DONE,
+                {"key": self.key},
+                rows=self.query.rows,
+            )
+        except Exception:  # pylint: disable=broad-except
+            logger.warning(
+                "Query %d: Unable to publish the end of the query",
+                self.query.id,
+                exc_info=True,
+            )
+
+    def _update_job(self, status: str, params: dict[str, Any], **kwargs: Any) -> None:
+        async_query_manager.update_job(
+            self.job_metadata,
+            status,
+            client_id=self.query.client_id,
+            results_key=self.key,
+            result_url=f"/api/v1/sqllab/results/?q={prison.dumps(params)}",
+            **kwargs,
+        )
+
+
 def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # noqa: C901
     query: Query,
     cursor: Any,
     log_params: Optional[dict[str, Any]] = None,
+    partial_results: Optional[PartialResultsPublisher] = None,
 ) -> SupersetResultSet:
     """Executes a single SQL statement"""
     database: Database = query.database
@@ -283,12 +410,21 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
                     str(query.to_dict()),
                 )
                 increased_limit = None if query.limit is None else query.limit + 1
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
-                if query.limit is None or len(data) <= query.limit:
+                result_set = SupersetResultSet.from_cursor(
+                    cursor,
+                    db_engine_spec,
+                    increased_limit,
+                    on_table=(
+                        partial(partial_results.publish, cursor=cursor)
+                        if partial_results
+                        else None
+                    ),
+                )
+                if query.limit is None or result_set.size <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
                     # return 1 row less than increased_query
-                    data = data[:-1]
+                    result_set.table = result_set.table.slice(0, query.limit)
     except SoftTimeLimitExceeded as ex:
         query.status = QueryStatus.TIMED_OUT
 
@@ -318,9 +454,7 @@ def execute_query(  # pylint: disable=too-many-statements, too-many-locals  # no
         logger.debug("Query %d: %s", query.id, ex)
         raise SqlLabException(db_engine_spec.extract_error_message(ex)) from ex
 
-    logger.debug("Query %d: Fetching cursor description", query.id)
-    cursor_description = cursor.description
-    return SupersetResultSet(data, cursor_description, db_engine_spec)
+    return result_set
 
 
 def _serialize_payload(
@@ -335,7 +469,7 @@ def _serialize_payload(
 
 def _serialize_and_expand_data(
     result_set: SupersetResultSet,
-    db_engine_spec: BaseEngineSpec,
+    db_engine_spec: type[BaseEngineSpec],
     use_msgpack: Optional[bool] = False,
     expand_data: bool = False,
 ) -> tuple[Union[bytes, str], list[Any], list[Any], list[Any]]:
@@ -380,6 +514,7 @@ def execute_sql_statements(  # noqa: C901
     start_time: Optional[float],
     expand_data: bool,
     log_params: Optional[dict[str, Any]],
+    job_metadata: Optional[dict[str, Any]] = None,
 ) -> Optional[dict[str, Any]]:
     """Executes the sql query returns the results."""
     if store_results and start_time:
@@ -396,6 +531,20 @@ def execute_sql_statements(  # noqa: C901
     if database.allow_run_async and not results_backend:
         raise SupersetResultsBackendNotConfigureException()
 
+    cache_timeout = database.cache_timeout
+    if cache_timeout is None:
+        cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
+
+    partial_results = None
+    if (
+        job_metadata
+        and store_results
+        and results_backend
+        and app.config["SQLLAB_PARTIAL_RESULTS"]
+    ):
+        partial_results = PartialResultsPublisher(query, job_metadata, cache_timeout)
+        query.results_key = partial_results.key
+
     logger.info("Query %s: Set query to 'running'", str(query_id))
     query.status = QueryStatus.RUNNING
     query.start_running_time = now_as_float()
@@ -490,7 +639,13 @@ def execute_sql_statements(  # noqa: C901
             query.executed_sql = database.mutate_sql_based_on_config(block)
 
             try:
-                result_set = execute_query(query, cursor, log_params)
+                # only the rows of the last statement are the results of the query
+                result_set = execute_query(
+                    query,
+                    cursor,
+                    log_params,
+                    partial_results if i == block_count - 1 else None,
+                )
             except SqlLabQueryStoppedException:
                 payload.update({"status": QueryStatus.STOPPED})
                 return payload
@@ -527,11 +682,27 @@ def execute_sql_statements(  # noqa: C901
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
+    use_columnar_storage = bool(
+        store_results
+        and results_backend
+        and app.config.get("SQLLAB_RESULTS_COLUMNAR_STORAGE")
     )
+    if use_columnar_storage:
+        # the data is stored apart from the payload, and expanded when loading it
+        # from the results backend
+        data = None
+        selected_columns = all_columns = result_set.columns
+        expanded_columns: list[Any] = []
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            result_set, db_engine_spec, use_arrow_data, expand_data
+        )
 
-    # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
         {
             "status": QueryStatus.SUCCESS,
@@ -545,13 +716,29 @@ def execute_sql_statements(  # noqa: C901
     payload["query"]["state"] = QueryStatus.SUCCESS
 
     if store_results and results_backend:
-        key = str(uuid.uuid4())
+        key = partial_results.key if partial_results else str(uuid.uuid4())
         payload["query"]["resultsKey"] = key
         logger.info(
             "Query %s: Storing results in results backend, key: %s", str(query_id), key
         )
         stats_logger = app.config["STATS_LOGGER"]
         with stats_timing("sqllab.query.results_backend_write", stats_logger):
+            data_size = 0
+            if use_columnar_storage:
+                # the data is checked uncompressed, like the serialized payloads, and
+                # before any of it is written to the results backend
+                data_size = result_set.pa_table.nbytes
+                check_payload_size(data_size)
+                with stats_timing(
+                    "sqllab.query.results_backend_write_data", stats_logger
+                ):
+                    payload["storage"] = write_result_table(
+                        key,
+                        result_set.pa_table,
+                        app.config["SQLLAB_RESULTS_ROW_GROUP_SIZE"],
+                        cache_timeout,
+                    )
+
             with stats_timing(
                 "sqllab.query.results_backend_write_serialization", stats_logger
             ):
@@ -560,38 +747,35 @@ def execute_sql_statements(  # noqa: C901
                 )
 
                 # Check the size of the serialized payload
-                if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
-                    serialized_payload_size = sys.getsizeof(serialized_payload)
-                    max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
-
-                    if serialized_payload_size > max_bytes:
-                        logger.info("Result size exceeds the allowed limit.")
-                        raise SupersetErrorException(
-                            SupersetError(
-                                message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
-                                error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
-                                level=ErrorLevel.ERROR,
-                            )
-                        )
-
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = app.config["CACHE_DEFAULT_TIMEOUT"]
-
-            compressed = zlib_compress(serialized_payload)
+                try:
+                    check_payload_size(sys.getsizeof(serialized_payload) + data_size)
+                except SupersetErrorException:
+                    if storage := payload.get("storage"):
+                        results_backend.delete_many(*storage["row_group_keys"])
+                    raise
+
+            with stats_timing(
+                "sqllab.query.results_backend_write_compression", stats_logger
+            ):
+                compressed = compress(
+                    serialized_payload,
+                    app.config["RESULTS_BACKEND_COMPRESSION"],
+                    **app.config["RESULTS_BACKEND_COMPRESSION_OPTIONS"],
+                )
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
             )
             logger.debug("*** compressed payload size: %i", getsizeof(compressed))
             results_backend.set(key, compressed, cache_timeout)
+            # release the stored bytes before building the results returned
+            del serialized_payload, compressed
         query.results_key = key
 
-    query.status = QueryStatus.SUCCESS
-    db.session.commit()
-
     if return_results:
-        # since we're returning results we need to create non-arrow data
-        if use_arrow_data:
+        # since we're returning results we need to create non-arrow data, once the
+        # stored data isn't referenced anymore
+        if use_arrow_data or use_columnar_storage:
+            payload["data"] = data = None
             (
                 data,
                 selected_columns,
@@ -608,23 +792,14 @@ def execute_sql_statements(  # noqa: C901
                     "expanded_columns": expanded_columns,
                 }
             )
-        # Check the size of the serialized payload (opt-in logic for return_results)
-        if sql_lab_payload_max_mb := app.config.get("SQLLAB_PAYLOAD_MAX_MB"):
-            serialized_payload = _serialize_payload(
-                payload, cast(bool, results_backend_use_msgpack)
-            )
-            serialized_payload_size = sys.getsizeof(serialized_payload)
-            max_bytes = sql_lab_payload_max_mb * BYTES_IN_MB
-
-            if serialized_payload_size > max_bytes:
-                logger.info("Result size exceeds the allowed limit.")
-                raise SupersetErrorException(
-                    SupersetError(
-                        message=f"Result size ({serialized_payload_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
-                        error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
-                        level=ErrorLevel.ERROR,
-                    )
-                )
+
+    query.status = QueryStatus.SUCCESS
+    db.session.commit()
+
+    if partial_results:
+        partial_results.done()
+
+    if return_results:
         return payload
 
     return None
@@ -335,9 +335,14 @@ class SqlLabRestApi(BaseSupersetApi):
               $ref: '#/components/responses/500'
         """
         params = kwargs["rison"]
-        key = params.get("key")
-        rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        result = SqlExecutionResultsCommand(
+            key=params.get("key"),
+            rows=params.get("rows"),
+            offset=params.get("offset", 0),
+            limit=params.get("limit"),
+            columns=params.get("columns"),
+            chunk=params.get("chunk"),
+        ).run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
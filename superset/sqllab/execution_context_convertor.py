@@ -19,19 +19,26 @@ from __future__ import annotations
 import logging
 from typing import Any, TYPE_CHECKING
 
+from superset.exceptions import SupersetErrorException
+from superset.sql_lab import handle_query_error
 from superset.sqllab.command_status import SqlJsonExecutionStatus
-from superset.sqllab.utils import apply_display_max_row_configuration_if_require
+from superset.sqllab.utils import (
+    apply_display_max_row_configuration_if_require,
+    check_payload_size,
+)
 from superset.utils import json
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from superset.models.sql_lab import Query
     from superset.sqllab.sqllab_execution_context import SqlJsonExecutionContext
 
 
 class ExecutionContextConvertor:
     _max_row_in_display_configuration: int  # pylint: disable=invalid-name
     _exc_status: SqlJsonExecutionStatus
+    _query: Query
     payload: dict[str, Any]
 
     def set_max_row_in_display(self, value: int) -> None:
@@ -43,6 +50,7 @@ class ExecutionContextConvertor:
         execution_status: SqlJsonExecutionStatus,
     ) -> None:
         self._exc_status = execution_status
+        self._query = execution_context.query
         if execution_status == SqlJsonExecutionStatus.HAS_RESULTS:
             self.payload = execution_context.get_execution_result() or {}
         else:
@@ -50,13 +58,21 @@ class ExecutionContextConvertor:
 
     def serialize_payload(self) -> str:
         if self._exc_status == SqlJsonExecutionStatus.HAS_RESULTS:
-            return json.dumps(
+            serialized_payload = json.dumps(
                 apply_display_max_row_configuration_if_require(
                     self.payload, self._max_row_in_display_configuration
                 ),
                 default=json.pessimistic_json_iso_dttm_ser,
                 ignore_nan=True,
             )
+            # the size of the results is checked on the response itself, rather than
+            # serializing them once more, and the query fails if they're too large
+            try:
+                check_payload_size(len(serialized_payload))
+            except SupersetErrorException as ex:
+                handle_query_error(ex, self._query)
+                raise
+            return serialized_payload
 
         return json.dumps(
             {"query": self.payload},
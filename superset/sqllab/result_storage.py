@@ -0,0 +1,146 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Columnar storage of the data of SQL Lab results in the results backend.
+
+Instead of being part of the results payload, the data is split in row groups of a
+fixed number of rows, each stored under its own key as a compressed Arrow IPC stream,
+while the payload only keeps the metadata needed to find them. Reading a page of the
+results only fetches and decompresses the row groups it overlaps, and the Arrow
+streams are read without copying the values.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional, TypedDict
+
+import pyarrow as pa
+
+from superset import results_backend
+from superset.exceptions import SerializationError
+from superset.sqllab.utils import write_ipc_buffer
+
+STORAGE_FORMAT = "arrow"
+COMPRESSION = "zstd"
+
+
+class ResultStorage(TypedDict):
+    format: str
+    num_rows: int
+    row_group_size: int
+    row_group_keys: list[str]
+    size: int
+
+
+def get_partial_results_key(key: str, chunk: int) -> str:
+    """
+    Return the key of a chunk of the partial results of a running query.
+
+    :param key: The results key of the query
+    :param chunk: The number of the chunk, starting at 0
+    """
+    return f"{key}-partial-{chunk}"
+
+
+def write_result_table(
+    key: str,
+    table: pa.Table,
+    row_group_size: int,
+    timeout: Optional[int] = None,
+) -> ResultStorage:
+    """
+    Store the row groups of a result table in the results backend.
+
+    :param key: The results key of the query
+    :param table: The data of the results
+    :param row_group_size: The number of rows of each row group
+    :param timeout: The cache timeout of the row groups
+    :returns: The storage metadata, to be kept in the results payload
+    """
+    options = pa.ipc.IpcWriteOptions(compression=COMPRESSION)
+    # an empty result still has a row group, holding its schema
+    offsets = range(0, table.num_rows, row_group_size) or [0]
+    row_groups = {
+        f"{key}-{i}": write_ipc_buffer(
+            table.slice(offset, row_group_size), options
+        ).to_pybytes()
+        for i, offset in enumerate(offsets)
+    }
+    results_backend.set_many(row_groups, timeout)
+
+    return {
+        "format": STORAGE_FORMAT,
+        "num_rows": table.num_rows,
+        "row_group_size": row_group_size,
+        "row_group_keys": list(row_groups),
+        "size": sum(len(row_group) for row_group in row_groups.values()),
+    }
+
+
+def read_result_table(
+    storage: ResultStorage,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[list[str]] = None,
+) -> Optional[pa.Table]:
+    """
+    Read a slice of a result table from the results backend, fetching only the row
+    groups it overlaps.
+
+    :param storage: The storage metadata of the results payload
+    :param offset: The index of the first row to read
+    :param limit: The maximum number of rows to read
+    :param columns: The names of the columns to read, all by default
+    :returns: The rows, or None if a row group expired
+    :raises SerializationError: If a row group can't be deserialized
+    """
+    num_rows = storage["num_rows"]
+    row_group_size = storage["row_group_size"]
+    row_group_keys = storage["row_group_keys"]
+    offset = min(max(offset, 0), num_rows)
+    end = num_rows if limit is None else min(num_rows, offset + limit)
+
+    first = min(offset // row_group_size, len(row_group_keys) - 1)
+    last = max(first, (end - 1) // row_group_size)
+    keys = row_group_keys[first : last + 1]
+
+    tables = []
+    for row_group in results_backend.get_many(*keys):
+        if row_group is None:
+            return None
+        try:
+            tables.append(pa.ipc.open_stream(pa.BufferReader(row_group)).read_all())
+        except (pa.ArrowInvalid, pa.ArrowSerializationError) as ex:
+            raise SerializationError("Unable to deserialize table") from ex
+
+    table = pa.concat_tables(tables).slice(
+        offset - first * row_group_size,
+        end - offset,
+    )
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+def get_result_storage(payload: dict[str, Any]) -> Optional[ResultStorage]:
+    """
+    Return the storage metadata of a results payload whose data is stored apart.
+    """
+    storage = payload.get("storage")
+    if isinstance(storage, dict) and storage.get("format") == STORAGE_FORMAT:
+        return storage  # type: ignore
+    return None
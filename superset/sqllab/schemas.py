@@ -22,6 +22,11 @@ sql_lab_get_results_schema = {
     "type": "object",
     "properties": {
         "key": {"type": "string"},
+        "rows": {"type": "integer"},
+        "offset": {"type": "integer", "minimum": 0},
+        "limit": {"type": "integer", "minimum": 0},
+        "columns": {"type": "array", "items": {"type": "string"}},
+        "chunk": {"type": "integer", "minimum": 0},
     },
     "required": ["key"],
 }
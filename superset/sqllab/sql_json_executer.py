@@ -22,8 +22,11 @@ import logging
 from abc import ABC
 from typing import Any, Callable, TYPE_CHECKING
 
+from flask import current_app as app, request
 from flask_babel import gettext as __
 
+from superset import is_feature_enabled
+from superset.async_events.async_query_manager import AsyncQueryTokenException
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import (
     SupersetErrorException,
@@ -31,9 +34,10 @@ from superset.exceptions import (
     SupersetGenericDBErrorException,
     SupersetTimeoutException,
 )
+from superset.extensions import async_query_manager
 from superset.sqllab.command_status import SqlJsonExecutionStatus
 from superset.utils import core as utils
-from superset.utils.core import get_username
+from superset.utils.core import get_user_id, get_username
 from superset.utils.dates import now_as_float
 
 if TYPE_CHECKING:
@@ -175,6 +179,7 @@ class ASynchronousSqlJsonExecutor(SqlJsonExecutorBase):
                 start_time=now_as_float(),
                 expand_data=execution_context.expand_data,
                 log_params=log_params,
+                job_metadata=self._init_partial_results_job(execution_context),
             )
             try:
                 task.forget()
@@ -199,3 +204,27 @@ class ASynchronousSqlJsonExecutor(SqlJsonExecutorBase):
             query.error_message = message
             raise SupersetErrorException(error) from ex
         return SqlJsonExecutionStatus.QUERY_IS_RUNNING
+
+    def _init_partial_results_job(
+        self, execution_context: SqlJsonExecutionContext
+    ) -> dict[str, Any] | None:
+        """
+        Start the async job publishing the partial results of the query, when they
+        are enabled and the client is subscribed to the async event stream.
+        """
+        if (
+            not is_feature_enabled("GLOBAL_ASYNC_QUERIES")
+            or not app.config["SQLLAB_PARTIAL_RESULTS"]
+            or execution_context.select_as_cta
+        ):
+            return None
+
+        try:
+            channel_id = async_query_manager.parse_channel_id_from_request(request)
+        except AsyncQueryTokenException:
+            logger.warning(
+                "Query %i: No async channel, partial results are not published",
+                execution_context.query.id,
+            )
+            return None
+        return async_query_manager.init_job(channel_id, get_user_id())
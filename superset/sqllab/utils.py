@@ -16,15 +16,23 @@
 # under the License.
 from __future__ import annotations
 
+import logging
 from typing import Any
 
 import pyarrow as pa
+from flask import current_app as app
 
 from superset import db, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
 from superset.daos.database import DatabaseDAO
+from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
+from superset.exceptions import SupersetErrorException
 from superset.models.sql_lab import TabState
 
+logger = logging.getLogger(__name__)
+
+BYTES_IN_MB = 1024 * 1024
+
 DATABASE_KEYS = [
     "allow_file_upload",
     "allow_ctas",
@@ -71,10 +79,34 @@ def apply_display_max_row_configuration_if_require(  # pylint: disable=invalid-n
     return sql_results
 
 
-def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
+def check_payload_size(size: int) -> None:
+    """
+    Check the size of serialized SQL Lab results against `SQLLAB_PAYLOAD_MAX_MB`.
+
+    :param size: The size of the serialized results, in bytes
+    :raises SupersetErrorException: If the results exceed the allowed size
+    """
+    sql_lab_payload_max_mb = app.config.get("SQLLAB_PAYLOAD_MAX_MB")
+    if not sql_lab_payload_max_mb or size <= sql_lab_payload_max_mb * BYTES_IN_MB:
+        return
+
+    logger.info("Result size exceeds the allowed limit.")
+    raise SupersetErrorException(
+        SupersetError(
+            message=f"Result size ({size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
+            error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
+            level=ErrorLevel.ERROR,
+        )
+    )
+
+
+def write_ipc_buffer(
+    table: pa.Table,
+    options: pa.ipc.IpcWriteOptions | None = None,
+) -> pa.Buffer:
     sink = pa.BufferOutputStream()
 
-    with pa.ipc.new_stream(sink, table.schema) as writer:
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
         writer.write_table(table)
 
     return sink.getvalue()
@@ -35,6 +35,7 @@ from superset.tags.models import Tag, TaggedObject
 from superset.tasks.exceptions import ExecutorNotFoundError, InvalidExecutorError
 from superset.tasks.utils import fetch_csrf_token, get_executor
 from superset.utils import json
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
 from superset.utils.machine_auth import MachineAuthProvider
 from superset.utils.urls import get_url_path, is_secure_url
@@ -278,6 +279,27 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
     return result
 
 
+@celery_app.task(name="refresh-chart-data-cache")
+def refresh_chart_data_cache(
+    chart_id: int,
+    query_context: dict[str, Any],
+    user_id: Optional[int],
+) -> dict[str, Any]:
+    """
+    Celery job to refresh the stale cached data of a chart query context
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+
+    user = (
+        security_manager.get_user_by_id(user_id)
+        if user_id
+        else security_manager.get_anonymous_user()
+    )
+    with override_user(user, force=False):
+        return ChartWarmUpCacheCommand(chart_id, None, None, query_context).run()
+
+
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
@@ -19,8 +19,11 @@ from typing import Any, Optional, Union
 
 from flask import Flask
 from flask_caching import Cache
+from flask_caching.backends import NullCache
 from markupsafe import Markup
 
+from superset.constants import CacheRegion
+from superset.extensions.two_tier_cache import TwoTierCache
 from superset.utils.core import DatasourceType
 
 logger = logging.getLogger(__name__)
@@ -86,9 +89,30 @@ class CacheManager:
 
         cache.init_app(app, cache_config)
 
+    @staticmethod
+    def _init_l1_cache(app: Flask, cache: Cache, region: CacheRegion) -> None:
+        """
+        Put an in-process tier in front of the backend of a cache.
+        """
+        backend = app.extensions["cache"][cache]
+        if not app.config["CACHE_L1_ENABLED"] or isinstance(backend, NullCache):
+            return
+
+        app.extensions["cache"][cache] = TwoTierCache(
+            backend,
+            name=region.value,
+            max_bytes=app.config["CACHE_L1_MAX_BYTES"],
+            timeout=app.config["CACHE_L1_TIMEOUT"],
+            invalidation_channel=app.config["CACHE_L1_INVALIDATION_CHANNEL"],
+            incr=app.config["STATS_LOGGER"].incr,
+            excluded_keys=app.config["CACHE_L1_EXCLUDED_KEYS"],
+        )
+
     def init_app(self, app: Flask) -> None:
         self._init_cache(app, self._cache, "CACHE_CONFIG")
+        self._init_l1_cache(app, self._cache, CacheRegion.DEFAULT)
         self._init_cache(app, self._data_cache, "DATA_CACHE_CONFIG")
+        self._init_l1_cache(app, self._data_cache, CacheRegion.DATA)
         self._init_cache(app, self._thumbnail_cache, "THUMBNAIL_CACHE_CONFIG")
         self._init_cache(
             app, self._filter_state_cache, "FILTER_STATE_CACHE_CONFIG", required=True
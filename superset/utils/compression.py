@@ -0,0 +1,180 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compression codecs of the payloads stored in the results backend and the caches.
+
+Blobs compressed with zstd or lz4 start with a header naming their codec, so that
+`decompress` reads them regardless of the codec currently configured. Blobs without
+a header are zlib streams, which is how zlib blobs are still written, so that they
+stay readable by older versions.
+"""
+
+from __future__ import annotations
+
+import struct
+import zlib
+from typing import Any
+
+import pyarrow as pa
+import zstandard
+
+# a zlib stream never starts with a null byte, its compression method being 8
+MAGIC = b"\x00SC"
+
+# the errors raised when decompressing a corrupted or truncated blob
+DECOMPRESSION_ERRORS: tuple[type[Exception], ...] = (
+    OSError,  # raised by Arrow for lz4
+    ValueError,
+    struct.error,
+    zlib.error,
+    zstandard.ZstdError,
+)
+
+
+class CompressionCodec:
+    """
+    A compression codec, identified by its name in the header of the blobs.
+    """
+
+    name: str
+
+    def compress(self, data: bytes) -> bytes:
+        raise NotImplementedError()
+
+    def decompress(self, data: bytes | memoryview) -> bytes:
+        raise NotImplementedError()
+
+
+class ZlibCodec(CompressionCodec):
+    name = "zlib"
+
+    def __init__(self, level: int = zlib.Z_DEFAULT_COMPRESSION) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes | memoryview) -> bytes:
+        return zlib.decompress(data)
+
+
+class ZstdCodec(CompressionCodec):
+    """
+    Zstandard, with `threads` workers compressing in parallel (-1 for one per CPU).
+    """
+
+    name = "zstd"
+
+    def __init__(self, level: int = 3, threads: int = 0) -> None:
+        self.level = level
+        self.threads = threads
+
+    def compress(self, data: bytes) -> bytes:
+        compressor = zstandard.ZstdCompressor(level=self.level, threads=self.threads)
+        return compressor.compress(data)
+
+    def decompress(self, data: bytes | memoryview) -> bytes:
+        return zstandard.ZstdDecompressor().decompress(data)
+
+
+class Lz4Codec(CompressionCodec):
+    """
+    LZ4 frames, prefixed with the size of the decompressed data.
+    """
+
+    name = "lz4"
+
+    size = struct.Struct("<Q")
+
+    def __init__(self, level: int | None = None) -> None:
+        self.codec = pa.Codec("lz4", compression_level=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self.size.pack(len(data)) + self.codec.compress(data, asbytes=True)
+
+    def decompress(self, data: bytes | memoryview) -> bytes:
+        (size,) = self.size.unpack_from(data)
+        return self.codec.decompress(
+            memoryview(data)[self.size.size :],
+            decompressed_size=size,
+            asbytes=True,
+        )
+
+
+CODECS: dict[str, type[CompressionCodec]] = {
+    codec.name: codec for codec in (ZlibCodec, ZstdCodec, Lz4Codec)
+}
+
+
+def get_codec(name: str, **options: Any) -> CompressionCodec:
+    """
+    Return a codec by its name.
+
+    :param name: The name of the codec, one of "zlib", "zstd" or "lz4"
+    :param options: The options of the codec, e.g. its `level`
+    :raises ValueError: If the codec doesn't exist
+    """
+    if name not in CODECS:
+        raise ValueError(f"Unknown compression codec: {name}")
+    return CODECS[name](**options)
+
+
+def compress(data: bytes | str, codec: str = ZlibCodec.name, **options: Any) -> bytes:
+    """
+    Compress data, strings being encoded in UTF-8.
+
+    >>> decompress(compress('{"test": 1}', "zstd", level=1))
+    '{"test": 1}'
+
+    :param data: The data to compress
+    :param codec: The name of the codec
+    :param options: The options of the codec
+    :returns: The compressed blob
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    compressed = get_codec(codec, **options).compress(data)
+    if codec == ZlibCodec.name:
+        return compressed
+
+    tag = codec.encode("ascii")
+    return MAGIC + bytes([len(tag)]) + tag + compressed
+
+
+def decompress(blob: bytes | str, decode: bool | None = True) -> bytes | str:
+    """
+    Decompress a blob written by `compress`, or a zlib stream.
+
+    :param blob: The compressed blob
+    :param decode: Whether to decode the data as UTF-8
+    :returns: The decompressed data
+    :raises ValueError: If the codec of the blob doesn't exist
+    :raises DECOMPRESSION_ERRORS: If the blob is corrupted or truncated
+    """
+    if isinstance(blob, str):
+        blob = blob.encode("utf-8")
+
+    if blob.startswith(MAGIC):
+        start = len(MAGIC) + 1
+        end = start + blob[len(MAGIC)]
+        codec = get_codec(blob[start:end].decode("ascii"))
+        decompressed = codec.decompress(memoryview(blob)[end:])
+    else:
+        decompressed = zlib.decompress(blob)
+
+    return decompressed.decode("utf-8") if decode else decompressed
@@ -0,0 +1,139 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, cast, TypeVar
+
+from flask import (
+    copy_current_request_context,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class KeyedSemaphore:
+    """
+    A registry of bounded semaphores, one per key.
+
+    Used to cap how many concurrent operations hit the same resource (e.g. the same
+    database) from a single process, regardless of how many requests are in flight.
+
+    The semaphore of a key is created with the limit given the first time the key is
+    acquired, and keeps it: a different limit passed later for the same key is
+    ignored until the registry is cleared, so callers should read it from a setting
+    that is fixed for the lifetime of the process, like the app configuration.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._semaphores: dict[Hashable, threading.BoundedSemaphore] = {}
+
+    def _get(self, key: Hashable, limit: int) -> threading.BoundedSemaphore:
+        with self._lock:
+            if key not in self._semaphores:
+                self._semaphores[key] = threading.BoundedSemaphore(max(limit, 1))
+            return self._semaphores[key]
+
+    @contextmanager
+    def acquire(self, key: Hashable, limit: int) -> Iterator[None]:
+        """
+        Block until a slot for `key` is available.
+
+        :param key: The resource the slot is acquired for
+        :param limit: Maximum number of concurrent holders, only applied the first
+            time the key is seen
+        """
+        semaphore = self._get(key, limit)
+        with semaphore:
+            yield
+
+    def clear(self) -> None:
+        with self._lock:
+            self._semaphores.clear()
+
+
+def _call_in_context(func: Callable[..., R]) -> Callable[..., R]:
+    """
+    Wrap `func` so that it runs with a copy of the current Flask contexts.
+
+    Flask contexts are local to the thread that handles the request, so the
+    application context, the request context (if any) and the attributes stored in
+    `flask.g` (most notably the current user, which drives RLS and permission checks)
+    are propagated to the worker thread.
+    """
+    app = cast(Any, current_app)._get_current_object()  # pylint: disable=protected-access
+    g_copy = dict(g.__dict__)
+
+    def wrapper(*args: Any, **kwargs: Any) -> R:
+        with app.app_context():
+            for key, value in g_copy.items():
+                setattr(g, key, value)
+            return func(*args, **kwargs)
+
+    if has_request_context():
+        return copy_current_request_context(wrapper)
+    return wrapper
+
+
+def map_in_app_context(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    thread_name_prefix: str = "superset",
+) -> list[R]:
+    """
+    Apply `func` to every item, running at most `max_workers` calls concurrently.
+
+    Results are returned in the same order as `items`. Once all calls have
+    completed, the exception raised by the first failing call in the order of
+    `items`, rather than the earliest one in time, is re-raised. When `max_workers`
+    is lower than 2, there is a single item, or there is no application context to
+    propagate, the calls are executed sequentially in the current thread.
+
+    The worker threads have their own SQLAlchemy session, the session of the current
+    thread not being safe to use concurrently. The ORM objects bound to it that
+    `func` reads must thus be fully loaded beforehand, so that reading them from the
+    workers doesn't emit queries on that session, and must not be changed by `func`.
+
+    :param func: The function to apply
+    :param items: The items to apply the function to
+    :param max_workers: The maximum number of worker threads
+    :param thread_name_prefix: The prefix of the worker thread names
+    :returns: The results of the calls, in order
+    """
+    items = list(items)
+    if max_workers < 2 or len(items) < 2 or not has_app_context():
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)),
+        thread_name_prefix=thread_name_prefix,
+    ) as executor:
+        # every call gets its own copy of the contexts, as a context can't be pushed
+        # in several threads at once
+        futures = [executor.submit(_call_in_context(func), item) for item in items]
+
+    return [future.result() for future in futures]
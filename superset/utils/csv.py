@@ -14,9 +14,12 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import codecs
 import logging
 import re
 import urllib.request
+import zlib
+from collections.abc import Iterable, Iterator
 from typing import Any, Optional, Union
 from urllib.error import URLError
 
@@ -64,7 +67,35 @@ def escape_value(value: str) -> str:
     return value
 
 
-def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+def escape_series(series: pd.Series) -> pd.Series:
+    """
+    Escapes the string values of a Series, leaving other values untouched.
+
+    Vectorized equivalent of applying `escape_value` to every string of the Series.
+    """
+    # `.str` refuses Series holding only bytes, so the strings are matched on their own
+    is_string = series.map(lambda value: isinstance(value, str)).to_numpy(dtype=bool)
+    if not is_string.any():
+        return series
+
+    strings = series[is_string]
+    needs_escaping = strings.str.match(problematic_chars_re.pattern)
+    is_negative_number = strings.str.match(negative_number_re.pattern)
+    mask = np.zeros(len(series), dtype=bool)
+    mask[is_string] = (needs_escaping & ~is_negative_number).to_numpy(dtype=bool)
+    if not mask.any():
+        return series
+
+    escaped = series.copy()
+    escaped[mask] = ("'" + series[mask].str.replace("|", "\\|", regex=False)).to_numpy()
+    return escaped
+
+
+def escape_df(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a copy of the DataFrame with the headers and the string values escaped.
+    """
+
     def escape_values(v: Any) -> Union[str, Any]:
         return escape_value(v) if isinstance(v, str) else v
 
@@ -72,13 +103,73 @@ def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
     df = df.rename(columns=escape_values)
 
     # Escape csv values
-    for name, column in df.items():
+    for idx, (_, column) in enumerate(df.items()):
         if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+            escaped = escape_series(column)
+            if escaped is not column:
+                df.isetitem(idx, escaped)
+
+    return df
 
-    return df.to_csv(escapechar="\\", **kwargs)
+
+def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
+    return escape_df(df).to_csv(escapechar="\\", **kwargs)
+
+
+def df_to_escaped_csv_chunks(
+    df: pd.DataFrame,
+    chunk_size: int = 10000,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Yields the escaped CSV of a DataFrame in chunks of rows.
+
+    Only one chunk of rows is escaped and rendered at a time, so the memory needed on
+    top of the DataFrame doesn't grow with its size. The concatenated chunks are the
+    same as the output of `df_to_escaped_csv`.
+
+    :param df: The DataFrame to export
+    :param chunk_size: The number of rows per chunk
+    :param kwargs: Keyword arguments passed to `DataFrame.to_csv`
+    """
+    header = kwargs.pop("header", True)
+    for start in range(0, max(len(df.index), 1), chunk_size):
+        yield df_to_escaped_csv(
+            df.iloc[start : start + chunk_size],
+            header=header if start == 0 else False,
+            **kwargs,
+        )
+
+
+def encode_csv_chunks(
+    chunks: Iterable[str],
+    encoding: str = "utf-8",
+    compress: bool = False,
+) -> Iterator[bytes]:
+    """
+    Encodes chunks of CSV text, optionally compressing them into a gzip stream.
+
+    The chunks are encoded incrementally, so that encodings with a byte order mark
+    (e.g. "utf-8-sig") only write it once, at the start of the output.
+
+    :param chunks: The chunks of CSV text
+    :param encoding: The encoding of the output
+    :param compress: Whether to compress the output with gzip
+    """
+    encoder = codecs.getincrementalencoder(encoding)()
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if compress else None
+    for chunk in chunks:
+        data = encoder.encode(chunk)
+        if compressor:
+            data = compressor.compress(data)
+        if data:
+            yield data
+
+    data = encoder.encode("", final=True)
+    if compressor:
+        data = compressor.compress(data) + compressor.flush()
+    if data:
+        yield data
 
 
 def get_chart_csv_data(
@@ -35,6 +35,7 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import (
     CacheLoadError,
     SerializationError,
+    SupersetErrorException,
     SupersetException,
     SupersetSecurityException,
 )
@@ -44,6 +45,11 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.result_storage import (
+    get_result_storage,
+    read_result_table,
+    ResultStorage,
+)
 from superset.superset_typing import FormData
 from superset.utils import json
 from superset.utils.core import DatasourceType
@@ -504,41 +510,134 @@ def check_datasource_perms(
 
 
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    columns: Optional[list[str]] = None,
 ) -> dict[str, Any]:
+    """
+    Deserialize the results payload of a query read from the results backend.
+
+    When the data of the results is stored apart from the payload, only the row
+    groups overlapping the requested rows are read.
+
+    :param payload: The decompressed results payload
+    :param query: The query of the results
+    :param use_msgpack: Whether the payload is serialized with MessagePack
+    :param offset: The index of the first row to load
+    :param limit: The maximum number of rows to load
+    :param columns: The names of the columns to load, all by default
+    :returns: The results payload, with its data
+    :raises SupersetErrorException: If a column doesn't exist, or the data expired
+    """
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
         with stats_timing(
             "sqllab.query.results_backend_msgpack_deserialize", stats_logger
         ):
             ds_payload = msgpack.loads(payload, raw=False)
+    else:
+        with stats_timing(
+            "sqllab.query.results_backend_json_deserialize", stats_logger
+        ):
+            ds_payload = json.loads(payload)
+
+    if columns is not None:
+        _select_results_columns(ds_payload, columns)
 
+    if storage := get_result_storage(ds_payload):
+        pa_table = _read_results_table(storage, offset, limit, columns)
+    elif use_msgpack:
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
             try:
                 reader = pa.BufferReader(ds_payload["data"])
                 pa_table = pa.ipc.open_stream(reader).read_all()
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
+        pa_table = pa_table.slice(offset, limit)
+        if columns is not None:
+            pa_table = pa_table.select(columns)
+    else:
+        end = None if limit is None else offset + limit
+        ds_payload["data"] = ds_payload["data"][offset:end]
+        if columns is not None:
+            names = set(columns)
+            ds_payload["data"] = [
+                {name: value for name, value in record.items() if name in names}
+                for record in ds_payload["data"]
+            ]
+        return ds_payload
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
+    df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
+    ds_payload["data"] = dataframe.df_to_records(df) or []
 
-        for column in ds_payload["selected_columns"]:
-            if "name" in column:
-                column["column_name"] = column.get("name")
+    for column in ds_payload["selected_columns"]:
+        if "name" in column:
+            column["column_name"] = column.get("name")
 
-        db_engine_spec = query.database.db_engine_spec
-        all_columns, data, expanded_columns = db_engine_spec.expand_data(
-            ds_payload["selected_columns"], ds_payload["data"]
-        )
-        ds_payload.update(
-            {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+    db_engine_spec = query.database.db_engine_spec
+    all_columns, data, expanded_columns = db_engine_spec.expand_data(
+        ds_payload["selected_columns"], ds_payload["data"]
+    )
+    ds_payload.update(
+        {"data": data, "columns": all_columns, "expanded_columns": expanded_columns}
+    )
+
+    return ds_payload
+
+
+def _read_results_table(
+    storage: ResultStorage,
+    offset: int,
+    limit: Optional[int],
+    columns: Optional[list[str]],
+) -> pa.Table:
+    """
+    Read the requested rows of results whose data is stored apart from the payload.
+    """
+    with stats_timing("sqllab.query.results_backend_read_data", stats_logger):
+        pa_table = read_result_table(storage, offset, limit, columns)
+    if pa_table is None:
+        raise SupersetErrorException(
+            SupersetError(
+                message=_(
+                    "Data could not be retrieved from the results backend. You "
+                    "need to re-run the original query."
+                ),
+                error_type=SupersetErrorType.RESULTS_BACKEND_ERROR,
+                level=ErrorLevel.ERROR,
+            ),
+            status=410,
         )
+    return pa_table
 
-        return ds_payload
 
-    with stats_timing("sqllab.query.results_backend_json_deserialize", stats_logger):
-        return json.loads(payload)
+def _select_results_columns(ds_payload: dict[str, Any], columns: list[str]) -> None:
+    """
+    Restrict the column metadata of a results payload to the requested columns.
+    """
+    selected_columns = {
+        column["name"]: column for column in ds_payload["selected_columns"]
+    }
+    if missing := [name for name in columns if name not in selected_columns]:
+        raise SupersetErrorException(
+            SupersetError(
+                message=_(
+                    "Columns missing in the results: %(columns)s",
+                    columns=", ".join(missing),
+                ),
+                error_type=SupersetErrorType.INVALID_PAYLOAD_SCHEMA_ERROR,
+                level=ErrorLevel.ERROR,
+            ),
+            status=400,
+        )
+
+    ds_payload["selected_columns"] = [selected_columns[name] for name in columns]
+    ds_payload["columns"] = [
+        column for column in ds_payload["columns"] if column["name"] in columns
+    ]
 
 
 def get_cta_schema_name(
@@ -15,7 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import codecs
 import copy
+import gzip
 import time
 import unittest
 from contextlib import contextmanager
@@ -356,6 +358,32 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
         assert rv.status_code == 200
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_columns_orient__200(self):
+        """
+        Chart data API: Test that the column oriented data matches the records
+        """
+        self.query_context_payload["queries"][0]["post_processing"] = []
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        records = rv.json["result"][0]["data"]
+
+        rv = self.post_assert_metric(
+            f"{CHART_DATA_URI}?orient=columns", self.query_context_payload, "data"
+        )
+        assert rv.status_code == 200
+        data = rv.json["result"][0]["data"]
+        assert list(data) == list(records[0])
+        assert data == {
+            column: [record[column] for record in records] for column in data
+        }
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_invalid_orient__400(self):
+        rv = self.post_assert_metric(
+            f"{CHART_DATA_URI}?orient=index", self.query_context_payload, "data"
+        )
+        assert rv.status_code == 400
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_empty_request_with_csv_result_format(self):
         """
@@ -386,6 +414,47 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         assert rv.status_code == 200
         assert rv.mimetype == "text/csv"
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_with_streamed_csv_result_format(self):
+        """
+        Chart data API: Test that a streamed CSV export matches the regular export
+        """
+        self.query_context_payload["result_format"] = "csv"
+        self.query_context_payload["queries"][0]["post_processing"] = []
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+
+        with mock.patch.dict(
+            "flask.current_app.config",
+            {"CSV_STREAMING_EXPORT": True, "CSV_STREAMING_CHUNK_SIZE": 3},
+        ):
+            streamed_rv = self.post_assert_metric(
+                CHART_DATA_URI, self.query_context_payload, "data"
+            )
+
+        assert streamed_rv.status_code == 200
+        assert streamed_rv.mimetype == "text/csv"
+        assert streamed_rv.is_streamed
+        # the streamed export is encoded with CSV_EXPORT["encoding"], with a BOM
+        assert streamed_rv.data.decode("utf-8-sig") == rv.data.decode("utf-8-sig")
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @with_config({"CSV_STREAMING_EXPORT": True, "CSV_STREAMING_GZIP": True})
+    def test_with_streamed_csv_result_format_gzip(self):
+        """
+        Chart data API: Test that a streamed CSV export is compressed when accepted
+        """
+        self.query_context_payload["result_format"] = "csv"
+        self.query_context_payload["queries"][0]["post_processing"] = []
+        rv = self.client.post(
+            CHART_DATA_URI,
+            json=self.query_context_payload,
+            headers={"Accept-Encoding": "gzip"},
+        )
+        assert rv.status_code == 200
+        assert rv.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(rv.data).startswith(codecs.BOM_UTF8)
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_excel_result_format(self):
         """
@@ -0,0 +1,44 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest import mock
+
+from superset.commands.chart.warm_up_cache import ChartWarmUpCacheCommand
+from superset.models.slice import Slice
+
+
+@mock.patch("superset.commands.chart.warm_up_cache.ChartDataCommand")
+@mock.patch("superset.commands.chart.warm_up_cache.get_form_data")
+def test_warm_up_cache_with_query_context(mock_get_form_data, mock_command_cls):
+    """
+    Test that a chart is warmed up with a given query context instead of the one
+    stored with the chart.
+    """
+    chart = mock.MagicMock(spec=Slice, id=1)
+    mock_get_form_data.return_value = ({"viz_type": "echarts_timeseries"}, None)
+    mock_command_cls.return_value.run.return_value = {
+        "queries": [{"error": None, "status": "success"}]
+    }
+    query_context = {"queries": [{"columns": ["name"]}], "form_data": {"slice_id": 1}}
+
+    result = ChartWarmUpCacheCommand(chart, None, None, query_context).run()
+
+    assert result == {"chart_id": 1, "viz_error": None, "viz_status": "success"}
+    factory = chart.get_query_context_factory.return_value
+    factory.create.assert_called_once_with(**query_context)
+    chart.get_query_context.assert_not_called()
+    assert factory.create.return_value.force is True
+    mock_command_cls.assert_called_once_with(factory.create.return_value)
@@ -0,0 +1,166 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from decimal import Decimal
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from pandas.testing import assert_frame_equal
+
+from superset.common.utils.cache_serialization import (
+    ARROW_FORMAT,
+    deserialize_cache_value,
+    DF_COMPRESSION_KEY,
+    DF_FORMAT_KEY,
+    dumps_df,
+    loads_df,
+    serialize_cache_value,
+)
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "__timestamp": pd.date_range("2024-01-01", periods=3, freq="D"),
+            "country": ["US", None, "FR"],
+            "count": [1, 2, 3],
+            "ratio": [0.5, None, 1.5],
+            "amount": [Decimal("1.10"), None, Decimal("3.30")],
+        }
+    )
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_dumps_loads_df(df: pd.DataFrame, compression: str | None) -> None:
+    assert_frame_equal(loads_df(dumps_df(df, compression)), df)
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_dumps_loads_df_nullable_ints(compression: str | None) -> None:
+    df = pd.DataFrame(
+        {
+            "nullable": pd.Series([1, None, 3], dtype=object),
+            "big": pd.Series([2**60 + 1, None, -(2**60 + 1)], dtype=object),
+            "ints": [1, 2, 3],
+        }
+    )
+
+    loaded = loads_df(dumps_df(df, compression))
+
+    assert_frame_equal(loaded, df)
+    assert loaded["big"].tolist() == [2**60 + 1, None, -(2**60 + 1)]
+
+
+def test_serialize_cache_value_disabled(df: pd.DataFrame) -> None:
+    value = {"df": df, "query": "SELECT 1"}
+    assert serialize_cache_value(value) is value
+
+
+def test_serialize_cache_value_arrow(df: pd.DataFrame) -> None:
+    value = {"df": df, "query": "SELECT 1"}
+    with patch.dict(current_app.config, {"DATA_CACHE_SERIALIZATION": "arrow"}):
+        serialized = serialize_cache_value(value)
+
+    assert serialized[DF_FORMAT_KEY] == ARROW_FORMAT
+    assert isinstance(serialized["df"], bytes)
+
+    deserialized = deserialize_cache_value(serialized)
+    assert DF_FORMAT_KEY not in deserialized
+    assert deserialized["query"] == "SELECT 1"
+    assert_frame_equal(deserialized["df"], df)
+
+
+@pytest.mark.parametrize("codec", ["zlib", "zstd", "lz4"])
+def test_serialize_cache_value_compressed(df: pd.DataFrame, codec: str) -> None:
+    value = {"df": df, "query": "SELECT 1"}
+    with patch.dict(
+        current_app.config,
+        {"DATA_CACHE_SERIALIZATION": "arrow", "DATA_CACHE_COMPRESSION": codec},
+    ):
+        serialized = serialize_cache_value(value)
+
+    assert serialized[DF_COMPRESSION_KEY] == codec
+    assert len(serialized["df"]) < len(dumps_df(df))
+
+    deserialized = deserialize_cache_value(serialized)
+    assert DF_COMPRESSION_KEY not in deserialized
+    assert_frame_equal(deserialized["df"], df)
+
+
+def test_serialize_cache_value_unsupported_df() -> None:
+    """
+    Test that DataFrames Arrow can't represent are stored as-is.
+    """
+    value = {"df": pd.DataFrame({"mixed": [1, "a", 2.0]})}
+    with patch.dict(current_app.config, {"DATA_CACHE_SERIALIZATION": "arrow"}):
+        assert serialize_cache_value(value) is value
+
+
+def test_query_cache_manager_arrow_roundtrip(df: pd.DataFrame) -> None:
+    cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+    cache.init_app(current_app)
+    with (
+        patch.dict(
+            "superset.common.utils.query_cache_manager._cache",
+            {CacheRegion.DATA: cache},
+        ),
+        patch.dict(current_app.config, {"DATA_CACHE_SERIALIZATION": "arrow"}),
+    ):
+        QueryCacheManager.set(
+            key="key",
+            value={"df": df, "query": "SELECT 1"},
+            timeout=60,
+            region=CacheRegion.DATA,
+        )
+        assert cache.get("key")[DF_FORMAT_KEY] == ARROW_FORMAT
+
+        query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+
+    assert query_cache.is_loaded
+    assert query_cache.query == "SELECT 1"
+    assert_frame_equal(query_cache.df, df)
+
+
+@pytest.mark.parametrize("codec", ["zlib", "zstd", "lz4"])
+def test_query_cache_manager_corrupted_value(df: pd.DataFrame, codec: str) -> None:
+    """
+    Test that values which can't be decompressed are served as cache misses.
+    """
+    cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+    cache.init_app(current_app)
+    with (
+        patch.dict(
+            "superset.common.utils.query_cache_manager._cache",
+            {CacheRegion.DATA: cache},
+        ),
+        patch.dict(
+            current_app.config,
+            {"DATA_CACHE_SERIALIZATION": "arrow", "DATA_CACHE_COMPRESSION": codec},
+        ),
+    ):
+        value = serialize_cache_value({"df": df, "query": "SELECT 1"})
+        cache.set("key", {**value, "df": value["df"][:-8]}, timeout=60)
+
+        query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+
+    assert not query_cache.is_loaded
+    assert query_cache.df.empty
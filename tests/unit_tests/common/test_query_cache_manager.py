@@ -0,0 +1,97 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from datetime import timedelta
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from flask import current_app
+from flask_caching import Cache
+from freezegun import freeze_time
+
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.models.helpers import QueryResult
+
+
+@pytest.fixture
+def data_cache() -> Iterator[Cache]:
+    cache = Cache(config={"CACHE_TYPE": "SimpleCache"})
+    cache.init_app(current_app)
+    with patch.dict(
+        "superset.common.utils.query_cache_manager._cache",
+        {CacheRegion.DATA: cache},
+    ):
+        yield cache
+
+
+@pytest.mark.usefixtures("data_cache")
+def test_stale_while_revalidate() -> None:
+    """
+    Test that an expired result is loaded as stale during the grace period.
+    """
+    query_result = QueryResult(
+        df=pd.DataFrame({"a": [1]}),
+        query="SELECT 1 AS a",
+        duration=timedelta(seconds=1),
+    )
+    with freeze_time("2024-01-01 00:00:00") as frozen_time:
+        QueryCacheManager().set_query_result(
+            key="key",
+            query_result=query_result,
+            timeout=60,
+            region=CacheRegion.DATA,
+            stale_timeout=300,
+        )
+
+        frozen_time.tick(30)
+        query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+        assert query_cache.is_loaded
+        assert not query_cache.is_stale
+
+        frozen_time.tick(60)
+        query_cache = QueryCacheManager.get("key", CacheRegion.DATA)
+        assert query_cache.is_loaded
+        assert query_cache.is_stale
+        assert query_cache.query == "SELECT 1 AS a"
+
+        frozen_time.tick(300)
+        assert not QueryCacheManager.get("key", CacheRegion.DATA).is_loaded
+
+
+@pytest.mark.usefixtures("data_cache")
+def test_stale_while_revalidate_disabled() -> None:
+    """
+    Test that results expire with their timeout without a grace period.
+    """
+    query_result = QueryResult(
+        df=pd.DataFrame({"a": [1]}),
+        query="SELECT 1 AS a",
+        duration=timedelta(seconds=1),
+    )
+    with freeze_time("2024-01-01 00:00:00") as frozen_time:
+        QueryCacheManager().set_query_result(
+            key="key",
+            query_result=query_result,
+            timeout=60,
+            region=CacheRegion.DATA,
+            stale_timeout=0,
+        )
+
+        frozen_time.tick(90)
+        assert not QueryCacheManager.get("key", CacheRegion.DATA).is_loaded
@@ -15,14 +15,23 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from unittest.mock import MagicMock, patch
+import threading
+from contextlib import nullcontext
+from unittest.mock import ANY, MagicMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
+from flask import current_app
 
-from superset.common.chart_data import ChartDataResultFormat
+from superset.common.chart_data import (
+    ChartDataJsonOrient,
+    ChartDataResultFormat,
+    ChartDataResultType,
+)
 from superset.common.query_context_processor import QueryContextProcessor
+from superset.constants import CacheRegion
+from superset.utils import json
 from superset.utils.core import GenericDataType
 
 
@@ -41,6 +50,7 @@ def processor(mock_query_context):
         "col1": "Column 1",
         "col2": "Column 2",
     }
+    mock_query_context.json_orient = None
     return QueryContextProcessor(mock_query_context)
 
 
@@ -102,6 +112,27 @@ def test_get_data_json(processor, mock_query_context):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "orient, expected",
+    [
+        (
+            ChartDataJsonOrient.RECORDS,
+            [{"col1": 1, "col2": "a"}, {"col1": 2, "col2": "b"}],
+        ),
+        (ChartDataJsonOrient.COLUMNS, {"col1": [1, 2], "col2": ["a", "b"]}),
+    ],
+)
+def test_get_data_json_orient(processor, mock_query_context, orient, expected):
+    df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]})
+    coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
+    mock_query_context.result_format = ChartDataResultFormat.JSON
+    mock_query_context.json_orient = orient
+
+    result = processor.get_data(df, coltypes)
+    assert isinstance(result, json.RawJSON)
+    assert json.loads(json.dumps({"data": result})) == {"data": expected}
+
+
 def test_get_data_invalid_dataframe(processor, mock_query_context):
     df = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
     coltypes = [GenericDataType.NUMERIC, GenericDataType.STRING]
@@ -687,6 +718,7 @@ def test_get_df_payload_validates_before_cache_key_generation():
             ) as mock_cache_manager:
                 mock_cache = MagicMock()
                 mock_cache.is_loaded = True
+                mock_cache.is_stale = False
                 mock_cache.df = pd.DataFrame({"col1": [1, 2, 3]})
                 mock_cache.query = "SELECT * FROM table"
                 mock_cache.error_message = None
@@ -701,3 +733,338 @@ def test_get_df_payload_validates_before_cache_key_generation():
         f"Expected validate to be called before cache_key, "
         f"but got call order: {call_order}"
     )
+
+
+def test_get_df_payload_single_flight():
+    """
+    Test that get_df_payload uses the result of an identical query that ran while
+    it was waiting, instead of running the query again.
+    """
+    from superset.common.query_object import QueryObject
+
+    mock_query_context = MagicMock()
+    mock_query_context.force = False
+    mock_datasource = MagicMock()
+    mock_datasource.column_names = ["col1"]
+    processor = QueryContextProcessor(mock_query_context)
+    processor._qc_datasource = mock_datasource
+    query_obj = QueryObject(datasource=mock_datasource, columns=["col1"], metrics=[])
+
+    missed = MagicMock(is_loaded=False)
+    cached = MagicMock(
+        is_loaded=True, is_stale=False, df=pd.DataFrame({"col1": [1, 2, 3]})
+    )
+    with (
+        patch.object(query_obj, "validate"),
+        patch.object(processor, "query_cache_key", return_value="key"),
+        patch.object(processor, "get_cache_timeout", return_value=60),
+        patch.object(processor, "get_query_result") as mock_get_query_result,
+        patch.object(
+            processor, "_single_flight", return_value=nullcontext(cached)
+        ) as mock_single_flight,
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager"
+        ) as mock_cache_manager,
+    ):
+        mock_cache_manager.get.return_value = missed
+        payload = processor.get_df_payload(query_obj)
+
+    mock_single_flight.assert_called_once_with("key", False)
+    mock_get_query_result.assert_not_called()
+    assert payload["df"] is cached.df
+
+
+def test_single_flight_disabled(processor, mock_query_context):
+    """
+    Test that queries aren't deduplicated when disabled or forced.
+    """
+    with patch(
+        "superset.common.query_context_processor.single_flight"
+    ) as mock_single_flight:
+        with patch.dict(current_app.config, {"DATA_CACHE_SINGLE_FLIGHT": False}):
+            with processor._single_flight("key", False) as cached:
+                assert cached is None
+        with patch.dict(current_app.config, {"DATA_CACHE_SINGLE_FLIGHT": True}):
+            with processor._single_flight("key", True) as cached:
+                assert cached is None
+
+    mock_single_flight.assert_not_called()
+
+
+def test_get_stale_cache_timeout(processor, mock_query_context):
+    """
+    Test that the grace period of the dataset or database overrides the config.
+    """
+    mock_query_context.get_stale_cache_timeout.return_value = None
+    with patch.dict(current_app.config, {"DATA_CACHE_STALE_TIMEOUT": 600}):
+        assert processor.get_stale_cache_timeout() == 600
+
+        mock_query_context.get_stale_cache_timeout.return_value = 0
+        assert processor.get_stale_cache_timeout() == 0
+
+
+@patch("superset.common.query_context_processor.cache_manager")
+@patch("superset.tasks.cache.refresh_chart_data_cache")
+def test_refresh_stale_cache(
+    mock_refresh_chart_data_cache, mock_cache_manager, processor, mock_query_context
+):
+    """
+    Test that the refresh of a stale cache key is queued once.
+    """
+    mock_query_context.slice_.id = 1
+    mock_query_context.cache_values = {"queries": [{"columns": ["col1"]}]}
+    mock_query_context.form_data = {"slice_id": 1}
+    mock_query_context.custom_cache_timeout = None
+    mock_cache_manager.data_cache.add.side_effect = [True, False]
+
+    with patch.object(processor, "get_cache_timeout", return_value=60):
+        processor._refresh_stale_cache("key")
+        processor._refresh_stale_cache("key")
+
+    mock_cache_manager.data_cache.add.assert_called_with(
+        "refresh-key", True, timeout=60
+    )
+    mock_refresh_chart_data_cache.delay.assert_called_once_with(
+        1,
+        {
+            "queries": [{"columns": ["col1"]}],
+            "form_data": {"slice_id": 1},
+            "custom_cache_timeout": None,
+        },
+        None,
+    )
+
+
+def test_get_payload_parallel(processor, mock_query_context):
+    """
+    Test that queries are dispatched concurrently when parallelism is enabled,
+    and that results keep the order of the queries.
+    """
+    mock_query_context.queries = [MagicMock(result_type=None) for _ in range(3)]
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_query_results(result_type, query_context, query_obj, force_cached):
+        barrier.wait()
+        return {"query": mock_query_context.queries.index(query_obj)}
+
+    with (
+        patch.object(processor, "ensure_totals_available") as ensure_totals,
+        patch(
+            "superset.common.query_context_processor.get_query_results",
+            side_effect=get_query_results,
+        ),
+        patch.dict(current_app.config, {"CHART_DATA_QUERY_PARALLELISM": 3}),
+    ):
+        payload = processor.get_payload()
+
+    ensure_totals.assert_called_once()
+    assert payload == {"queries": [{"query": 0}, {"query": 1}, {"query": 2}]}
+
+
+def test_get_payload_sequential(processor, mock_query_context):
+    """
+    Test that queries run one after another in the request thread by default.
+    """
+    mock_query_context.queries = [MagicMock(result_type=None) for _ in range(2)]
+
+    with (
+        patch.object(processor, "ensure_totals_available"),
+        patch(
+            "superset.common.query_context_processor.get_query_results",
+            side_effect=lambda *args: {"thread": threading.get_ident()},
+        ),
+    ):
+        payload = processor.get_payload()
+
+    assert payload == {"queries": [{"thread": threading.get_ident()}] * 2}
+
+
+def test_processing_time_offsets_batches_cache_lookups(processor):
+    """
+    Test that all the offsets are looked up in the cache at once, and that only
+    the missing ones are queried.
+    """
+    from superset.common.query_object import QueryObject
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2023-01-01", periods=3, freq="D"),
+            "metric1": [10, 20, 30],
+        }
+    )
+    query_object = QueryObject(
+        datasource=MagicMock(),
+        granularity="ds",
+        columns=[],
+        metrics=["metric1"],
+        is_timeseries=True,
+        time_offsets=["1 year ago", "2 years ago"],
+    )
+    cached = QueryCacheManager(
+        df=pd.DataFrame(
+            {
+                "ds": pd.date_range("2023-01-01", periods=3, freq="D"),
+                "metric1__1 year ago": [1, 2, 3],
+            }
+        ),
+        query="SELECT 1 year ago",
+        is_loaded=True,
+    )
+    missing_df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2023-01-01", periods=3, freq="D"),
+            "metric1__2 years ago": [4, 5, 6],
+        }
+    )
+
+    with (
+        patch(
+            "superset.common.query_context_processor.get_since_until_from_query_object",
+            return_value=(pd.Timestamp("2023-01-01"), pd.Timestamp("2023-01-04")),
+        ),
+        patch.object(processor, "query_cache_key", side_effect=["key1", "key2"]),
+        patch(
+            "superset.common.query_context_processor.QueryCacheManager.get_many",
+            return_value=[cached, QueryCacheManager()],
+        ) as get_many,
+        patch.object(
+            processor,
+            "_run_time_offset_query",
+            return_value=(missing_df, "SELECT 2 years ago"),
+        ) as run_time_offset_query,
+    ):
+        result = processor.processing_time_offsets(df, query_object)
+
+    get_many.assert_called_once_with(["key1", "key2"], CacheRegion.DATA, ANY)
+    run_time_offset_query.assert_called_once()
+    assert run_time_offset_query.call_args.args[0]["original_offset"] == "2 years ago"
+    assert result["queries"] == ["SELECT 1 year ago", "SELECT 2 years ago"]
+    assert result["cache_keys"] == ["key1", None]
+    assert result["df"]["metric1__1 year ago"].tolist() == [1, 2, 3]
+    assert result["df"]["metric1__2 years ago"].tolist() == [4, 5, 6]
+
+
+def test_can_stream_csv(processor, mock_query_context):
+    """
+    Test that only the CSV exports of a single plain query are streamed.
+    """
+    mock_query_context.result_format = ChartDataResultFormat.CSV
+    mock_query_context.result_type = ChartDataResultType.FULL
+    mock_query_context.queries = [MagicMock(post_processing=[], time_offsets=[])]
+
+    with patch.dict(current_app.config, {"CSV_STREAMING_EXPORT": True}):
+        assert processor.can_stream_csv()
+
+        mock_query_context.queries[0].post_processing = [{"operation": "pivot"}]
+        assert not processor.can_stream_csv()
+
+        mock_query_context.queries[0].post_processing = []
+        mock_query_context.result_format = ChartDataResultFormat.XLSX
+        assert not processor.can_stream_csv()
+
+    mock_query_context.result_format = ChartDataResultFormat.CSV
+    assert not processor.can_stream_csv()
+
+
+def test_get_csv_stream(processor, mock_query_context):
+    """
+    Test that the CSV export is built from the chunks fetched from the database.
+    """
+    query_object = MagicMock(row_limit=5000)
+    mock_query_context.queries = [query_object]
+    datasource = mock_query_context.datasource
+    datasource.get_query_str_extended.return_value = MagicMock(
+        sql="SELECT col1, col2 FROM t",
+        labels_expected=["col1", "col2"],
+    )
+
+    def iter_df(sql, catalog, schema, mutator, chunk_size):
+        yield mutator(pd.DataFrame({"a": [1, 2], "b": ["=x", "y"], "c": [0, 0]}))
+        yield mutator(pd.DataFrame({"a": [3], "b": ["z"], "c": [0]}))
+
+    datasource.database.iter_df.side_effect = iter_df
+
+    with (
+        patch.object(processor, "normalize_df", side_effect=lambda df, _: df),
+        patch.dict(current_app.config, {"CSV_STREAMING_ROW_LIMIT": 1000}),
+    ):
+        chunks = list(processor.get_csv_stream())
+
+    query_object.validate.assert_called_once()
+    assert query_object.row_limit == 1000
+    assert chunks == ["Column 1,Column 2\n1,'=x\n2,y\n", "3,z\n"]
+
+
+def test_get_csv_stream_missing_columns(processor, mock_query_context):
+    """
+    Test that the columns of a streamed export are validated like a regular one.
+    """
+    from superset.exceptions import QueryObjectValidationError
+
+    mock_query_context.queries = [MagicMock(columns=["col1", "missing"], metrics=[])]
+    mock_query_context.datasource.column_names = ["col1", "col2"]
+
+    with pytest.raises(QueryObjectValidationError, match="missing"):
+        next(processor.get_csv_stream())
+
+    mock_query_context.datasource.database.iter_df.assert_not_called()
+
+
+def test_get_csv_stream_close(processor, mock_query_context):
+    """
+    Test that closing the stream closes the cursor the rows are fetched from.
+    """
+    mock_query_context.queries = [MagicMock(row_limit=None, columns=[], metrics=[])]
+    datasource = mock_query_context.datasource
+    datasource.get_query_str_extended.return_value = MagicMock(
+        labels_expected=["col1"],
+    )
+    closed = []
+
+    def iter_df(sql, catalog, schema, mutator, chunk_size):
+        try:
+            yield pd.DataFrame({"col1": [1]})
+            yield pd.DataFrame({"col1": [2]})
+        finally:
+            closed.append(True)
+
+    datasource.database.iter_df.side_effect = iter_df
+
+    with patch.object(processor, "normalize_df", side_effect=lambda df, _: df):
+        chunks = processor.get_csv_stream()
+        next(chunks)
+        chunks.close()
+
+    assert closed == [True]
+
+
+def test_preload_datasource(session, mock_query_context):
+    """
+    Test that the attributes the worker threads may read are loaded beforehand, even
+    when the datasource expired.
+    """
+    from sqlalchemy import inspect
+
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    table = SqlaTable(
+        table_name="my_table",
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+        columns=[TableColumn(column_name="a")],
+        metrics=[SqlMetric(metric_name="count", expression="COUNT(*)")],
+    )
+    session.add(table)
+    session.commit()
+    session.expire_all()
+    mock_query_context.datasource = table
+
+    QueryContextProcessor(mock_query_context)._preload_datasource()
+
+    for instance in [table, table.database, *table.columns, *table.metrics]:
+        state = inspect(instance)
+        assert all(
+            getattr(state.mapper.attrs[key], "uselist", False) for key in state.unloaded
+        )
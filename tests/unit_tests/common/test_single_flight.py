@@ -0,0 +1,73 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock
+
+import pytest
+
+from superset.common.utils.single_flight import single_flight
+from superset.distributed_lock import KeyValueDistributedLock
+from superset.exceptions import CreateKeyValueDistributedLockFailedException
+
+
+def test_single_flight_leader() -> None:
+    """
+    Test that the first caller holds the lock while computing the value.
+    """
+    load = MagicMock(return_value=None)
+
+    with single_flight("ns", "key", load, timeout=1, poll_interval=0) as value:
+        assert value is None
+        with pytest.raises(CreateKeyValueDistributedLockFailedException):
+            with KeyValueDistributedLock("ns", key="key"):
+                pass
+
+    load.assert_called_once()
+    # the lock is released once the value is computed
+    with KeyValueDistributedLock("ns", key="key"):
+        pass
+
+
+def test_single_flight_leader_cached() -> None:
+    """
+    Test that the value is loaded when cached before the lock was acquired.
+    """
+    with single_flight("ns", "key", lambda: 42, timeout=1, poll_interval=0) as value:
+        assert value == 42
+
+
+def test_single_flight_wait() -> None:
+    """
+    Test that a caller waits for the value computed by the holder of the lock.
+    """
+    load = MagicMock(side_effect=[None, None, 42])
+
+    with KeyValueDistributedLock("ns", key="key"):
+        with single_flight("ns", "key", load, timeout=10, poll_interval=0) as value:
+            assert value == 42
+
+    assert load.call_count == 3
+
+
+def test_single_flight_timeout() -> None:
+    """
+    Test that a caller computes the value when the holder of the lock is too slow.
+    """
+    load = MagicMock(return_value=None)
+
+    with KeyValueDistributedLock("ns", key="key"):
+        with single_flight("ns", "key", load, timeout=0, poll_interval=0) as value:
+            assert value is None
@@ -14,8 +14,10 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from pandas import DataFrame, Series, Timestamp
-from pandas.testing import assert_frame_equal
+from unittest.mock import patch
+
+from pandas import DataFrame, date_range, Series, Timestamp
+from pandas.testing import assert_frame_equal, assert_series_equal
 from pytest import fixture, mark  # noqa: PT013
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
@@ -185,3 +187,96 @@ def test_join_offset_dfs_with_month_granularity():
     )
 
     assert_frame_equal(expected, result)
+
+
+@mark.parametrize(
+    "time_grain",
+    [
+        TimeGrain.WEEK,
+        TimeGrain.WEEK_STARTING_SUNDAY,
+        TimeGrain.MONTH,
+        TimeGrain.QUARTER,
+        TimeGrain.YEAR,
+    ],
+)
+def test_generate_join_column_vectorized(time_grain: str):
+    df = DataFrame({"ds": date_range("2019-12-01", periods=20, freq="W")})
+
+    result = query_context_processor.generate_join_column_vectorized(
+        df["ds"], time_grain, "1 year ago"
+    )
+    expected = df.apply(
+        lambda row: query_context_processor.generate_join_column(
+            row, 0, time_grain, "1 year ago"
+        ),
+        axis=1,
+    )
+
+    assert_series_equal(result, expected, check_names=False)
+
+
+def test_generate_join_column_vectorized_unsupported():
+    df = DataFrame({"ds": [Timestamp("2020-01-07"), None]})
+    assert (
+        query_context_processor.generate_join_column_vectorized(
+            df["ds"], TimeGrain.YEAR
+        )
+        is None
+    )
+    assert (
+        query_context_processor.generate_join_column_vectorized(
+            df["ds"].dropna(), TimeGrain.DAY
+        )
+        is None
+    )
+
+
+@mark.parametrize("time_grain", [None, TimeGrain.MONTH])
+def test_join_offset_dfs_at_once_matches_pairwise_joins(time_grain: str | None):
+    df = DataFrame(
+        {
+            "ds": date_range("2021-01-01", periods=6, freq="MS").repeat(2),
+            "country": ["US", "FR"] * 6,
+            "sum__num": range(12),
+        }
+    )
+    offset_dfs = {
+        "1 month ago": df.iloc[1:9].rename(
+            columns={"sum__num": "sum__num__1 month ago"}
+        ),
+        "3 months ago": df.iloc[:5].rename(
+            columns={"sum__num": "sum__num__3 months ago"}
+        ),
+    }
+
+    result = query_context_processor._join_offset_dfs_at_once(
+        df.copy(),
+        {offset: offset_df.copy() for offset, offset_df in offset_dfs.items()},
+        time_grain,
+        ["ds", "country"],
+        None,
+    )
+    with patch.object(
+        QueryContextProcessor, "_join_offset_dfs_at_once", return_value=None
+    ):
+        expected = query_context_processor.join_offset_dfs(
+            df.copy(),
+            {offset: offset_df.copy() for offset, offset_df in offset_dfs.items()},
+            time_grain,
+            ["ds", "country"],
+        )
+
+    assert result is not None
+    assert_frame_equal(result, expected)
+
+
+def test_join_offset_dfs_at_once_duplicated_keys():
+    df = DataFrame({"A": ["2021-01-01", "2021-02-01"], "B": [1, 2]})
+    offset_dfs = {"1_YEAR": DataFrame({"A": ["2021-01-01", "2021-01-01"], "C": [3, 4]})}
+
+    assert (
+        query_context_processor._join_offset_dfs_at_once(
+            df, offset_dfs, None, ["A"], None
+        )
+        is None
+    )
@@ -842,3 +842,82 @@ def test_quoted_name_prevents_double_quoting(mocker: MockerFixture) -> None:
     # Should have each part quoted separately:
     # GOOD: "MY_DB"."MY_SCHEMA"."MY_TABLE"
     assert '"MY_DB"."MY_SCHEMA"."MY_TABLE"' in compiled
+
+
+def test_datasets_trimmed_for_slices(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that the datasets of a dashboard are loaded at once, and trimmed to the
+    columns and metrics of its charts without building their query contexts.
+    """
+    from superset.connectors.sqla.models import SqlMetric
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+    from superset.utils import json
+
+    Database.metadata.create_all(session.bind)
+    get_query_context = mocker.patch.object(Slice, "get_query_context")
+    get_datasources = mocker.spy(SqlaTable, "get_eager_sqlatable_datasources")
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    datasets = [
+        SqlaTable(
+            database=database,
+            table_name=f"table_{i}",
+            columns=[
+                TableColumn(column_name="a", type="INTEGER"),
+                TableColumn(column_name="b", type="TEXT"),
+                TableColumn(column_name="c", type="TEXT"),
+                TableColumn(column_name="ds", type="TIMESTAMP", is_dttm=True),
+                TableColumn(column_name="ts", type="TIMESTAMP", is_dttm=True),
+            ],
+            metrics=[
+                SqlMetric(metric_name="count", expression="COUNT(*)"),
+                SqlMetric(metric_name="sum_a", expression="SUM(a)"),
+            ],
+        )
+        for i in range(2)
+    ]
+    session.add_all(datasets)
+    session.flush()
+
+    legacy_chart = Slice(
+        slice_name="legacy",
+        datasource_type="table",
+        datasource_id=datasets[0].id,
+        viz_type="table",
+        params=json.dumps({"groupby": ["b"], "metrics": ["count"]}),
+    )
+    chart = Slice(
+        slice_name="chart",
+        datasource_type="table",
+        datasource_id=datasets[1].id,
+        viz_type="echarts_timeseries_bar",
+        params=json.dumps({"x_axis": "ds", "groupby": ["b"], "metrics": ["sum_a"]}),
+        query_context=json.dumps(
+            {
+                "datasource": {"id": datasets[1].id, "type": "table"},
+                "form_data": {"x_axis": "ds"},
+                "queries": [
+                    {"columns": ["ds", {"label": "c", "sqlExpression": "c"}]},
+                    {"granularity": "ts", "columns": ["ds"]},
+                ],
+            }
+        ),
+    )
+    dashboard = Dashboard(dashboard_title="dashboard", slices=[legacy_chart, chart])
+    session.add(dashboard)
+    session.commit()
+
+    result = {data["id"]: data for data in dashboard.datasets_trimmed_for_slices()}
+
+    get_datasources.assert_called_once()
+    get_query_context.assert_not_called()
+    legacy_data = result[datasets[0].id]
+    assert [column["column_name"] for column in legacy_data["columns"]] == ["b"]
+    assert [metric["metric_name"] for metric in legacy_data["metrics"]] == ["count"]
+    assert legacy_data["column_names"] == {"a", "b", "c", "ds", "ts"}
+    assert "description" not in legacy_data
+    data = result[datasets[1].id]
+    assert [column["column_name"] for column in data["columns"]] == ["c", "ds", "ts"]
+    assert [metric["metric_name"] for metric in data["metrics"]] == ["sum_a"]
+    assert set(data["verbose_map"]) == {"__timestamp", "c", "ds", "ts", "sum_a"}
@@ -115,6 +115,61 @@ def test_query_dao_get_queries_changed_after(session: Session) -> None:
     assert result[0].client_id == "updated_foo"
 
 
+def test_query_dao_get_query_statuses(mocker: MockerFixture, session: Session) -> None:
+    from flask_caching.backends import SimpleCache
+
+    from superset import db
+    from superset.daos.query import QueryDAO
+    from superset.models.core import Database
+    from superset.models.sql_lab import Query
+
+    engine = db.session.get_bind()
+    Query.metadata.create_all(engine)  # pylint: disable=no-member
+    cache_manager = mocker.patch("superset.daos.query.cache_manager")
+    cache_manager.cache = SimpleCache()
+
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    now = datetime.utcnow()
+    for client_id, changed_on in [
+        ("old", now - timedelta(days=3)),
+        ("foo", now - timedelta(days=1)),
+        ("bar", now - timedelta(hours=1)),
+    ]:
+        db.session.add(
+            Query(
+                client_id=client_id,
+                database=database,
+                sql="select * from bar",
+                status="running",
+                progress=50,
+                changed_on=changed_on,
+            )
+        )
+    db.session.flush()
+
+    timestamp = datetime.timestamp(now - timedelta(days=2)) * 1000
+    statuses, last_updated_ms = QueryDAO.get_query_statuses(timestamp)
+    assert sorted(status["id"] for status in statuses) == ["bar", "foo"]
+    assert statuses[0]["state"] == "running"
+    assert statuses[0]["progress"] == 50
+    assert last_updated_ms >= datetime.timestamp(now) * 1000
+
+    # the polls covered by the cached statuses don't query the metadata database
+    query = mocker.spy(db.session, "query")
+    statuses, cached_last_updated_ms = QueryDAO.get_query_statuses(
+        datetime.timestamp(now - timedelta(days=1, minutes=1)) * 1000,
+        client_ids=["bar", "old"],
+    )
+    assert [status["id"] for status in statuses] == ["bar"]
+    assert cached_last_updated_ms == last_updated_ms
+    query.assert_not_called()
+
+    # older watermarks are not covered
+    statuses, _ = QueryDAO.get_query_statuses(0)
+    assert len(statuses) == 3
+    query.assert_called_once()
+
+
 def test_query_dao_stop_query_not_found(
     mocker: MockerFixture, app: Any, session: Session
 ) -> None:
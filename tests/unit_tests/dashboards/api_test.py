@@ -0,0 +1,120 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+from typing import Any
+
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from tests.conftest import with_config
+
+
+@with_config({"DASHBOARD_PAYLOAD_CACHE_TIMEOUT": 60})
+def test_get_charts_payload_cache(
+    mocker: MockerFixture,
+    session: Session,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test that the charts of a dashboard are cached under a version which is their
+    ETag, until they change.
+    """
+    from superset.daos.dashboard import DashboardDAO
+    from superset.extensions import cache_manager
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    Dashboard.metadata.create_all(session.get_bind())
+    mocker.patch.object(cache_manager, "_cache", SimpleCache())
+    get_charts = mocker.spy(DashboardDAO, "get_charts_for_dashboard")
+
+    chart = Slice(
+        slice_name="my_chart",
+        datasource_type="table",
+        viz_type="table",
+        params="{}",
+        changed_on=datetime(2024, 1, 1),
+    )
+    dashboard = Dashboard(
+        dashboard_title="my_dashboard",
+        slices=[chart],
+        changed_on=datetime(2024, 1, 1),
+    )
+    session.add(dashboard)
+    session.commit()
+    mocker.patch.object(DashboardDAO, "get_by_id_or_slug", return_value=dashboard)
+
+    response = client.get("/api/v1/dashboard/1/charts")
+    assert response.status_code == 200
+    assert response.json["result"][0]["slice_name"] == "my_chart"
+    etag = response.headers["ETag"]
+
+    cached_response = client.get("/api/v1/dashboard/1/charts")
+    assert cached_response.data == response.data
+    assert cached_response.headers["ETag"] == etag
+    assert get_charts.call_count == 1
+
+    response = client.get("/api/v1/dashboard/1/charts", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert get_charts.call_count == 1
+
+    chart.slice_name = "my_renamed_chart"
+    chart.changed_on = datetime(2024, 1, 2)
+    session.commit()
+    response = client.get("/api/v1/dashboard/1/charts", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json["result"][0]["slice_name"] == "my_renamed_chart"
+    assert response.headers["ETag"] != etag
+    assert get_charts.call_count == 2
+
+
+def test_get_logs_not_modified(
+    mocker: MockerFixture,
+    session: Session,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test that the requests of a dashboard answered with a 304 are logged too.
+    """
+    from superset.daos.dashboard import DashboardDAO
+    from superset.extensions import event_logger
+    from superset.models.dashboard import Dashboard
+
+    Dashboard.metadata.create_all(session.get_bind())
+    log_with_context = mocker.patch.object(
+        event_logger._get_current_object(), "log_with_context"
+    )
+
+    dashboard = Dashboard(dashboard_title="my_dashboard")
+    session.add(dashboard)
+    session.commit()
+    mocker.patch.object(DashboardDAO, "get_by_id_or_slug", return_value=dashboard)
+
+    response = client.get("/api/v1/dashboard/1")
+    assert response.status_code == 200
+    response = client.get(
+        "/api/v1/dashboard/1", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+    assert log_with_context.call_count == 2
+    for call in log_with_context.call_args_list:
+        assert call.args[0] == "DashboardRestApi.get"
+        assert call.kwargs["dashboard_id"] == dashboard.id
@@ -73,3 +73,65 @@ def test_remove_favorite(session: Session) -> None:
 
     DashboardDAO.remove_favorite(dashboard)
     assert len(DashboardDAO.favorited_ids([dashboard])) == 0
+
+
+def test_get_dashboard_changed_on(session: Session) -> None:
+    """
+    Test that the latest changes of the charts and datasets of a dashboard are
+    queried without loading them.
+    """
+    from datetime import datetime
+
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.daos.dashboard import DashboardDAO
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    Dashboard.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+
+    database = Database(database_name="my_db", sqlalchemy_uri="sqlite://")
+    datasets = [SqlaTable(table_name=f"table_{i}", database=database) for i in range(3)]
+    session.add_all(datasets)
+    session.flush()
+
+    charts = [
+        Slice(
+            slice_name=f"chart_{i}",
+            datasource_type="table",
+            datasource_id=dataset.id,
+        )
+        for i, dataset in enumerate(datasets)
+    ]
+    dashboard = Dashboard(dashboard_title="dashboard", slices=charts[:2])
+    empty_dashboard = Dashboard(dashboard_title="empty_dashboard")
+    session.add_all([dashboard, empty_dashboard])
+    session.commit()
+
+    for model, day in (
+        (dashboard, 1),
+        (empty_dashboard, 1),
+        (charts[0], 2),
+        (charts[1], 3),
+        (charts[2], 9),
+        (datasets[0], 5),
+        (datasets[1], 4),
+        (datasets[2], 8),
+    ):
+        session.query(type(model)).filter_by(id=model.id).update(
+            {"changed_on": datetime(2024, 1, day, 12, 0, 0, 1)}
+        )
+    session.commit()
+
+    assert DashboardDAO.get_dashboard_and_slices_changed_on(dashboard) == datetime(
+        2024, 1, 3, 12
+    )
+    assert DashboardDAO.get_dashboard_and_datasets_changed_on(dashboard) == datetime(
+        2024, 1, 5, 12
+    )
+    assert DashboardDAO.get_dashboard_and_slices_changed_on(
+        empty_dashboard
+    ) == datetime(2024, 1, 1, 12)
+    assert DashboardDAO.get_dashboard_and_datasets_changed_on(
+        empty_dashboard
+    ) == datetime(2024, 1, 1, 12)
@@ -894,3 +894,58 @@ def test_extract_errors_no_match_falls_back(mocker: MockerFixture) -> None:
         engine_name="ExampleEngine",
     )
     assert result == [expected]
+
+
+def test_fetch_data_batches(mocker: MockerFixture) -> None:
+    """
+    Test that the rows are fetched in batches, with the column mutators applied.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class TestEngineSpec(BaseEngineSpec):
+        column_type_mutators = {types.String: str.upper}
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("id", "INTEGER"), ("name", "VARCHAR")]
+    rows = [(1, "a"), (2, "b"), (3, "c")]
+    cursor.fetchmany.side_effect = lambda size: [rows.pop(0) for _ in rows[:size]]
+
+    batches = list(TestEngineSpec.fetch_data_batches(cursor, batch_size=2))
+
+    assert batches == [[(1, "A"), (2, "B")], [(3, "C")]]
+    cursor.fetchmany.assert_called_with(2)
+
+
+def test_fetch_data_batches_empty(mocker: MockerFixture) -> None:
+    """
+    Test that a single empty batch is yielded when there are no rows.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    cursor = mocker.MagicMock()
+    cursor.fetchmany.return_value = []
+
+    assert list(BaseEngineSpec.fetch_data_batches(cursor, batch_size=2)) == [[]]
+
+
+def test_fetch_data_batches_fetch_data_override(mocker: MockerFixture) -> None:
+    """
+    Test that the rows post-processed by a `fetch_data` override come in one batch.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class TestEngineSpec(BaseEngineSpec):
+        @classmethod
+        def fetch_data(
+            cls,
+            cursor: Any,
+            limit: int | None = None,
+        ) -> list[tuple[Any, ...]]:
+            return [(1,), (2,), (3,)]
+
+    cursor = mocker.MagicMock()
+
+    batches = list(TestEngineSpec.fetch_data_batches(cursor, batch_size=2))
+
+    assert batches == [[(1,), (2,), (3,)]]
+    cursor.fetchmany.assert_not_called()
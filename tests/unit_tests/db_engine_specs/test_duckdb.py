@@ -163,3 +163,25 @@ def test_column_type_recognition() -> None:
     col_spec = DuckDBEngineSpec.get_column_spec("TINYINT")
     # TINYINT matches the pattern "^int" so it should be recognized
     assert col_spec is None, "TINYINT doesn't match any patterns"
+
+
+def test_fetch_arrow() -> None:
+    """
+    Test fetching the results of DuckDB as an Arrow table.
+    """
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    engine = create_engine("duckdb:///:memory:")
+    connection = engine.raw_connection()
+    cursor = connection.cursor()
+    cursor.execute("SELECT range AS id, 'a' AS name FROM range(3)")
+    description = cursor.description
+
+    table = DuckDBEngineSpec.fetch_arrow(cursor)
+
+    assert table.column_names == ["id", "name"]
+    assert table.column("id").to_pylist() == [0, 1, 2]
+    assert cursor.description == description
+    connection.close()
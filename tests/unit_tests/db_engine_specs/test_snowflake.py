@@ -438,3 +438,24 @@ def test_unmask_encrypted_extra() -> None:
             },
         }
     )
+
+
+def test_fetch_arrow(mocker: MockerFixture) -> None:
+    """
+    Test fetching the results of Snowflake as an Arrow table.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
+
+    class NotSupportedError(Exception):
+        pass
+
+    table = pa.table({"a": [1, 2]})
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_all.return_value = table
+    assert SnowflakeEngineSpec.fetch_arrow(cursor) is table
+
+    # results in the JSON format are fetched as rows
+    cursor.fetch_arrow_all.side_effect = NotSupportedError()
+    assert SnowflakeEngineSpec.fetch_arrow(cursor) is None
@@ -99,3 +99,17 @@ def test_key_value_distributed_lock_expired() -> None:
                 assert _get_lock(MAIN_KEY, session) is None
 
         assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_key_value_distributed_lock_released_on_error() -> None:
+    """
+    Test that the distributed lock is released when the locked code fails.
+    """
+    session = _get_other_session()
+
+    with freeze_time("2021-01-01"):
+        with pytest.raises(ValueError, match="failed"):
+            with KeyValueDistributedLock("ns", a=1, b=2):
+                raise ValueError("failed")
+
+        assert _get_lock(MAIN_KEY, session) is None
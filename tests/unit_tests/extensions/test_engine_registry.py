@@ -0,0 +1,137 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import create_engine
+
+from superset.extensions.engine_registry import (
+    EngineRegistry,
+    instrument_engine,
+    InstrumentedQueuePool,
+)
+
+
+def test_engine_registry_get() -> None:
+    """
+    Test that the engines are created once per key.
+    """
+    registry = EngineRegistry()
+    create = MagicMock(side_effect=lambda: MagicMock())
+
+    engine = registry.get((1, "a"), create, max_engines=10, idle_timeout=60)
+    assert registry.get((1, "a"), create, max_engines=10, idle_timeout=60) is engine
+    assert registry.get((1, "b"), create, max_engines=10, idle_timeout=60) is not engine
+    assert create.call_count == 2
+
+
+def test_engine_registry_max_engines() -> None:
+    """
+    Test that the least recently used engines are disposed when the registry is full.
+    """
+    registry = EngineRegistry()
+    engines = {key: MagicMock() for key in "abc"}
+
+    def get(key: str) -> MagicMock:
+        return registry.get(
+            (1, key), lambda: engines[key], max_engines=2, idle_timeout=60
+        )
+
+    get("a")
+    get("b")
+    get("a")
+    get("c")
+
+    engines["b"].dispose.assert_called_once()
+    engines["a"].dispose.assert_not_called()
+    engines["c"].dispose.assert_not_called()
+
+
+def test_engine_registry_idle_timeout() -> None:
+    """
+    Test that the engines unused for a while are disposed.
+    """
+    registry = EngineRegistry()
+    old, new = MagicMock(), MagicMock()
+
+    with patch("superset.extensions.engine_registry.time.monotonic") as monotonic:
+        monotonic.return_value = 0
+        registry.get((1, "old"), lambda: old, max_engines=10, idle_timeout=60)
+        monotonic.return_value = 100
+        registry.get((1, "new"), lambda: new, max_engines=10, idle_timeout=60)
+
+    old.dispose.assert_called_once()
+    new.dispose.assert_not_called()
+
+
+def test_engine_registry_dispose() -> None:
+    """
+    Test disposing the engines of a database.
+    """
+    registry = EngineRegistry()
+    first, second = MagicMock(), MagicMock()
+    registry.get((1, "a"), lambda: first, max_engines=10, idle_timeout=60)
+    registry.get((2, "a"), lambda: second, max_engines=10, idle_timeout=60)
+
+    registry.dispose(1)
+
+    first.dispose.assert_called_once()
+    second.dispose.assert_not_called()
+    assert registry.get((1, "a"), MagicMock, max_engines=10, idle_timeout=60) != first
+
+
+def test_engine_registry_fork() -> None:
+    """
+    Test that a forked process doesn't reuse the connections of its parent.
+    """
+    registry = EngineRegistry()
+    parent = MagicMock()
+    registry.get((1, "a"), lambda: parent, max_engines=10, idle_timeout=60)
+
+    with patch("superset.extensions.engine_registry.os.getpid", return_value=-1):
+        child = registry.get((1, "a"), MagicMock, max_engines=10, idle_timeout=60)
+
+    assert child is not parent
+    parent.dispose.assert_called_once_with(close=False)
+
+
+def test_instrumented_engine() -> None:
+    """
+    Test that the pool activity is reported to the stats logger.
+    """
+    stats_logger = MagicMock()
+    engine = instrument_engine(
+        create_engine("sqlite://", poolclass=InstrumentedQueuePool),
+        stats_logger,
+    )
+
+    for _ in range(2):
+        with engine.connect() as connection:
+            connection.exec_driver_sql("SELECT 1")
+
+    assert [call.args[0] for call in stats_logger.incr.call_args_list] == [
+        "db_engine_pool_connect",
+        "db_engine_pool_checkout",
+        "db_engine_pool_checkout",
+    ]
+    assert [call.args[0] for call in stats_logger.timing.call_args_list] == [
+        "db_engine_pool_wait",
+        "db_engine_pool_wait",
+    ]
+
+    # the pool recreated when disposing the engine keeps reporting
+    engine.dispose()
+    assert engine.pool.stats_logger is stats_logger
@@ -0,0 +1,231 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask_caching.backends import SimpleCache
+
+from superset.extensions.two_tier_cache import TwoTierCache
+from superset.utils import json
+
+
+@pytest.fixture
+def backend() -> SimpleCache:
+    return SimpleCache()
+
+
+def make_cache(backend: SimpleCache, **kwargs: Any) -> TwoTierCache:
+    return TwoTierCache(
+        backend, name="data", max_bytes=kwargs.pop("max_bytes", 10_000), **kwargs
+    )
+
+
+def test_two_tier_cache_get(backend: SimpleCache) -> None:
+    """
+    Test that the values read from the backend are then served from memory.
+    """
+    incr = MagicMock()
+    cache = make_cache(backend, timeout=60, incr=incr)
+    backend.set("key", {"a": [1, 2]})
+
+    with patch.object(backend, "get", wraps=backend.get) as mock_get:
+        assert cache.get("key") == {"a": [1, 2]}
+        assert cache.get("key") == {"a": [1, 2]}
+        assert cache.get("missing") is None
+
+    assert [call.args[0] for call in mock_get.call_args_list] == ["key", "missing"]
+    assert [call.args[0] for call in incr.call_args_list] == [
+        "cache_data_l1_miss",
+        "cache_data_l2_hit",
+        "cache_data_l1_hit",
+        "cache_data_l1_miss",
+        "cache_data_l2_miss",
+    ]
+
+
+def test_two_tier_cache_copies(backend: SimpleCache) -> None:
+    """
+    Test that the values served from memory can't be altered by the callers.
+    """
+    cache = make_cache(backend, timeout=60)
+    cache.set("key", {"a": [1, 2]})
+
+    cache.get("key")["a"].append(3)
+    assert cache.get("key") == {"a": [1, 2]}
+
+
+def test_two_tier_cache_ttl(backend: SimpleCache) -> None:
+    """
+    Test that the values are kept in memory for at most the L1 timeout.
+    """
+    cache = make_cache(backend, timeout=60)
+    with patch("superset.extensions.two_tier_cache.time.monotonic", return_value=0):
+        cache.set("key", 1)
+    backend.set("key", 2)
+
+    with patch("superset.extensions.two_tier_cache.time.monotonic", return_value=59):
+        assert cache.get("key") == 1
+    with patch("superset.extensions.two_tier_cache.time.monotonic", return_value=61):
+        assert cache.get("key") == 2
+
+
+def test_two_tier_cache_backend_ttl(backend: SimpleCache) -> None:
+    """
+    Test that the values read from the backend are kept in memory for no longer than
+    they are left to live in it, and that the excluded keys are never kept.
+    """
+    cache = make_cache(backend, timeout=60, excluded_keys=["version"])
+    backend.set("short", 1, timeout=5)
+    backend.set("long", 2, timeout=300)
+    backend.set("forever", 3, timeout=0)
+    backend.set("version", 4, timeout=0)
+
+    with patch("superset.extensions.two_tier_cache.time.monotonic", return_value=0):
+        assert cache.get_many("short", "long", "forever", "version") == [1, 2, 3, 4]
+        cache.set("version", 5, timeout=0)
+    assert list(cache._entries) == ["short", "long", "forever"]
+    assert 0 < cache._entries["short"][0] <= 5
+    assert cache._entries["long"][0] == cache._entries["forever"][0] == 60
+
+
+def test_two_tier_cache_redis_ttl() -> None:
+    """
+    Test that the remaining time to live of the values is read from Redis.
+    """
+    redis = MagicMock()
+    redis.pipeline.return_value.execute.return_value = [1500, -1, -2]
+    backend = MagicMock(
+        _read_client=redis,
+        _get_prefix=lambda: "superset_",
+        default_timeout=300,
+        spec=["_read_client", "_get_prefix", "default_timeout", "get_many"],
+    )
+    backend.get_many.return_value = [1, 2, 3]
+    cache = make_cache(backend, timeout=60)
+
+    with patch("superset.extensions.two_tier_cache.time.monotonic", return_value=0):
+        assert cache.get_many("short", "forever", "expired") == [1, 2, 3]
+    assert [call.args for call in redis.pipeline.return_value.pttl.call_args_list] == [
+        ("superset_short",),
+        ("superset_forever",),
+        ("superset_expired",),
+    ]
+    assert {key: entry[0] for key, entry in cache._entries.items()} == {
+        "short": 1.5,
+        "forever": 60,
+    }
+
+
+def test_two_tier_cache_unknown_ttl() -> None:
+    """
+    Test that the values read from backends not exposing their remaining time to live
+    are only kept in memory when written by the process.
+    """
+    backend = MagicMock(default_timeout=300, spec=["default_timeout", "get", "set"])
+    backend.get.return_value = 1
+    cache = make_cache(backend, timeout=60)
+
+    assert cache.get("key") == 1
+    assert "key" not in cache._entries
+    cache.set("key", 2)
+    assert cache.get("key") == 2
+    backend.get.assert_called_once_with("key")
+
+
+def test_two_tier_cache_lru(backend: SimpleCache) -> None:
+    """
+    Test that the least recently used values are evicted first.
+    """
+    value = "x" * 400
+    cache = make_cache(backend, timeout=60, max_bytes=1000)
+    cache.set("a", value)
+    cache.set("b", value)
+    cache.get("a")
+    cache.set("c", value)
+    # too large to be kept in memory
+    cache.set("d", value * 3)
+
+    assert list(cache._entries) == ["a", "c"]
+    assert cache._size <= 1000
+    assert cache.get_many("a", "b", "c", "d") == [value, value, value, value * 3]
+
+
+def test_two_tier_cache_writes(backend: SimpleCache) -> None:
+    """
+    Test that writes go to the backend and are visible in memory.
+    """
+    cache = make_cache(backend, timeout=60)
+    cache.set("key", 1)
+    assert backend.get("key") == 1
+
+    cache.set_many({"key": 2, "other": 3})
+    assert cache.get("key") == 2
+    assert backend.get("other") == 3
+
+    assert not cache.add("key", 4)
+    cache.delete("key")
+    assert not cache.has("key")
+    assert cache.add("key", 4)
+    assert cache.get("key") == 4
+
+    cache.clear()
+    assert cache.get("other") is None
+
+
+def test_two_tier_cache_invalidation(backend: SimpleCache) -> None:
+    """
+    Test that the changed keys are published, and dropped by the other processes.
+    """
+    backend._write_client = MagicMock()  # type: ignore
+    cache = make_cache(backend, timeout=60, invalidation_channel="invalidations")
+    other = make_cache(backend, timeout=60, invalidation_channel="invalidations")
+    other.set("key", 1)
+
+    cache.set("key", 2)
+    channel, message = backend._write_client.publish.call_args.args  # type: ignore
+    assert channel == "invalidations:data"
+    assert json.loads(message)["keys"] == ["key"]
+
+    # a process ignores its own invalidations
+    cache._on_message({"data": message})
+    assert "key" in cache._entries
+    other._on_message({"data": message})
+    assert "key" not in other._entries
+    assert other.get("key") == 2
+
+
+def test_init_l1_cache() -> None:
+    """
+    Test that the L1 tier is only put in front of actual cache backends.
+    """
+    from flask import current_app
+    from flask_caching import Cache
+
+    from superset.constants import CacheRegion
+    from superset.utils.cache_manager import CacheManager
+
+    for cache_type, enabled, wrapped in [
+        ("SimpleCache", True, True),
+        ("SimpleCache", False, False),
+        ("NullCache", True, False),
+    ]:
+        cache = Cache(config={"CACHE_TYPE": cache_type})
+        cache.init_app(current_app)
+        with patch.dict(current_app.config, {"CACHE_L1_ENABLED": enabled}):
+            CacheManager._init_l1_cache(current_app, cache, CacheRegion.DATA)
+        assert isinstance(cache.cache, TwoTierCache) is wrapped
@@ -18,6 +18,7 @@
 # pylint: disable=import-outside-toplevel
 from datetime import datetime
 
+import pandas as pd
 import pytest
 from flask import current_app
 from pytest_mock import MockerFixture
@@ -31,12 +32,13 @@ from sqlalchemy import (
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.orm.session import Session
+from sqlalchemy.pool import NullPool
 from sqlalchemy.sql import Select
 
 from superset.connectors.sqla.models import SqlaTable, TableColumn
 from superset.errors import SupersetErrorType
 from superset.exceptions import OAuth2Error, OAuth2RedirectError
-from superset.models.core import Database
+from superset.models.core import Database, dispose_database_engines
 from superset.sql.parse import LimitMethod, Table
 from superset.utils import json
 from tests.unit_tests.conftest import with_feature_flags
@@ -709,9 +711,41 @@ def test_engine_context_manager(mocker: MockerFixture, app_context: None) -> Non
         nullpool=True,
         source=None,
         sqlalchemy_uri="trino://",
+        reuse_engine=False,
     )
 
 
+def test_engine_registry(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the engines are reused when `DB_ENGINE_REGISTRY` is enabled.
+    """
+    mocker.patch.dict(current_app.config, {"DB_ENGINE_REGISTRY": True})
+    mocker.patch("superset.daos.database.DatabaseDAO.get_ssh_tunnel", return_value=None)
+    dispose = mocker.patch("superset.extensions.engine_registry.Engine.dispose")
+
+    database = Database(id=1, database_name="my_db", sqlalchemy_uri="sqlite://")
+    with database.get_sqla_engine() as engine:
+        assert not isinstance(engine.pool, NullPool)
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("SELECT 1").scalar() == 1
+    with database.get_sqla_engine() as other:
+        assert other is engine
+    with database.get_sqla_engine(schema="main") as other:
+        assert other is not engine
+
+    dispose_database_engines(None, None, database)
+    assert dispose.call_count == 2
+    with database.get_sqla_engine() as other:
+        assert other is not engine
+
+    # non pooled engines are still created for each use
+    with database.get_sqla_engine(nullpool=False) as engine:
+        with database.get_sqla_engine(nullpool=False) as other:
+            assert other is not engine
+
+    dispose_database_engines(None, None, database)
+
+
 def test_engine_oauth2(mocker: MockerFixture) -> None:
     """
     Test that we handle OAuth2 when `create_engine` fails.
@@ -1060,3 +1094,55 @@ def test_apply_limit_to_sql(
 
     limited = db.apply_limit_to_sql(sql, limit, force)
     assert limited == expected
+
+
+def test_get_df_logs_load_into_dataframe(mocker: MockerFixture) -> None:
+    """
+    Test that `get_df` logs the conversion of the results into a DataFrame.
+    """
+    event_logger = mocker.patch(
+        "superset.models.core.event_logger", new_callable=mocker.MagicMock
+    )
+    db = Database(database_name="test_database", sqlalchemy_uri="sqlite://")
+
+    df = db.get_df("SELECT 1 AS a")
+
+    assert df["a"].tolist() == [1]
+    event_logger.log_context.assert_any_call(
+        action="load_into_dataframe",
+        object_ref="Database.load_into_dataframe",
+    )
+
+
+def test_iter_df() -> None:
+    """
+    Test that `iter_df` yields the results of the last statement in chunks.
+    """
+    db = Database(database_name="test_database", sqlalchemy_uri="sqlite://")
+    sql = """
+CREATE TABLE t (a INTEGER, b TEXT);
+INSERT INTO t VALUES (1, 'x'), (2, 'y'), (3, 'z'), (4, 'w'), (5, 'v');
+SELECT a, b FROM t ORDER BY a
+    """
+
+    chunks = list(db.iter_df(sql, chunk_size=2))
+
+    assert [len(df) for df in chunks] == [2, 2, 1]
+    assert [df.columns.tolist() for df in chunks] == [["a", "b"]] * 3
+    assert pd.concat(chunks)["a"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_iter_df_empty_result() -> None:
+    """
+    Test that `iter_df` yields a single DataFrame when there are no rows.
+    """
+    db = Database(database_name="test_database", sqlalchemy_uri="sqlite://")
+    sql = "CREATE TABLE t (a INTEGER); SELECT a FROM t"
+
+    chunks = list(
+        db.iter_df(sql, mutator=lambda df: df.rename(columns={"a": "A"}), chunk_size=2)
+    )
+
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert chunks[0].columns.tolist() == ["A"]
@@ -18,14 +18,21 @@
 # pylint: disable=import-outside-toplevel, unused-argument
 
 from datetime import datetime, timezone
+from decimal import Decimal
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pytest
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
 from superset.db_engine_specs.base import BaseEngineSpec
-from superset.result_set import stringify_values, SupersetResultSet
+from superset.result_set import (
+    stringify_values,
+    SupersetResultSet,
+    transpose_rows,
+)
 from superset.superset_typing import DbapiResult
 
 
@@ -185,3 +192,196 @@ def test_get_column_description_from_empty_data_using_cursor_description(
     )
     assert any(col.get("column_name") == "__time" for col in result_set.columns)
     logger.exception.assert_not_called()
+
+
+def test_transpose_rows() -> None:
+    """
+    Test that rows are transposed into the values of each column.
+    """
+    assert transpose_rows([(1, "a"), (2, "b")], 2) == [(1, 2), ("a", "b")]
+    assert transpose_rows([[1, "a"]], 2) == [(1,), ("a",)]
+    assert transpose_rows([], 2) == [(), ()]
+
+    with pytest.raises(ValueError, match="Expected rows of 3 values"):
+        transpose_rows([(1, "a")], 3)
+
+    with pytest.raises(ValueError, match="zip()"):
+        transpose_rows([(1, "a"), (2,)], 2)
+
+
+def test_stringify_only_mixed_columns() -> None:
+    """
+    Test that only the columns Arrow can't convert natively are stringified.
+    """
+    data = [
+        (1, "a", [1, 2], datetime(2023, 1, 1)),
+        (2, 3, None, None),
+    ]
+    description = [
+        ("id", None, None, None, None, None, None),
+        ("mixed", None, None, None, None, None, None),
+        ("nested", None, None, None, None, None, None),
+        ("dttm", None, None, None, None, None, None),
+    ]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.schema.types == [
+        pa.int64(),
+        pa.string(),
+        pa.string(),
+        pa.timestamp("us"),
+    ]
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "id": [1, 2],
+        "mixed": ["a", "3"],
+        "nested": ["[1, 2]", None],
+        "dttm": [pd.Timestamp("2023-01-01"), pd.NaT],
+    }
+
+
+def test_decimal_type_from_cursor_description() -> None:
+    """
+    Test that the precision and scale of decimals are taken from the description.
+    """
+    data = [(Decimal("1.20"), Decimal("1.234")), (None, Decimal("2"))]
+    description = [
+        ("price", None, None, None, 10, 2, None),
+        # the values don't fit the reported scale, so the type is inferred
+        ("rate", None, None, None, 10, 2, None),
+    ]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.schema.types == [
+        pa.decimal128(10, 2),
+        pa.decimal128(4, 3),
+    ]
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "price": [Decimal("1.20"), None],
+        "rate": [Decimal("1.234"), Decimal("2.000")],
+    }
+
+
+def test_from_batches() -> None:
+    """
+    Test that a result set built from batches matches the one built from all rows.
+    """
+    data = [
+        (1, None, "a", None),
+        (2, None, 3, datetime(2023, 1, 1)),
+        (3, 1.5, "c", datetime(2023, 1, 2)),
+        (4, 2, "d", None),
+    ]
+    description = [
+        ("id", None, None, None, None, None, None),
+        ("value", None, None, None, None, None, None),
+        ("mixed", None, None, None, None, None, None),
+        ("dttm", None, None, None, None, None, None),
+    ]
+    result_set = SupersetResultSet.from_batches(
+        iter([data[:2], [], data[2:]]),
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert result_set.pa_table.schema.types == [
+        pa.int64(),
+        pa.float64(),
+        pa.string(),
+        pa.timestamp("us"),
+    ]
+    expected = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+    pd.testing.assert_frame_equal(result_set.to_pandas_df(), expected.to_pandas_df())
+    assert result_set.columns == expected.columns
+
+
+def test_from_batches_on_table() -> None:
+    """
+    Test that each non-empty batch is passed to `on_table` once converted to Arrow.
+    """
+    tables = []
+    SupersetResultSet.from_batches(
+        iter([[(1,), (2,)], [], [(3,)]]),
+        [("id", "INT", None, None, None, None, None)],  # type: ignore
+        BaseEngineSpec,
+        on_table=tables.append,
+    )
+
+    assert [table.column("id").to_pylist() for table in tables] == [[1, 2], [3]]
+
+
+def test_from_batches_empty() -> None:
+    """
+    Test building a result set from an empty batch.
+    """
+    description = [("id", "INT", None, None, None, None, None)]
+    result_set = SupersetResultSet.from_batches(
+        iter([[]]),
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert result_set.size == 0
+    assert result_set.pa_table.column_names == ["id"]
+
+
+def test_from_arrow() -> None:
+    """
+    Test that the Arrow tables returned by drivers are normalized.
+    """
+    table = pa.table(
+        {
+            "id": pa.array([1, 2]),
+            "tags": pa.array([["a", "b"], None]),
+            "kind": pa.array(["x", "y"]).dictionary_encode(),
+        }
+    )
+    description = [
+        ("id", "INT", None, None, None, None, None),
+        ("tags", "ARRAY", None, None, None, None, None),
+        ("id", "VARCHAR", None, None, None, None, None),
+    ]
+    result_set = SupersetResultSet.from_arrow(
+        table,
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert result_set.pa_table.column_names == ["id", "tags", "id__1"]
+    assert result_set.pa_table.schema.types == [pa.int64(), pa.string(), pa.string()]
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "id": [1, 2],
+        "tags": ['["a", "b"]', None],
+        "id__1": ["x", "y"],
+    }
+    assert [column["type"] for column in result_set.columns] == [
+        "INT",
+        "ARRAY",
+        "VARCHAR",
+    ]
+
+
+@pytest.mark.parametrize("arrow_fetch", [True, False])
+def test_from_cursor(
+    mocker: MockerFixture, app_context: None, arrow_fetch: bool
+) -> None:
+    """
+    Test that the results are fetched as Arrow only when enabled and supported.
+    """
+    from flask import current_app
+
+    mocker.patch.dict(current_app.config, {"DB_ARROW_FETCH": arrow_fetch})
+    db_engine_spec = mocker.MagicMock()
+    db_engine_spec.fetch_arrow.return_value = pa.table({"a": [1, 2, 3]})
+    db_engine_spec.fetch_data_batches.return_value = iter([[(4,), (5,)], [(6,)]])
+    db_engine_spec.get_datatype.return_value = None
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", None, None, None, None, None, None)]
+
+    result_set = SupersetResultSet.from_cursor(cursor, db_engine_spec, limit=2)
+
+    if arrow_fetch:
+        assert result_set.to_pandas_df()["a"].tolist() == [1, 2]
+        db_engine_spec.fetch_data_batches.assert_not_called()
+    else:
+        assert result_set.to_pandas_df()["a"].tolist() == [4, 5, 6]
+        db_engine_spec.fetch_arrow.assert_not_called()
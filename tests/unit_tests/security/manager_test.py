@@ -22,11 +22,12 @@ import json  # noqa: TID251
 import pytest
 from flask_appbuilder.security.sqla.models import Role, User
 from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
 
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import Database, SqlaTable
 from superset.exceptions import SupersetSecurityException
-from superset.extensions import appbuilder
+from superset.extensions import appbuilder, security_manager
 from superset.models.slice import Slice
 from superset.security.manager import (
     query_context_modified,
@@ -1186,3 +1187,103 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_get_rls_filters_cache(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that the RLS filters are resolved once per request and cached across
+    requests, until they change.
+    """
+    from flask import g
+    from flask_caching.backends import SimpleCache
+
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+    from superset.extensions import cache_manager
+    from superset.utils.core import RowLevelSecurityFilterType
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    mocker.patch.object(cache_manager, "_cache", SimpleCache())
+    query_rls_filters = mocker.spy(security_manager, "_query_rls_filters")
+
+    role = Role(name="my_role")
+    user = User(
+        first_name="first",
+        last_name="last",
+        username="my_user",
+        email="my_user@example.com",
+        roles=[role],
+    )
+    table = SqlaTable(
+        table_name="my_table",
+        database=Database(database_name="my_db", sqlalchemy_uri="sqlite://"),
+    )
+    rls_filter = RowLevelSecurityFilter(
+        name="my_filter",
+        filter_type=RowLevelSecurityFilterType.REGULAR,
+        clause="a = 1",
+        roles=[role],
+        tables=[table],
+    )
+    session.add_all([user, table, rls_filter])
+    session.commit()
+
+    with override_user(user):
+        assert [f.clause for f in security_manager.get_rls_filters(table)] == ["a = 1"]
+        security_manager.get_rls_filters(table)
+        g.pop("rls_filters")
+        security_manager.get_rls_filters(table)
+        assert query_rls_filters.call_count == 1
+
+        rls_filter.clause = "a = 2"
+        session.commit()
+        assert [f.clause for f in security_manager.get_rls_filters(table)] == ["a = 2"]
+        assert query_rls_filters.call_count == 2
+
+
+def test_permission_index_cache(mocker: MockerFixture, session: Session) -> None:
+    """
+    Test that the permissions of a set of roles are indexed once per request and
+    cached across requests, until they change.
+    """
+    from flask import g
+    from flask_appbuilder.security.sqla.models import (
+        Permission,
+        PermissionView,
+        ViewMenu,
+    )
+    from flask_caching.backends import SimpleCache
+
+    from superset.extensions import cache_manager
+
+    Role.metadata.create_all(session.get_bind())
+    mocker.patch.object(cache_manager, "_cache", SimpleCache())
+    query_permission_index = mocker.spy(security_manager, "_query_permission_index")
+
+    dashboard = ViewMenu(name="Dashboard")
+    can_read = PermissionView(
+        permission=Permission(name="can_read"), view_menu=dashboard
+    )
+    role = Role(name="my_role", permissions=[can_read])
+    user = User(
+        first_name="first",
+        last_name="last",
+        username="my_user",
+        email="my_user@example.com",
+        roles=[role],
+    )
+    session.add(user)
+    session.commit()
+
+    with override_user(user):
+        assert security_manager.can_access("can_read", "Dashboard")
+        assert not security_manager.can_access("can_write", "Dashboard")
+        g.pop("permission_indexes")
+        assert security_manager.user_view_menu_names("can_read") == {"Dashboard"}
+        assert query_permission_index.call_count == 1
+
+        role.permissions.append(
+            PermissionView(permission=Permission(name="can_write"), view_menu=dashboard)
+        )
+        session.commit()
+        assert security_manager.can_access("can_write", "Dashboard")
+        assert query_permission_index.call_count == 2
@@ -30,6 +30,7 @@ from superset.sql.parse import (
     KQLTokenType,
     KustoKQLStatement,
     LimitMethod,
+    ParseCache,
     process_jinja_sql,
     remove_quotes,
     RLSMethod,
@@ -2889,3 +2890,41 @@ def test_has_subquery(sql: str, engine: str, expected: bool) -> None:
     Test the `has_subquery` method.
     """
     assert SQLStatement(sql, engine).has_subquery() == expected
+
+
+def test_parse_cache(mocker: MockerFixture) -> None:
+    """
+    Test that parsed statements are cached, and copied before being modified.
+    """
+    cache = ParseCache(max_size=100)
+    mocker.patch("superset.sql.parse.PARSE_CACHE", cache)
+    parse = mocker.spy(SQLStatement, "_parse")
+    sql = "SELECT * FROM some_table; SELECT * FROM other_table"
+
+    script = SQLScript(sql, "postgresql")
+    script.statements[0].set_limit_value(10)
+    script.statements[1].as_cte()
+
+    other_script = SQLScript(sql, "postgresql")
+    assert other_script.format() == (
+        "SELECT\n  *\nFROM some_table;\nSELECT\n  *\nFROM other_table"
+    )
+    assert other_script.statements[1].tables == {Table("other_table")}
+    statement = SQLStatement("SELECT * FROM some_table", "postgresql")
+    assert statement.get_limit_value() is None
+    assert parse.call_count == 2
+
+    SQLScript(sql, "mysql")
+    assert parse.call_count == 3
+    assert cache.info() == {
+        "hits": 1,
+        "misses": 3,
+        "hit_rate": 0.25,
+        "entries": 2,
+        "size": 75,
+        "max_size": 100,
+    }
+
+    # the least recently used script was evicted to make room for the last one
+    SQLScript(sql, "postgresql")
+    assert parse.call_count == 4
@@ -24,6 +24,7 @@ import pytest
 from freezegun import freeze_time
 from pytest_mock import MockerFixture
 
+from superset import sql_lab
 from superset.common.db_query_status import QueryStatus
 from superset.db_engine_specs.postgres import PostgresEngineSpec
 from superset.errors import ErrorLevel, SupersetErrorType
@@ -35,6 +36,7 @@ from superset.sql_lab import (
     execute_sql_statements,
     get_sql_results,
 )
+from superset.sqllab.limiting_factor import LimitingFactor
 from superset.utils.rls import apply_rls, get_predicates_for_table
 from tests.conftest import with_config
 from tests.unit_tests.models.core_test import oauth2_client_info
@@ -51,10 +53,10 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
     database = query.database
     database.allow_dml = False
     db_engine_spec = database.db_engine_spec
-    db_engine_spec.fetch_data.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
     SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+    SupersetResultSet.from_cursor.return_value.size = 1
 
     execute_query(query, cursor=cursor, log_params={})
 
@@ -63,7 +65,33 @@ def test_execute_query(mocker: MockerFixture, app: None) -> None:
         "SELECT 42 AS answer",
         query,
     )
-    SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
+    SupersetResultSet.from_cursor.assert_called_with(
+        cursor, db_engine_spec, 2, on_table=None
+    )
+
+
+def test_execute_query_limited(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_query` drops the extra row fetched to detect the limit.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    query = mocker.MagicMock()
+    query.executed_sql = "SELECT a FROM t"
+    query.limit = 2
+    query.database.db_engine_spec = BaseEngineSpec
+    query.database.allow_dml = False
+    query.limiting_factor = LimitingFactor.QUERY
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INT", None, None, None, None, None)]
+    cursor.fetchmany.return_value = [(1,), (2,), (3,)]
+    mocker.patch.object(BaseEngineSpec, "execute_with_cursor")
+
+    result_set = execute_query(query, cursor=cursor, log_params={})
+
+    assert result_set.to_pandas_df()["a"].tolist() == [1, 2]
+    assert query.limiting_factor == LimitingFactor.QUERY
 
 
 @with_config(
@@ -189,6 +217,249 @@ def test_execute_sql_statement_within_payload_limit(mocker: MockerFixture, app)
         )
 
 
+@with_config(
+    {
+        "SQLLAB_RESULTS_COLUMNAR_STORAGE": True,
+        "SQLLAB_RESULTS_ROW_GROUP_SIZE": 2,
+        "DISALLOWED_SQL_FUNCTIONS": {},
+        "SQLLAB_CTAS_NO_LIMIT": False,
+        "SQL_MAX_ROW": 100000,
+        "STATS_LOGGER": MagicMock(),
+    }
+)
+def test_execute_sql_statements_columnar_storage(mocker: MockerFixture, app) -> None:
+    """
+    Test that the data of the results is stored apart from the payload, and that
+    loading the payload only reads the rows needed.
+    """
+    from flask_caching.backends import SimpleCache
+
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.utils.core import zlib_decompress
+    from superset.views.utils import _deserialize_results_payload
+
+    results_backend = SimpleCache()
+    mocker.patch("superset.sql_lab.results_backend", results_backend)
+    mocker.patch("superset.sqllab.result_storage.results_backend", results_backend)
+    mocker.patch("superset.sql_lab.results_backend_use_msgpack", True)
+    mocker.patch("superset.sql_lab.db")
+    mocker.patch("superset.sql_lab.uuid.uuid4", return_value="key")
+
+    query = mocker.MagicMock(select_as_cta=False, limit=5)
+    query.database.cache_timeout = 100
+    query.database.db_engine_spec = SqliteEngineSpec
+    query.to_dict.return_value = {}
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    mocker.patch(
+        "superset.sql_lab.execute_query",
+        return_value=SupersetResultSet(
+            [(i, f"value_{i}") for i in range(5)],
+            [("a", "INTEGER"), ("b", "TEXT")],
+            SqliteEngineSpec,
+        ),
+    )
+
+    execute_sql_statements(
+        query_id=1,
+        rendered_query="SELECT a, b FROM t",
+        return_results=False,
+        store_results=True,
+        start_time=None,
+        expand_data=False,
+        log_params={},
+    )
+
+    assert sorted(results_backend._cache) == ["key", "key-0", "key-1", "key-2"]
+    payload = zlib_decompress(results_backend.get("key"), decode=False)
+    get_many = mocker.spy(results_backend, "get_many")
+
+    results = _deserialize_results_payload(payload, query, True, limit=3)
+
+    get_many.assert_called_once_with("key-0", "key-1")
+    assert results["data"] == [
+        {"a": 0, "b": "value_0"},
+        {"a": 1, "b": "value_1"},
+        {"a": 2, "b": "value_2"},
+    ]
+    assert [column["column_name"] for column in results["columns"]] == ["a", "b"]
+
+
+@with_config(
+    {
+        "SQLLAB_PAYLOAD_MAX_MB": 1,
+        "SQLLAB_RESULTS_COLUMNAR_STORAGE": True,
+        "SQLLAB_RESULTS_ROW_GROUP_SIZE": 1,
+        "DISALLOWED_SQL_FUNCTIONS": {},
+        "SQLLAB_CTAS_NO_LIMIT": False,
+        "SQL_MAX_ROW": 100000,
+        "STATS_LOGGER": MagicMock(),
+    }
+)
+def test_execute_sql_statements_columnar_storage_too_large(
+    mocker: MockerFixture, app
+) -> None:
+    """
+    Test that the uncompressed size of the data is checked before it is stored.
+    """
+    from flask_caching.backends import SimpleCache
+
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    results_backend = SimpleCache()
+    mocker.patch("superset.sql_lab.results_backend", results_backend)
+    mocker.patch("superset.sqllab.result_storage.results_backend", results_backend)
+    mocker.patch("superset.sql_lab.db")
+
+    query = mocker.MagicMock(select_as_cta=False, limit=5)
+    query.database.cache_timeout = 100
+    query.database.db_engine_spec = SqliteEngineSpec
+    query.to_dict.return_value = {}
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    # the values compress to a few bytes, but take more than 1 MB uncompressed
+    mocker.patch(
+        "superset.sql_lab.execute_query",
+        return_value=SupersetResultSet(
+            [("x" * 600_000,), ("y" * 600_000,)],
+            [("a", "TEXT")],
+            SqliteEngineSpec,
+        ),
+    )
+
+    with pytest.raises(SupersetErrorException) as excinfo:
+        execute_sql_statements(
+            query_id=1,
+            rendered_query="SELECT a FROM t",
+            return_results=False,
+            store_results=True,
+            start_time=None,
+            expand_data=False,
+            log_params={},
+        )
+
+    assert excinfo.value.error.error_type == SupersetErrorType.RESULT_TOO_LARGE_ERROR
+    assert not results_backend._cache
+
+
+@with_config(
+    {
+        "SQLLAB_PAYLOAD_MAX_MB": 50,
+        "DISALLOWED_SQL_FUNCTIONS": {},
+        "SQLLAB_CTAS_NO_LIMIT": False,
+        "SQL_MAX_ROW": 100000,
+        "STATS_LOGGER": MagicMock(),
+    }
+)
+def test_execute_sql_statements_store_and_return(mocker: MockerFixture, app) -> None:
+    """
+    Test that results stored and returned are serialized once, for the results
+    backend, and returned as records.
+    """
+    from flask_caching.backends import SimpleCache
+
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    mocker.patch("superset.sql_lab.results_backend", SimpleCache())
+    mocker.patch("superset.sql_lab.results_backend_use_msgpack", True)
+    mocker.patch("superset.sql_lab.db")
+    serialize_payload = mocker.spy(sql_lab, "_serialize_payload")
+
+    query = mocker.MagicMock(select_as_cta=False, limit=5)
+    query.database.cache_timeout = 100
+    query.database.db_engine_spec = SqliteEngineSpec
+    query.to_dict.return_value = {}
+    mocker.patch("superset.sql_lab.get_query", return_value=query)
+    mocker.patch(
+        "superset.sql_lab.execute_query",
+        return_value=SupersetResultSet(
+            [(1, "a"), (2, "b")],
+            [("a", "INTEGER"), ("b", "TEXT")],
+            SqliteEngineSpec,
+        ),
+    )
+
+    payload = execute_sql_statements(
+        query_id=1,
+        rendered_query="SELECT a, b FROM t",
+        return_results=True,
+        store_results=True,
+        start_time=None,
+        expand_data=False,
+        log_params={},
+    )
+
+    serialize_payload.assert_called_once()
+    assert payload["data"] == [{"a": 1, "b": "a"}, {"a": 2, "b": "b"}]
+
+
+@with_config({"DISPLAY_MAX_ROW": 3})
+def test_partial_results_publisher(mocker: MockerFixture, app) -> None:
+    """
+    Test that the first rows of a query are stored in chunks while they are fetched,
+    and that an event is published for each chunk.
+    """
+    import msgpack
+    import pyarrow as pa
+    from flask_caching.backends import SimpleCache
+
+    from superset.db_engine_specs.sqlite import SqliteEngineSpec
+    from superset.sql_lab import PartialResultsPublisher
+    from superset.utils.compression import decompress
+
+    results_backend = SimpleCache()
+    mocker.patch("superset.sql_lab.results_backend", results_backend)
+    mocker.patch("superset.sql_lab.results_backend_use_msgpack", True)
+    async_query_manager = mocker.patch("superset.sql_lab.async_query_manager")
+    mocker.patch("superset.sql_lab.uuid.uuid4", return_value="key")
+
+    query = mocker.MagicMock(id=1, client_id="client", limit=None, rows=4)
+    query.database.db_engine_spec = SqliteEngineSpec
+    query.to_dict.return_value = {}
+    cursor = mocker.MagicMock(description=[("a", "INTEGER")])
+    job_metadata = {"channel_id": "channel", "job_id": "job"}
+
+    publisher = PartialResultsPublisher(query, job_metadata, 100)
+    publisher.publish(pa.table({"a": [1, 2]}), cursor)
+    publisher.publish(pa.table({"a": [3, 4]}), cursor)
+    publisher.publish(pa.table({"a": [5]}), cursor)
+    publisher.done()
+
+    assert sorted(results_backend._cache) == ["key-partial-0", "key-partial-1"]
+    payload = msgpack.loads(decompress(results_backend.get("key-partial-1"), False))
+    assert payload["status"] == QueryStatus.RUNNING
+    assert pa.ipc.open_stream(payload["data"]).read_all() == pa.table({"a": [3]})
+    assert async_query_manager.update_job.call_args_list == [
+        mocker.call(
+            job_metadata,
+            "running",
+            client_id="client",
+            results_key="key",
+            result_url="/api/v1/sqllab/results/?q=(chunk:0,key:key)",
+            chunk=0,
+            rows=2,
+        ),
+        mocker.call(
+            job_metadata,
+            "running",
+            client_id="client",
+            results_key="key",
+            result_url="/api/v1/sqllab/results/?q=(chunk:1,key:key)",
+            chunk=1,
+            rows=3,
+        ),
+        mocker.call(
+            job_metadata,
+            "done",
+            client_id="client",
+            results_key="key",
+            result_url="/api/v1/sqllab/results/?q=(key:key)",
+            rows=4,
+        ),
+    ]
+
+
 @freeze_time("2021-04-01T00:00:00Z")
 def test_get_sql_results_oauth2(mocker: MockerFixture, app) -> None:
     """
@@ -0,0 +1,66 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.common.db_query_status import QueryStatus
+from superset.errors import SupersetErrorType
+from superset.exceptions import SupersetErrorException
+from superset.sqllab.command_status import SqlJsonExecutionStatus
+from superset.sqllab.execution_context_convertor import ExecutionContextConvertor
+from superset.utils import json
+from tests.conftest import with_config
+
+PAYLOAD = {
+    "status": "success",
+    "data": [{"a": "x" * 1024} for _ in range(1024)],
+    "query": {"rows": 1024},
+}
+
+
+def make_convertor(execution_context: MagicMock) -> ExecutionContextConvertor:
+    execution_context.get_execution_result.return_value = PAYLOAD
+    convertor = ExecutionContextConvertor()
+    convertor.set_max_row_in_display(10000)
+    convertor.set_payload(execution_context, SqlJsonExecutionStatus.HAS_RESULTS)
+    return convertor
+
+
+@with_config({"SQLLAB_PAYLOAD_MAX_MB": 2})
+def test_serialize_payload(app) -> None:
+    convertor = make_convertor(MagicMock())
+    assert json.loads(convertor.serialize_payload()) == PAYLOAD
+
+
+@with_config({"SQLLAB_PAYLOAD_MAX_MB": 1})
+def test_serialize_payload_too_large(mocker: MockerFixture, app) -> None:
+    """
+    Test that the size of the results is checked on the serialized response, and
+    that the query fails when they're too large.
+    """
+    mocker.patch("superset.sql_lab.db")
+    execution_context = MagicMock()
+    execution_context.query.status = QueryStatus.SUCCESS
+
+    with pytest.raises(SupersetErrorException) as excinfo:
+        make_convertor(execution_context).serialize_payload()
+
+    assert excinfo.value.error.error_type == SupersetErrorType.RESULT_TOO_LARGE_ERROR
+    assert execution_context.query.status == QueryStatus.FAILED
+    assert "exceeds the allowed limit of 1 MB" in execution_context.query.error_message
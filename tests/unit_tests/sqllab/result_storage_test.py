@@ -0,0 +1,120 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pyarrow as pa
+import pytest
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.exceptions import SerializationError
+from superset.sqllab.result_storage import (
+    get_result_storage,
+    read_result_table,
+    write_result_table,
+)
+
+TABLE = pa.table({"a": list(range(25)), "b": [f"value_{i}" for i in range(25)]})
+
+
+@pytest.fixture
+def results_backend(mocker: MockerFixture) -> SimpleCache:
+    backend = SimpleCache()
+    mocker.patch("superset.sqllab.result_storage.results_backend", backend)
+    return backend
+
+
+def test_write_result_table(results_backend: SimpleCache) -> None:
+    """
+    Test that the result table is stored in row groups.
+    """
+    storage = write_result_table("key", TABLE, row_group_size=10)
+
+    assert storage["format"] == "arrow"
+    assert storage["num_rows"] == 25
+    assert storage["row_group_keys"] == ["key-0", "key-1", "key-2"]
+    assert storage["size"] == sum(
+        len(results_backend.get(key)) for key in storage["row_group_keys"]
+    )
+    assert get_result_storage({"data": None, "storage": storage}) == storage
+    assert get_result_storage({"data": b""}) is None
+
+    assert read_result_table(storage) == TABLE
+
+
+@pytest.mark.parametrize(
+    "offset, limit, columns, row_group_keys",
+    [
+        (0, None, None, ["key-0", "key-1", "key-2"]),
+        (0, 5, None, ["key-0"]),
+        (5, 10, None, ["key-0", "key-1"]),
+        (20, 100, None, ["key-2"]),
+        (25, None, None, ["key-2"]),
+        (12, 3, ["b"], ["key-1"]),
+    ],
+)
+def test_read_result_table(
+    mocker: MockerFixture,
+    results_backend: SimpleCache,
+    offset: int,
+    limit: int | None,
+    columns: list[str] | None,
+    row_group_keys: list[str],
+) -> None:
+    """
+    Test that only the row groups overlapping the requested rows are read.
+    """
+    storage = write_result_table("key", TABLE, row_group_size=10)
+    get_many = mocker.spy(results_backend, "get_many")
+
+    table = read_result_table(storage, offset, limit, columns)
+
+    get_many.assert_called_once_with(*row_group_keys)
+    expected = TABLE.slice(offset, limit)
+    if columns is not None:
+        expected = expected.select(columns)
+    assert table == expected
+
+
+def test_read_result_table_empty(results_backend: SimpleCache) -> None:
+    """
+    Test that the schema of an empty result is kept.
+    """
+    storage = write_result_table("key", TABLE.slice(0, 0), row_group_size=10)
+
+    assert storage["row_group_keys"] == ["key-0"]
+    assert read_result_table(storage, limit=10) == TABLE.slice(0, 0)
+
+
+def test_read_result_table_expired(results_backend: SimpleCache) -> None:
+    """
+    Test that nothing is returned when a row group expired.
+    """
+    storage = write_result_table("key", TABLE, row_group_size=10)
+    results_backend.delete("key-1")
+
+    assert read_result_table(storage, limit=5) is not None
+    assert read_result_table(storage) is None
+
+
+def test_read_result_table_invalid(results_backend: SimpleCache) -> None:
+    """
+    Test that an invalid row group raises a serialization error.
+    """
+    storage = write_result_table("key", TABLE, row_group_size=10)
+    results_backend.set("key-0", b"invalid")
+
+    with pytest.raises(SerializationError):
+        read_result_table(storage)
@@ -0,0 +1,44 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest import mock
+
+from flask import g
+
+
+@mock.patch("superset.tasks.cache.security_manager", new_callable=mock.MagicMock)
+@mock.patch("superset.commands.chart.warm_up_cache.ChartWarmUpCacheCommand")
+def test_refresh_chart_data_cache(mock_command_cls, mock_security_manager):
+    """Test that the chart is warmed up with the query context, as the user"""
+    from superset.tasks.cache import refresh_chart_data_cache
+
+    mock_user = mock.MagicMock()
+    mock_security_manager.get_user_by_id.return_value = mock_user
+    query_context = {"queries": [{"columns": ["name"]}], "form_data": {"slice_id": 1}}
+
+    def run():
+        assert g.user is mock_user
+        return {"chart_id": 1, "viz_error": None, "viz_status": "success"}
+
+    mock_command_cls.return_value.run.side_effect = run
+
+    assert refresh_chart_data_cache(1, query_context, 2) == {
+        "chart_id": 1,
+        "viz_error": None,
+        "viz_status": "success",
+    }
+    mock_security_manager.get_user_by_id.assert_called_once_with(2)
+    mock_command_cls.assert_called_once_with(1, None, None, query_context)
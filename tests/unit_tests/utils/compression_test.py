@@ -0,0 +1,60 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import zlib
+
+import pytest
+
+from superset.utils.compression import compress, decompress, MAGIC
+from superset.utils.core import zlib_compress
+
+DATA = b'{"id": 1, "name": "value"}' * 1000
+
+
+@pytest.mark.parametrize(
+    "codec, options",
+    [
+        ("zlib", {}),
+        ("zlib", {"level": 9}),
+        ("zstd", {}),
+        ("zstd", {"level": 19, "threads": -1}),
+        ("lz4", {}),
+        ("lz4", {"level": 9}),
+    ],
+)
+def test_compress_decompress(codec: str, options: dict[str, int]) -> None:
+    blob = compress(DATA, codec, **options)
+
+    assert len(blob) < len(DATA)
+    assert decompress(blob, decode=False) == DATA
+    assert decompress(blob) == DATA.decode()
+
+
+def test_compress_zlib_without_header() -> None:
+    """
+    Test that zlib blobs are plain zlib streams, and that those are still read.
+    """
+    assert zlib.decompress(compress(DATA)) == DATA
+    assert decompress(zlib_compress(DATA), decode=False) == DATA
+    assert compress(DATA, "zstd").startswith(MAGIC + b"\x04zstd")
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(ValueError, match="Unknown compression codec: brotli"):
+        compress(DATA, "brotli")
+
+    with pytest.raises(ValueError, match="Unknown compression codec: brotli"):
+        decompress(MAGIC + b"\x06brotli" + DATA)
@@ -0,0 +1,111 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+import time
+
+import pytest
+from flask import g
+
+from superset.utils.concurrency import KeyedSemaphore, map_in_app_context
+
+
+def test_map_in_app_context_sequential() -> None:
+    """
+    Test that calls run in the current thread when parallelism is disabled.
+    """
+    thread_ids = map_in_app_context(
+        lambda _: threading.get_ident(),
+        range(3),
+        max_workers=1,
+    )
+    assert thread_ids == [threading.get_ident()] * 3
+
+
+def test_map_in_app_context_parallel() -> None:
+    """
+    Test that calls run concurrently, preserve order and see a copy of `g`.
+    """
+    g.user = "admin"
+    barrier = threading.Barrier(3, timeout=5)
+
+    def func(item: int) -> tuple[int, str]:
+        barrier.wait()
+        return item * 2, g.user
+
+    assert map_in_app_context(func, [1, 2, 3], max_workers=3) == [
+        (2, "admin"),
+        (4, "admin"),
+        (6, "admin"),
+    ]
+
+
+def test_map_in_app_context_raises() -> None:
+    """
+    Test that exceptions raised in worker threads are propagated.
+    """
+
+    def func(item: int) -> int:
+        if item == 2:
+            raise ValueError("boom")
+        return item
+
+    with pytest.raises(ValueError, match="boom"):
+        map_in_app_context(func, [1, 2, 3], max_workers=3)
+
+
+def test_map_in_app_context_raises_in_order() -> None:
+    """
+    Test that the exception of the first failing item is raised, even when a later
+    item fails first.
+    """
+
+    def func(item: int) -> int:
+        if item == 2:
+            time.sleep(0.05)
+        if item > 1:
+            raise ValueError(f"boom {item}")
+        return item
+
+    with pytest.raises(ValueError, match="boom 2"):
+        map_in_app_context(func, [1, 2, 3], max_workers=3)
+
+
+def test_keyed_semaphore() -> None:
+    """
+    Test that the semaphore caps the number of concurrent holders per key.
+    """
+    semaphores = KeyedSemaphore()
+    lock = threading.Lock()
+    active = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+
+    def work(key: str) -> None:
+        with semaphores.acquire(key, 2):
+            with lock:
+                active[key] += 1
+                peak[key] = max(peak[key], active[key])
+            time.sleep(0.02)
+            with lock:
+                active[key] -= 1
+
+    threads = [threading.Thread(target=work, args=(key,)) for key in "aaaaabbb"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak == {"a": 2, "b": 2}
@@ -16,6 +16,9 @@
 # under the License.
 
 
+import codecs
+import gzip
+
 import pandas as pd
 import pyarrow as pa
 import pytest  # noqa: F401
@@ -263,3 +266,81 @@ def test_get_chart_dataframe_with_hierarchical_columns(monkeypatch: pytest.Monke
 | ('idx',) |                 2 |
 """
     assert markdown_str.strip() == expected_markdown_str.strip()
+
+
+def test_df_to_escaped_csv_mixed_types():
+    """
+    Test that the vectorized escaping matches escaping values one by one.
+    """
+    df = pd.DataFrame(
+        {
+            "=header": ["=a", "b", None, "-1.5", "|c", "  +d", '""@e', "-f"],
+            "mixed": [1, "=x", 2.5, None, b"=bytes", "y", ["=list"], "@z"],
+            "numbers": [1, -2, 3, 4, 5, 6, 7, 8],
+            "ints": pd.Series([1, None, 3, 4, 5, 6, 7, 8], dtype=object),
+        },
+    )
+    df.index = [10, 11, 12, 13, 14, 15, 16, 17]
+
+    expected = df.rename(columns=csv.escape_value)
+    for name in ("=header", "mixed", "ints"):
+        expected[f"'{name}" if name.startswith("=") else name] = pd.Series(
+            [csv.escape_value(v) if isinstance(v, str) else v for v in df[name]],
+            index=df.index,
+            dtype=object,
+        )
+
+    assert df_to_escaped_csv(df, index=True) == expected.to_csv(escapechar="\\")
+
+
+def test_df_to_escaped_csv_bytes():
+    """
+    Test that columns holding only bytes are left untouched.
+    """
+    df = pd.DataFrame(
+        {
+            "bytes": [b"=a", b"b", None],
+            "text": ["=a", "b", None],
+        },
+        index=[0, 0, 1],
+    )
+
+    assert df_to_escaped_csv(df, index=False) == "bytes,text\nb'=a','=a\nb'b',b\n,\n"
+
+
+def test_df_to_escaped_csv_chunks():
+    df = pd.DataFrame(
+        {
+            "value": ["=a", "b", "-10", "@c", "d"] * 5,
+            "number": range(25),
+        }
+    )
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, chunk_size=10, index=False))
+
+    assert len(chunks) == 3
+    assert chunks[0].startswith("value,number\n")
+    assert not chunks[1].startswith("value")
+    assert "".join(chunks) == df_to_escaped_csv(df, index=False)
+
+
+def test_df_to_escaped_csv_chunks_empty():
+    df = pd.DataFrame({"=value": []})
+    assert list(csv.df_to_escaped_csv_chunks(df, index=False)) == ["'=value\n"]
+
+
+def test_encode_csv_chunks():
+    chunks = ["a,b\n", "1,é\n", "", "2,ü\n"]
+
+    encoded = list(csv.encode_csv_chunks(chunks, encoding="utf-8-sig"))
+
+    assert b"".join(encoded) == "a,b\n1,é\n2,ü\n".encode("utf-8-sig")
+    assert b"".join(encoded).count(codecs.BOM_UTF8) == 1
+
+
+def test_encode_csv_chunks_gzip():
+    chunks = [f"{i},value\n" for i in range(1000)]
+
+    encoded = b"".join(csv.encode_csv_chunks(chunks, compress=True))
+
+    assert gzip.decompress(encoded) == "".join(chunks).encode("utf-8")
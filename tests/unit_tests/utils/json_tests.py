@@ -270,3 +270,82 @@ def test_format_timedelta():
         json.format_timedelta(timedelta(0) - timedelta(days=16, hours=4, minutes=3))
         == "-16 days, 4:03:00"
     )
+
+
+def test_dumps_dataframe() -> None:
+    """
+    Test that the records of a DataFrame are dumped like its `to_dict` records.
+    """
+    df = pd.DataFrame(
+        {
+            "int": [1, -(2**40), 3],
+            "float": [0.1, np.nan, np.inf],
+            "bool": [True, False, True],
+            "dttm": pd.to_datetime(
+                ["2020-01-01 10:00:00.123456", None, "1960-06-01 00:00:00.000000"]
+            ),
+            "dttm_tz": pd.date_range(
+                "2020-03-08", periods=3, freq="h", tz="US/Eastern"
+            ),
+            "str": ["a", 'é "quoted" ☃', None],
+            "obj": [Decimal("1.5"), {"a": [1, 2]}, date(2020, 1, 1)],
+            "category": pd.Categorical(["x", "y", "x"]),
+        }
+    )
+    expected = json.dumps(
+        df.to_dict(orient="records"),
+        default=json.json_int_dttm_ser,
+        ignore_nan=True,
+    )
+    assert json.dumps_dataframe(df) == expected
+    assert json.dumps_dataframe(df.iloc[:0]) == "[]"
+
+    # columns that can't be encoded by name fall back to the records
+    df = pd.DataFrame([[1, 2]], columns=[0, "a"])
+    assert json.loads(json.dumps_dataframe(df)) == [{"0": 1, "a": 2}]
+
+
+def test_dumps_dataframe_nullable() -> None:
+    """
+    Test that the missing values of nullable extension dtypes are dumped as null.
+    """
+    df = pd.DataFrame(
+        {
+            "int": pd.array([1, None], dtype="Int64"),
+            "bool": pd.array([True, None], dtype="boolean"),
+            "str": pd.array(["a", None], dtype="string"),
+        }
+    )
+    assert json.loads(json.dumps_dataframe(df)) == [
+        {"int": 1, "bool": True, "str": "a"},
+        {"int": None, "bool": None, "str": None},
+    ]
+    assert json.loads(json.dumps_dataframe(df, orient="columns")) == {
+        "int": [1, None],
+        "bool": [True, None],
+        "str": ["a", None],
+    }
+
+
+def test_dumps_dataframe_columns() -> None:
+    """
+    Test the column oriented dump of a DataFrame.
+    """
+    df = pd.DataFrame(
+        {
+            "dttm": pd.to_datetime(["2020-01-01", None]),
+            "value": [1.5, np.nan],
+            "name": ["a", "b"],
+        }
+    )
+    assert json.loads(json.dumps_dataframe(df, orient="columns")) == {
+        "dttm": [1577836800000.0, None],
+        "value": [1.5, None],
+        "name": ["a", "b"],
+    }
+    assert json.dumps_dataframe(df.iloc[:0], orient="columns") == (
+        '{"dttm": [], "value": [], "name": []}'
+    )
+
+    with pytest.raises(ValueError, match="Unsupported orientation"):
+        json.dumps_dataframe(df, orient="index")
@@ -0,0 +1,162 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import msgpack
+import pytest
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockerFixture
+
+from superset.db_engine_specs.sqlite import SqliteEngineSpec
+from superset.exceptions import SupersetErrorException
+from superset.result_set import SupersetResultSet
+from superset.sqllab.result_storage import write_result_table
+from superset.sqllab.utils import write_ipc_buffer
+from superset.utils import json
+from superset.views.utils import _deserialize_results_payload
+
+RESULT_SET = SupersetResultSet(
+    [(i, f"value_{i}") for i in range(25)],
+    [("a", "INTEGER"), ("b", "TEXT")],
+    SqliteEngineSpec,
+)
+
+
+def make_payload(data: Any) -> dict[str, Any]:
+    return {
+        "status": "success",
+        "data": data,
+        "columns": RESULT_SET.columns,
+        "selected_columns": RESULT_SET.columns,
+        "expanded_columns": [],
+        "query": {"rows": 25},
+    }
+
+
+@pytest.fixture
+def query(mocker: MockerFixture) -> Any:
+    query = mocker.MagicMock()
+    query.database.db_engine_spec = SqliteEngineSpec
+    return query
+
+
+@pytest.fixture
+def results_backend(mocker: MockerFixture) -> SimpleCache:
+    backend = SimpleCache()
+    mocker.patch("superset.sqllab.result_storage.results_backend", backend)
+    return backend
+
+
+def test_deserialize_results_payload_columnar(
+    mocker: MockerFixture,
+    query: Any,
+    results_backend: SimpleCache,
+) -> None:
+    """
+    Test loading a page of results stored in row groups.
+    """
+    payload = make_payload(None)
+    payload["storage"] = write_result_table("key", RESULT_SET.pa_table, 10)
+    get_many = mocker.spy(results_backend, "get_many")
+
+    results = _deserialize_results_payload(
+        msgpack.dumps(payload),
+        query,
+        True,
+        offset=18,
+        limit=4,
+        columns=["b"],
+    )
+
+    get_many.assert_called_once_with("key-1", "key-2")
+    assert results["data"] == [{"b": f"value_{i}"} for i in range(18, 22)]
+    assert [column["name"] for column in results["columns"]] == ["b"]
+
+
+def test_deserialize_results_payload_columnar_expired(
+    query: Any,
+    results_backend: SimpleCache,
+) -> None:
+    """
+    Test that expired row groups are reported as gone.
+    """
+    payload = make_payload(None)
+    payload["storage"] = write_result_table("key", RESULT_SET.pa_table, 10)
+    results_backend.clear()
+
+    with pytest.raises(SupersetErrorException) as excinfo:
+        _deserialize_results_payload(msgpack.dumps(payload), query, True)
+
+    assert excinfo.value.status == 410
+
+
+def test_deserialize_results_payload_msgpack(query: Any) -> None:
+    """
+    Test loading a page of results serialized as a single Arrow table.
+    """
+    payload = make_payload(write_ipc_buffer(RESULT_SET.pa_table).to_pybytes())
+
+    results = _deserialize_results_payload(
+        msgpack.dumps(payload),
+        query,
+        True,
+        offset=23,
+        limit=10,
+        columns=["b", "a"],
+    )
+
+    assert results["data"] == [
+        {"b": "value_23", "a": 23},
+        {"b": "value_24", "a": 24},
+    ]
+    assert [column["name"] for column in results["columns"]] == ["b", "a"]
+
+
+def test_deserialize_results_payload_json(query: Any) -> None:
+    """
+    Test loading a page of results serialized as JSON.
+    """
+    payload = make_payload([{"a": i, "b": f"value_{i}"} for i in range(25)])
+
+    results = _deserialize_results_payload(
+        json.dumps(payload),
+        query,
+        False,
+        offset=5,
+        limit=2,
+        columns=["a"],
+    )
+
+    assert results["data"] == [{"a": 5}, {"a": 6}]
+    assert [column["name"] for column in results["columns"]] == ["a"]
+
+
+def test_deserialize_results_payload_missing_columns(query: Any) -> None:
+    """
+    Test that requesting unknown columns is a client error.
+    """
+    payload = make_payload([])
+
+    with pytest.raises(SupersetErrorException) as excinfo:
+        _deserialize_results_payload(
+            json.dumps(payload),
+            query,
+            False,
+            columns=["a", "c"],
+        )
+
+    assert excinfo.value.status == 400